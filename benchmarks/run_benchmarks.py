@@ -0,0 +1,305 @@
+"""
+PyPong benchmark suite.
+
+Measures physics step throughput, the render cost of each screen and end-to-end frame time of `Game` at
+several render resolutions and with each render backend, using SDL's dummy video driver so no window is needed. Results are written as JSON,
+and can be compared against a previous run to catch regressions:
+
+    python benchmarks/run_benchmarks.py --output results.json
+    python benchmarks/run_benchmarks.py --output new.json --compare results.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pygame
+from pypong.config import GameState, settings
+from pypong.game import Game, PaddleAction, Simulation, SimulationInputs
+from pypong.game.display import render_dimensions
+from pypong.game.objects import Ball, Paddle
+from pypong.game.timestep import FixedTimestep
+
+# Render scales benchmarked: 640x480, 800x600, 1280x960 and 1920x1440 at the default 800x600 logical size
+RENDER_SCALES = [0.8, 1.0, 1.6, 2.4]
+
+
+def time_per_call(func, iterations, repeats):
+    """
+    Time repeated calls of a function.
+
+    Args:
+        func (callable): Function to call with no arguments
+        iterations (int): Calls per repeat
+        repeats (int): Number of repeats
+
+    Returns:
+        dict: Median and minimum time per call (microseconds) across repeats, and calls per second
+    """
+    per_call = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        per_call.append((time.perf_counter() - start) / iterations)
+
+    median = statistics.median(per_call)
+    return {
+        "median_us": median * 1e6,
+        "min_us": min(per_call) * 1e6,
+        "per_second": 1 / median if median > 0 else float("inf"),
+    }
+
+
+def playing_simulation(swept_collisions):
+    """Return a seeded simulation that keeps playing, continuing automatically after each point."""
+    sim = Simulation(seed=0, swept_collisions=swept_collisions)
+    inputs = [SimulationInputs(left=PaddleAction.UP, right=PaddleAction.DOWN), SimulationInputs(),
+              SimulationInputs(left=PaddleAction.DOWN, right=PaddleAction.UP), SimulationInputs()]
+    state = {"tick": 0}
+
+    def step():
+        if sim.current_state != GameState.PLAYING:
+            sim.apply_inputs(SimulationInputs(advance=True))
+        sim.step(inputs[state["tick"] % len(inputs)])
+        state["tick"] += 1
+
+    return step
+
+
+def bench_physics(iterations, repeats):
+    """Benchmark ball, paddle and full simulation steps."""
+    results = {}
+    l_paddle = Paddle(left=True)
+    r_paddle = Paddle(left=False)
+
+    ball = Ball()
+    def ball_discrete():
+        ball.move()
+        ball.check_sides_hit()
+        ball.check_paddle_hit(l_paddle if ball.h_speed < 0 else r_paddle)
+        if ball.check_ends_hit():
+            ball.rect.x = 400
+    results["physics.ball_discrete_step"] = time_per_call(ball_discrete, iterations, repeats)
+
+    ball = Ball()
+    def ball_swept():
+        ball.sweep(l_paddle, r_paddle)
+        if ball.check_ends_hit():
+            ball.rect.x = 400
+    results["physics.ball_swept_step"] = time_per_call(ball_swept, iterations, repeats)
+
+    paddle = Paddle(left=True)
+    def paddle_step():
+        if paddle.v_speed == 0:
+            paddle.v_speed = 4 if paddle.rect.top > 0 else -4
+        paddle.move()
+    results["physics.paddle_step"] = time_per_call(paddle_step, iterations, repeats)
+
+    results["physics.simulation_step_discrete"] = time_per_call(playing_simulation(False), iterations, repeats)
+    results["physics.simulation_step_swept"] = time_per_call(playing_simulation(True), iterations, repeats)
+    return results
+
+
+def bench_screens(iterations, repeats):
+    """Benchmark each screen's render() at the default resolution, with and without cached content."""
+    results = {}
+    game = Game()
+    screen = game.display
+    sim = game.simulation
+    sim.apply_inputs(SimulationInputs(advance=True))
+    scores = (7, 5)
+
+    results["render.start_screen"] = time_per_call(
+        lambda: game.start_screen.render(screen, game.key_bindings), iterations, repeats)
+    results["render.between_points_screen"] = time_per_call(
+        lambda: game.between_points_screen.render(screen, scores), iterations, repeats)
+    results["render.game_over_screen"] = time_per_call(
+        lambda: game.game_over_screen.render(screen, "Player 1", scores), iterations, repeats)
+
+    def uncached(static_screen, *args):
+        def render():
+            static_screen.cache.invalidate()
+            static_screen.render(screen, *args)
+        return render
+
+    results["render.start_screen_uncached"] = time_per_call(
+        uncached(game.start_screen, game.key_bindings), iterations, repeats)
+    results["render.between_points_screen_uncached"] = time_per_call(
+        uncached(game.between_points_screen, scores), iterations, repeats)
+    results["render.game_over_screen_uncached"] = time_per_call(
+        uncached(game.game_over_screen, "Player 1", scores), iterations, repeats)
+
+    step = playing_simulation(True)
+    def playing_full():
+        step()
+        game.playing_screen.render(screen, sim.ball, sim.l_paddle, sim.r_paddle)
+    results["render.playing_screen"] = time_per_call(playing_full, iterations, repeats)
+
+    game.playing_screen.invalidate()
+    def playing_dirty():
+        step()
+        game.playing_screen.render_dirty(screen, sim.ball, sim.l_paddle, sim.r_paddle)
+    results["render.playing_screen_dirty"] = time_per_call(playing_dirty, iterations, repeats)
+    return results
+
+
+def bench_frames(iterations, repeats, render_scales):
+    """
+    Benchmark end-to-end Game.run_frame() while playing, without frame rate limiting.
+
+    The window size only changes how frames are scaled for presentation, so the pixels drawn per frame are
+    varied with the render scale instead, with the window matching the render size (presented unscaled).
+    Each render resolution is measured with dirty-rect rendering and with full-screen redraws.
+    """
+    results = {}
+    defaults = settings.screen.SCREEN_DIMENSIONS, settings.screen.RENDER_SCALE
+    try:
+        for render_scale, dirty_rects in [(scale, dirty) for scale in render_scales for dirty in (True, False)]:
+            width, height = render_dimensions(settings.screen.LOGICAL_DIMENSIONS, render_scale)
+            settings.screen.SCREEN_DIMENSIONS, settings.screen.RENDER_SCALE = (width, height), render_scale
+            game = Game()
+            game.dirty_rects = dirty_rects
+            mode = "dirty" if dirty_rects else "full"
+            results[f"frame.render_{width}x{height}_{mode}"] = time_game_frames(game, iterations, repeats)
+    finally:
+        settings.screen.SCREEN_DIMENSIONS, settings.screen.RENDER_SCALE = defaults
+    return results
+
+
+def bench_backends(iterations, repeats):
+    """
+    Benchmark end-to-end Game.run_frame() while playing with each render backend at the default resolution:
+    software surface blits, and the SDL texture renderer with each render driver available on this machine.
+    """
+    results = {}
+    backends = [("surface", None)]
+    try:
+        from pypong.game.sdl2_backend import renderer_drivers
+        backends.extend(("texture", driver) for driver in renderer_drivers())
+    except ImportError:
+        pass
+
+    default_backend = settings.screen.RENDER_BACKEND, settings.screen.RENDER_DRIVER
+    try:
+        for backend, driver in backends:
+            settings.screen.RENDER_BACKEND, settings.screen.RENDER_DRIVER = backend, driver
+            try:
+                game = Game()
+            except pygame.error as e:
+                # Drivers can be listed but unusable (e.g. OpenGL without a GPU)
+                print(f"Skipping {backend} backend ({driver}): {e}")
+                continue
+            name = backend if driver is None else f"{backend}_{driver}"
+            results[f"frame.backend_{name}"] = time_game_frames(game, iterations, repeats)
+            if backend == "texture":
+                # Close the renderer's window before the next backend opens its own
+                game.display.window.destroy()
+    finally:
+        settings.screen.RENDER_BACKEND, settings.screen.RENDER_DRIVER = default_backend
+    return results
+
+
+def time_game_frames(game, iterations, repeats):
+    """Time a game's run_frame() while playing, advancing exactly one physics tick per frame (no frame limit)."""
+    game.fps = 0
+
+    # Advance exactly one physics tick per frame, independent of wall time
+    clock = {"now": 0.0}
+    def fake_time():
+        clock["now"] += game.timestep.dt
+        return clock["now"]
+    game.timestep = FixedTimestep(game.timestep.tick_rate, time_source=fake_time)
+
+    def frame():
+        if game.current_state != GameState.PLAYING:
+            game.simulation.apply_inputs(SimulationInputs(advance=True))
+        game.run_frame()
+
+    return time_per_call(frame, iterations, repeats)
+
+
+def compare(results, baseline, threshold):
+    """
+    Print the change in median time per call against a baseline run.
+
+    Args:
+        results (dict): Results of this run
+        baseline (dict): Results of the baseline run
+        threshold (float): Fractional slowdown reported as a regression
+
+    Returns:
+        list: Names of benchmarks that regressed
+    """
+    regressions = []
+    print(f"\n{'benchmark':<45}{'baseline us':>14}{'current us':>14}{'change':>10}")
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        old = baseline[name]["median_us"]
+        new = result["median_us"]
+        change = (new - old) / old if old > 0 else 0.0
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<45}{old:>14.2f}{new:>14.2f}{change:>+10.1%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the PyPong benchmark suite.")
+    parser.add_argument("--output", "-o", help="Write results to this JSON file")
+    parser.add_argument("--compare", "-c", help="Compare against results from a previous JSON file")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Fractional slowdown reported as a regression (default 0.10)")
+    parser.add_argument("--quick", action="store_true", help="Fewer iterations, for a fast smoke run")
+    args = parser.parse_args()
+
+    physics_iterations, render_iterations, frame_iterations, repeats = (
+        (2000, 50, 50, 3) if args.quick else (20000, 500, 300, 7))
+
+    results = {}
+    results.update(bench_physics(physics_iterations, repeats))
+    results.update(bench_screens(render_iterations, repeats))
+    results.update(bench_frames(frame_iterations, repeats, RENDER_SCALES))
+    results.update(bench_backends(frame_iterations, repeats))
+    pygame.quit()
+
+    for name, result in results.items():
+        print(f"{name:<45}{result['median_us']:>12.2f} us{result['per_second']:>14.0f} /s")
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "sdl": ".".join(str(v) for v in pygame.get_sdl_version()),
+            "platform": platform.platform(),
+            "video_driver": os.environ["SDL_VIDEODRIVER"],
+            "quick": args.quick,
+        },
+        "results": results,
+    }
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, "r") as f:
+            baseline = json.load(f)["results"]
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,11 +2,85 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+import argparse
+from pypong.config import settings
 from pypong.game import Game
+from pypong.game.recording import MatchRecording, MatchReplay
+
+def parse_address(address: str, default_host: str):
+    """Parse '[HOST:]PORT' into a (host, port) tuple."""
+    host, _, port = address.rpartition(":")
+    return host or default_host, int(port)
 
 def main():
-    game = Game()
-    game.run()
+    parser = argparse.ArgumentParser(description="Play PyPong, replay a recorded match, or host or join a networked match.")
+    parser.add_argument("--replay", metavar="PATH", help="Replay a match recording")
+    parser.add_argument("--speed", type=float, default=1.0, help="Replay speed multiplier (default 1)")
+    parser.add_argument("--headless", action="store_true",
+                        help="Re-simulate the replay without a window, as fast as possible, and print the result")
+    parser.add_argument("--export", metavar="PATH",
+                        help="Render every frame of the replay headlessly to PATH (a .npy file, or a PNG directory)")
+    parser.add_argument("--workers", type=int, metavar="N", help="Worker processes for --export (default: CPU count)")
+    parser.add_argument("--serve", metavar="[HOST:]PORT", help="Host a networked two-player match")
+    parser.add_argument("--host", metavar="[HOST:]PORT",
+                        help="Host many networked matches in one process, pairing players as they join")
+    parser.add_argument("--connect", metavar="HOST:PORT", help="Join a networked match")
+    parser.add_argument("--computer", metavar="DIFFICULTY", nargs="?", const="medium",
+                        choices=["easy", "medium", "hard", "expert"],
+                        help="Play against the computer (as Player 2) at a difficulty (default medium)")
+    parser.add_argument("--balls", type=int, metavar="N", help="Play multiball, with N balls in play at once")
+    parser.add_argument("--threaded", action="store_true",
+                        help="Run the simulation on its own thread, apart from events and rendering")
+    args = parser.parse_args()
+    if args.threaded:
+        settings.physics.THREADED = True
+    game_class = Game
+    if settings.physics.THREADED:
+        from pypong.game.threaded import ThreadedGame
+        game_class = ThreadedGame
+
+    if args.serve is not None:
+        from pypong.game.network import GameServer
+        GameServer(*parse_address(args.serve, "0.0.0.0")).serve_forever()
+    elif args.host is not None:
+        import asyncio
+        import logging
+        from pypong.game.network import MatchHost
+        logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+        async def host_matches():
+            host = MatchHost()
+            await host.serve_udp(*parse_address(args.host, "0.0.0.0"))
+            await host.run()
+
+        try:
+            asyncio.run(host_matches())
+        except KeyboardInterrupt:
+            pass
+    elif args.connect is not None:
+        from pypong.game.network import NetworkClient, NetworkGame
+        client = NetworkClient(parse_address(args.connect, "127.0.0.1"))
+        client.connect()
+        NetworkGame(client).run()
+    elif args.replay is None:
+        if args.computer is not None:
+            settings.game.COMPUTER_PLAYER = "right"
+            settings.game.COMPUTER_DIFFICULTY = args.computer
+        if args.balls is not None:
+            settings.game.BALL_COUNT = args.balls
+        game = game_class()
+        game.run()
+    elif args.export is not None:
+        from pypong.game.export import FrameExporter
+        frames = FrameExporter(MatchRecording.load(args.replay), max_workers=args.workers).export(args.export)
+        print(f"Exported {frames} frames to {args.export}")
+    elif args.headless:
+        state = MatchReplay(MatchRecording.load(args.replay)).run()
+        print(f"Replayed {state.tick} ticks - Player 1 {state.score_p1} - {state.score_p2} Player 2"
+              + (f" ({state.winner} wins)" if state.winner else ""))
+    else:
+        game = game_class(replay=MatchRecording.load(args.replay), replay_speed=args.speed)
+        game.run()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -14,13 +14,32 @@ class GameState(Enum):
 class Settings:
     class ScreenSettings:
         def __init__(self):
-            self.SCREEN_DIMENSIONS: Tuple[int, int] = (800, 600)
+            self.SCREEN_DIMENSIONS: Tuple[int, int] = (800, 600) # Window size
+            self.LOGICAL_DIMENSIONS: Tuple[int, int] = (800, 600) # Playing field and layout size, in game units
+            self.RENDER_SCALE: float = 1.0 # Render resolution relative to LOGICAL_DIMENSIONS (scaled to the window)
+            self.RENDER_BACKEND: str = "surface" # "surface" (software blits) or "texture" (SDL renderer)
+            self.RENDER_DRIVER: Optional[str] = None # SDL render driver for the texture backend (None = SDL's choice)
             self.FPS: int = 60
+            self.FRAME_PACING: str = "sleep" # "sleep", "busy", "hybrid" (sleep then spin) or "vsync"
+            self.DIRTY_RECTS: bool = True # Only redraw/update areas of the playing screen that change
+            self.IDLE_FPS: int = 5 # Redraw rate while waiting for input on static screens (0 = only on input)
+
+    class PhysicsSettings:
+        def __init__(self):
+            """Fixed-timestep physics configuration, independent of the render frame rate."""
+            self.TICK_RATE: int = 60
+            self.MAX_FRAME_TIME: float = 0.25 # Longest frame (seconds) physics will catch up on
+            self.SWEPT_COLLISIONS: bool = True # Continuous ball collision detection (no tunnelling)
+            self.THREADED: bool = False # Run the simulation on its own thread, apart from events and rendering
 
     class GameSettings:
         def __init__(self):
             self.WINNING_SCORE: int = 11
             self.WIN_BY_TWO: bool = True
+            self.REWIND_SECONDS: float = 3.0 # How far key_bindings.rewind can go back (0 disables rewinding)
+            self.COMPUTER_PLAYER: Optional[str] = None # Paddle played by the computer ("left", "right" or None)
+            self.COMPUTER_DIFFICULTY: str = "medium" # "easy", "medium", "hard" or "expert"
+            self.BALL_COUNT: int = 1 # More than 1 plays multiball (every ball scores, and is served again at once)
 
     class Colors:
         def __init__(self):
@@ -42,6 +61,7 @@ class Settings:
             self.TITLE_SIZE: int = 74
             self.MENU_SIZE: int = 36
             self.CONTROLS_SIZE: int = 16
+            self.TEXT_CACHE_SIZE: int = 128 # Max rendered text surfaces kept (least recently used evicted)
 
     class KeyBindings:
         def __init__(self):
@@ -50,12 +70,16 @@ class Settings:
             self.left_down = pygame.K_s
             self.right_up = pygame.K_UP
             self.right_down = pygame.K_DOWN
+            self.toggle_timing_overlay = pygame.K_F3
+            self.rewind = pygame.K_BACKSPACE
 
         def rebind_key(self, action, new_key):
             """
-            Rebind an action (up or down, for either left or right player) to a new key.
+            Rebind an action (up or down, for either left or right player, toggling the timing overlay or rewinding)
+            to a new key.
 
-            :param action: The action to rebind ('left_up', 'left_down', 'right_up' or 'right_down').
+            :param action: The action to rebind ('left_up', 'left_down', 'right_up', 'right_down',
+                'toggle_timing_overlay' or 'rewind').
             :param new_key: The new Pygame key constant.
             """
             if action == "left_up":
@@ -66,8 +90,54 @@ class Settings:
                 self.right_up = new_key
             elif action == "right_down":
                 self.right_down = new_key
+            elif action == "toggle_timing_overlay":
+                self.toggle_timing_overlay = new_key
+            elif action == "rewind":
+                self.rewind = new_key
             else:
-                raise ValueError("Invalid action - requires one of 'left_up', 'left_down', 'right_up' or 'right_down'.")
+                raise ValueError("Invalid action - requires one of 'left_up', 'left_down', 'right_up', 'right_down', "
+                                 "'toggle_timing_overlay' or 'rewind'.")
+
+    class RecordingSettings:
+        def __init__(self):
+            """Match input recording configuration."""
+            self.RECORD_MATCHES: bool = False
+            self.RECORDINGS_DIR: str = "recordings"
+
+    class CaptureSettings:
+        def __init__(self):
+            """Pixel frame capture configuration (requires NumPy)."""
+            self.CAPTURE_FRAMES: bool = False # Publish every drawn frame to a shared-memory ring buffer
+            self.GRAYSCALE: bool = False
+            self.DOWNSCALE: int = 1 # Factor to reduce captured frame width and height by
+            self.RING_SLOTS: int = 8
+            self.SHARED_MEMORY_NAME: Optional[str] = None # Name readers attach to (None = random, logged at startup)
+
+    class TelemetrySettings:
+        def __init__(self):
+            """Gameplay telemetry configuration (JSON lines written by a background thread)."""
+            self.ENABLED: bool = False
+            self.PATH: str = "telemetry/pypong.jsonl"
+            self.MAX_BYTES: int = 10_000_000 # Size at which the file is rotated
+            self.BACKUP_COUNT: int = 5 # Rotated files kept
+            self.BATCH_SIZE: int = 64 # Events written together
+            self.FLUSH_INTERVAL: float = 1.0 # Longest time (seconds) an event waits to be written
+
+    class ResultsSettings:
+        def __init__(self):
+            """Match results database configuration (SQLite, with per-player totals and Elo ratings)."""
+            self.ENABLED: bool = False
+            self.PATH: str = "results/pypong.db"
+            self.BATCH_SIZE: int = 500 # Results written in one transaction
+            self.FLUSH_INTERVAL: float = 1.0 # Longest time (seconds) a result waits to be written
+            self.PLAYER_1: str = "Player 1" # Name the left player's results are stored under
+            self.PLAYER_2: str = "Player 2" # Name the right player's results are stored under
+
+    class DebugSettings:
+        def __init__(self):
+            """Frame timing instrumentation configuration."""
+            self.SHOW_TIMING_OVERLAY: bool = False # Toggled in-game with key_bindings.toggle_timing_overlay
+            self.TIMING_WINDOW: int = 300 # Number of recent frames used for timing percentiles
 
     class BallSettings:
         """Ball configuration parameters."""
@@ -84,8 +154,14 @@ class Settings:
         self.ball = self.BallSettings()
         self.paddle = self.PaddleSettings()
         self.screen = self.ScreenSettings()
+        self.physics = self.PhysicsSettings()
         self.game = self.GameSettings()
         self.key_bindings = self.KeyBindings()
+        self.debug = self.DebugSettings()
+        self.recording = self.RecordingSettings()
+        self.capture = self.CaptureSettings()
+        self.telemetry = self.TelemetrySettings()
+        self.results = self.ResultsSettings()
 
         # Load user settings if available
         self._load_user_config()
@@ -111,8 +187,34 @@ class Settings:
                         screen_config = user_config['screen']
                         if 'screen_width' and 'screen_height' in screen_config:
                             self.screen.SCREEN_DIMENSIONS = (screen_config['screen_width'], screen_config['screen_height'])
+                        if 'logical_width' in screen_config and 'logical_height' in screen_config:
+                            self.screen.LOGICAL_DIMENSIONS = (screen_config['logical_width'],
+                                                              screen_config['logical_height'])
+                        if 'render_scale' in screen_config:
+                            self.screen.RENDER_SCALE = screen_config['render_scale']
+                        if 'render_backend' in screen_config:
+                            self.screen.RENDER_BACKEND = screen_config['render_backend']
+                        if 'render_driver' in screen_config:
+                            self.screen.RENDER_DRIVER = screen_config['render_driver']
                         if 'fps' in screen_config:
                             self.screen.FPS = screen_config['fps']
+                        if 'frame_pacing' in screen_config:
+                            self.screen.FRAME_PACING = screen_config['frame_pacing']
+                        if 'dirty_rects' in screen_config:
+                            self.screen.DIRTY_RECTS = screen_config['dirty_rects']
+                        if 'idle_fps' in screen_config:
+                            self.screen.IDLE_FPS = screen_config['idle_fps']
+
+                    if 'physics' in user_config:
+                        physics_config = user_config['physics']
+                        if 'tick_rate' in physics_config:
+                            self.physics.TICK_RATE = physics_config['tick_rate']
+                        if 'max_frame_time' in physics_config:
+                            self.physics.MAX_FRAME_TIME = physics_config['max_frame_time']
+                        if 'swept_collisions' in physics_config:
+                            self.physics.SWEPT_COLLISIONS = physics_config['swept_collisions']
+                        if 'threaded' in physics_config:
+                            self.physics.THREADED = physics_config['threaded']
 
                     if 'gameplay' in user_config:
                         gameplay_config = user_config['gameplay']
@@ -120,6 +222,71 @@ class Settings:
                             self.game.WINNING_SCORE = gameplay_config['winning_score']
                         if 'win_by_two' in gameplay_config:
                             self.game.WIN_BY_TWO = gameplay_config['win_by_two']
+                        if 'rewind_seconds' in gameplay_config:
+                            self.game.REWIND_SECONDS = gameplay_config['rewind_seconds']
+                        if 'computer_player' in gameplay_config:
+                            self.game.COMPUTER_PLAYER = gameplay_config['computer_player']
+                        if 'computer_difficulty' in gameplay_config:
+                            self.game.COMPUTER_DIFFICULTY = gameplay_config['computer_difficulty']
+                        if 'ball_count' in gameplay_config:
+                            self.game.BALL_COUNT = gameplay_config['ball_count']
+
+                    if 'recording' in user_config:
+                        recording_config = user_config['recording']
+                        if 'record_matches' in recording_config:
+                            self.recording.RECORD_MATCHES = recording_config['record_matches']
+                        if 'recordings_dir' in recording_config:
+                            self.recording.RECORDINGS_DIR = recording_config['recordings_dir']
+
+                    if 'capture' in user_config:
+                        capture_config = user_config['capture']
+                        if 'capture_frames' in capture_config:
+                            self.capture.CAPTURE_FRAMES = capture_config['capture_frames']
+                        if 'grayscale' in capture_config:
+                            self.capture.GRAYSCALE = capture_config['grayscale']
+                        if 'downscale' in capture_config:
+                            self.capture.DOWNSCALE = capture_config['downscale']
+                        if 'ring_slots' in capture_config:
+                            self.capture.RING_SLOTS = capture_config['ring_slots']
+                        if 'shared_memory_name' in capture_config:
+                            self.capture.SHARED_MEMORY_NAME = capture_config['shared_memory_name']
+
+                    if 'telemetry' in user_config:
+                        telemetry_config = user_config['telemetry']
+                        if 'enabled' in telemetry_config:
+                            self.telemetry.ENABLED = telemetry_config['enabled']
+                        if 'path' in telemetry_config:
+                            self.telemetry.PATH = telemetry_config['path']
+                        if 'max_bytes' in telemetry_config:
+                            self.telemetry.MAX_BYTES = telemetry_config['max_bytes']
+                        if 'backup_count' in telemetry_config:
+                            self.telemetry.BACKUP_COUNT = telemetry_config['backup_count']
+                        if 'batch_size' in telemetry_config:
+                            self.telemetry.BATCH_SIZE = telemetry_config['batch_size']
+                        if 'flush_interval' in telemetry_config:
+                            self.telemetry.FLUSH_INTERVAL = telemetry_config['flush_interval']
+
+                    if 'results' in user_config:
+                        results_config = user_config['results']
+                        if 'enabled' in results_config:
+                            self.results.ENABLED = results_config['enabled']
+                        if 'path' in results_config:
+                            self.results.PATH = results_config['path']
+                        if 'batch_size' in results_config:
+                            self.results.BATCH_SIZE = results_config['batch_size']
+                        if 'flush_interval' in results_config:
+                            self.results.FLUSH_INTERVAL = results_config['flush_interval']
+                        if 'player_1' in results_config:
+                            self.results.PLAYER_1 = results_config['player_1']
+                        if 'player_2' in results_config:
+                            self.results.PLAYER_2 = results_config['player_2']
+
+                    if 'debug' in user_config:
+                        debug_config = user_config['debug']
+                        if 'show_timing_overlay' in debug_config:
+                            self.debug.SHOW_TIMING_OVERLAY = debug_config['show_timing_overlay']
+                        if 'timing_window' in debug_config:
+                            self.debug.TIMING_WINDOW = debug_config['timing_window']
 
 
 # Create singleton instance
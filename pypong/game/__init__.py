@@ -1 +1,2 @@
-from .game import Game
\ No newline at end of file
+from .game import Game
+from .simulation import PaddleAction, Simulation, SimulationInputs, SimulationState
\ No newline at end of file
@@ -0,0 +1,258 @@
+import numpy as np
+from typing import Optional, Tuple
+from ..config import GameState, settings
+from .simulation import PaddleAction, SimulationState
+
+# Integer codes for paddle actions in batched action arrays
+ACTION_NONE = 0
+ACTION_UP = 1
+ACTION_DOWN = -1
+
+ACTION_CODES = {
+    PaddleAction.NONE: ACTION_NONE,
+    PaddleAction.UP: ACTION_UP,
+    PaddleAction.DOWN: ACTION_DOWN,
+}
+
+class BatchSimulation:
+    def __init__(self, num_matches: int, screen_dims: Optional[Tuple[int, int]] = None,
+                 winning_score: Optional[int] = None, ball_size: int = 10, paddle_width: int = 5,
+                 paddle_length=60, ball_h_speed=3, ball_v_speed=5, speed_increment=1,
+                 seed: Optional[int] = None):
+        """
+        Initialise a batch of independent PyPong matches stepped together with NumPy.
+
+        Applies the same discrete per-tick rules as `Ball` and `Paddle` (equivalent to a `Simulation` with
+        `swept_collisions=False` and `dt=1`), but keeps the state of every match in struct-of-arrays
+        buffers so all matches advance in one vectorized step. Points are continued automatically, and
+        finished games are recorded and reset in place.
+
+        `paddle_length`, `ball_h_speed`, `ball_v_speed` and `speed_increment` accept either a scalar
+        or an array of shape (num_matches,), so balance parameters can be swept across the batch.
+
+        Args:
+            num_matches (int): Number of concurrent matches.
+            screen_dims (tuple, optional): Playing field dimensions. Defaults to settings.screen.LOGICAL_DIMENSIONS.
+            winning_score (int, optional): Score required to win. Defaults to settings.game.WINNING_SCORE.
+            ball_size (int, optional): Ball side length. Defaults to 10.
+            paddle_width (int, optional): Paddle width. Defaults to 5.
+            paddle_length (int or array, optional): Paddle length. Defaults to 60.
+            ball_h_speed (int or array, optional): Ball horizontal speed at the start of a point. Defaults to 3.
+            ball_v_speed (int or array, optional): Ball vertical speed at the start of a point. Defaults to 5.
+            speed_increment (int or array, optional): Horizontal speed gained on each paddle hit. Defaults to 1.
+            seed (int, optional): Seed for the random ball starting positions and directions.
+
+        Raises:
+            ValueError: If num_matches is not a positive integer.
+        """
+        if num_matches <= 0 or not isinstance(num_matches, int):
+            raise ValueError("Number of matches must be a positive integer.")
+
+        self.num_matches = num_matches
+        self.screen_dims = screen_dims if screen_dims is not None else settings.screen.LOGICAL_DIMENSIONS
+        self.screen_width, self.screen_height = self.screen_dims
+        self.winning_score = winning_score if winning_score is not None else settings.game.WINNING_SCORE
+        self.ball_size = ball_size
+        self.paddle_width = paddle_width
+        self.rng = np.random.default_rng(seed)
+        self.tick = 0
+
+        # Per-match balance parameters
+        self.paddle_length = self._per_match(paddle_length)
+        self.start_h_speed = self._per_match(ball_h_speed)
+        self.start_v_speed = self._per_match(ball_v_speed)
+        self.speed_increment = self._per_match(speed_increment)
+
+        # Paddle x-coordinates (see `Paddle.x_pos`)
+        self.l_paddle_x = 2
+        self.r_paddle_x = self.screen_width - (paddle_width + 2)
+
+        # Object state buffers
+        self.ball_x = np.zeros(num_matches, dtype=np.int32)
+        self.ball_y = np.zeros(num_matches, dtype=np.int32)
+        self.ball_h_speed = np.zeros(num_matches, dtype=np.int32)
+        self.ball_v_speed = np.zeros(num_matches, dtype=np.int32)
+        self.l_paddle_y = np.zeros(num_matches, dtype=np.int32)
+        self.l_paddle_v_speed = np.zeros(num_matches, dtype=np.int32)
+        self.r_paddle_y = np.zeros(num_matches, dtype=np.int32)
+        self.r_paddle_v_speed = np.zeros(num_matches, dtype=np.int32)
+
+        # Scoring and results
+        self.score_p1 = np.zeros(num_matches, dtype=np.int32)
+        self.score_p2 = np.zeros(num_matches, dtype=np.int32)
+        self.games_won_p1 = np.zeros(num_matches, dtype=np.int64)
+        self.games_won_p2 = np.zeros(num_matches, dtype=np.int64)
+        self.paddle_hits = np.zeros(num_matches, dtype=np.int64)
+
+        # Points scored in the last step
+        self.scored_p1 = np.zeros(num_matches, dtype=bool)
+        self.scored_p2 = np.zeros(num_matches, dtype=bool)
+
+        self.reset()
+
+    def _per_match(self, value) -> np.ndarray:
+        """Broadcast a scalar or per-match parameter to an int32 array of shape (num_matches,)."""
+        return np.broadcast_to(np.asarray(value, dtype=np.int32), (self.num_matches,)).copy()
+
+    def reset(self):
+        """Reset scores, results and game objects for every match."""
+        self.tick = 0
+        self.score_p1[:] = 0
+        self.score_p2[:] = 0
+        self.games_won_p1[:] = 0
+        self.games_won_p2[:] = 0
+        self.paddle_hits[:] = 0
+        self.scored_p1[:] = False
+        self.scored_p2[:] = False
+        self.reset_objects(np.ones(self.num_matches, dtype=bool))
+
+    def reset_matches(self, mask: np.ndarray):
+        """
+        Restart the masked matches from 0-0, keeping their recorded results.
+
+        Args:
+            mask (np.ndarray): Boolean array selecting the matches to restart.
+        """
+        self.score_p1[mask] = 0
+        self.score_p2[mask] = 0
+        self.reset_objects(mask)
+
+    def reset_objects(self, mask: np.ndarray):
+        """
+        Reset ball and paddles for the masked matches (see `Simulation.reset_objects`).
+
+        Args:
+            mask (np.ndarray): Boolean array selecting the matches to reset.
+        """
+        count = int(np.count_nonzero(mask))
+        if count == 0:
+            return
+
+        # Paddle speeds reset to 0 and paddles moved back to centre
+        self.l_paddle_v_speed[mask] = 0
+        self.r_paddle_v_speed[mask] = 0
+        centre = self.screen_height // 2 - self.paddle_length[mask] // 2
+        self.l_paddle_y[mask] = centre
+        self.r_paddle_y[mask] = centre
+
+        # Random starting position (on net line) and direction for ball
+        self.ball_x[mask] = self.screen_width // 2 - self.ball_size // 2
+        self.ball_y[mask] = self.rng.integers(0, self.screen_height, size=count, endpoint=True)
+        self.ball_h_speed[mask] = self.rng.choice([-1, 1], size=count) * self.start_h_speed[mask]
+        self.ball_v_speed[mask] = self.rng.choice([-1, 1], size=count) * self.start_v_speed[mask]
+
+    def apply_actions(self, left_actions=None, right_actions=None):
+        """
+        Apply paddle actions to every match (see `Simulation.apply_paddle_action`).
+
+        Args:
+            left_actions (array, optional): Action codes (ACTION_NONE/ACTION_UP/ACTION_DOWN) for the left paddles.
+            right_actions (array, optional): Action codes for the right paddles.
+        """
+        if left_actions is not None:
+            self._apply_paddle_actions(self.l_paddle_v_speed, np.asarray(left_actions))
+        if right_actions is not None:
+            self._apply_paddle_actions(self.r_paddle_v_speed, np.asarray(right_actions))
+
+    @staticmethod
+    def _apply_paddle_actions(v_speed: np.ndarray, actions: np.ndarray):
+        """Update paddle speeds in place: pressing with travel speeds up (max 10), against travel stops."""
+        up = actions == ACTION_UP
+        down = actions == ACTION_DOWN
+        np.copyto(v_speed, np.where(v_speed >= 0, np.minimum(v_speed + 2, 10), 0), where=up)
+        np.copyto(v_speed, np.where(v_speed <= 0, np.maximum(v_speed - 2, -10), 0), where=down)
+
+    def step(self, left_actions=None, right_actions=None) -> np.ndarray:
+        """
+        Apply paddle actions and advance every match by one tick.
+
+        Args:
+            left_actions (array, optional): Action codes for the left paddles.
+            right_actions (array, optional): Action codes for the right paddles.
+
+        Returns:
+            np.ndarray: Boolean mask of matches whose game finished (and was reset) this tick
+        """
+        self.apply_actions(left_actions, right_actions)
+
+        # Move balls
+        self.ball_x += self.ball_h_speed
+        self.ball_y += self.ball_v_speed
+
+        # Change direction if ball hits either side (top/bottom)
+        top = self.ball_y <= 0
+        bottom = ~top & (self.ball_y + self.ball_size >= self.screen_height)
+        self.ball_v_speed[top] = np.abs(self.ball_v_speed[top])
+        self.ball_y[top] = 0
+        self.ball_v_speed[bottom] = -np.abs(self.ball_v_speed[bottom])
+        self.ball_y[bottom] = self.screen_height - self.ball_size
+
+        # Change direction and speed if ball hits the paddle it is travelling towards
+        moving_left = self.ball_h_speed < 0
+        paddle_x = np.where(moving_left, self.l_paddle_x, self.r_paddle_x)
+        paddle_y = np.where(moving_left, self.l_paddle_y, self.r_paddle_y)
+        hit = ((self.ball_x < paddle_x + self.paddle_width) & (self.ball_x + self.ball_size > paddle_x)
+               & (self.ball_y < paddle_y + self.paddle_length) & (self.ball_y + self.ball_size > paddle_y))
+        self.ball_h_speed[hit] = -self.ball_h_speed[hit]
+        self.ball_h_speed[hit] += np.where(self.ball_h_speed[hit] < 0, -1, 1) * self.speed_increment[hit]
+        self.paddle_hits += hit
+
+        # End point if ball hits either end
+        left_end = self.ball_x <= 0
+        right_end = ~left_end & (self.ball_x + self.ball_size >= self.screen_width)
+        self.score_p2 += left_end
+        self.score_p1 += right_end
+        self.scored_p1[:] = right_end
+        self.scored_p2[:] = left_end
+
+        # Record and reset finished games
+        finished = (((self.score_p1 >= self.winning_score) | (self.score_p2 >= self.winning_score))
+                    & (np.abs(self.score_p1 - self.score_p2) >= 2))
+        self.games_won_p1 += finished & (self.score_p1 > self.score_p2)
+        self.games_won_p2 += finished & (self.score_p2 > self.score_p1)
+        self.score_p1[finished] = 0
+        self.score_p2[finished] = 0
+        self.reset_objects(left_end | right_end)
+
+        # Move paddles, stopping them at the top/bottom of the screen
+        self._move_paddles(self.l_paddle_y, self.l_paddle_v_speed)
+        self._move_paddles(self.r_paddle_y, self.r_paddle_v_speed)
+
+        self.tick += 1
+        return finished
+
+    def _move_paddles(self, y: np.ndarray, v_speed: np.ndarray):
+        """Move paddles in place according to speed (see `Paddle.move` and `Paddle.check_edges_hit`)."""
+        # Subtracts speed value to account for pygame coordinates increasing from top to bottom
+        y -= v_speed
+        top = y <= 0
+        bottom = ~top & (y + self.paddle_length >= self.screen_height)
+        v_speed[top | bottom] = 0
+        y[top] = 0
+        y[bottom] = self.screen_height - self.paddle_length[bottom]
+
+    def get_match_state(self, index: int) -> SimulationState:
+        """
+        Return a snapshot of a single match in the same form as `Simulation.get_state()`.
+
+        Args:
+            index (int): Match index
+
+        Returns:
+            SimulationState: State of the match (always PLAYING, as points continue automatically)
+        """
+        return SimulationState(
+            tick=self.tick,
+            current_state=GameState.PLAYING,
+            score_p1=int(self.score_p1[index]),
+            score_p2=int(self.score_p2[index]),
+            winner=None,
+            ball_x=int(self.ball_x[index]),
+            ball_y=int(self.ball_y[index]),
+            ball_h_speed=int(self.ball_h_speed[index]),
+            ball_v_speed=int(self.ball_v_speed[index]),
+            l_paddle_y=int(self.l_paddle_y[index]),
+            l_paddle_v_speed=int(self.l_paddle_v_speed[index]),
+            r_paddle_y=int(self.r_paddle_y[index]),
+            r_paddle_v_speed=int(self.r_paddle_v_speed[index]),
+        )
@@ -0,0 +1,233 @@
+import numpy as np
+import pygame
+from multiprocessing import shared_memory
+from typing import Optional, Tuple
+
+# ITU-R BT.601 luma weights, scaled to sum to 256 so grayscale conversion needs only integer ops
+GRAYSCALE_WEIGHTS = (77, 150, 29)
+
+# Ring header (int64 fields): magic, slots, height, width, channels, frames written
+RING_MAGIC = 0x50505249  # "PPRI"
+RING_HEADER_FIELDS = 6
+
+class FrameCapture:
+    def __init__(self, surface: pygame.Surface, grayscale: bool = False, downscale: int = 1):
+        """
+        Initialise a capturer of a surface's pixels as NumPy frames.
+
+        Full-size RGB frames are blitted by SDL straight into the destination array, through a surface
+        wrapping its memory. Grayscale and downscaled frames are read through `pygame.surfarray.pixels3d`,
+        a view of the surface's own memory. Downscaling samples every `downscale`-th pixel (nearest
+        neighbour), and grayscale conversion uses integer luma weights in preallocated buffers. Either way,
+        frames are written directly to their destination with no intermediate copies or allocations.
+
+        Args:
+            surface (pygame.Surface): Surface to capture (e.g. the display surface)
+            grayscale (bool, optional): Capture a single luma channel instead of RGB. Defaults to False.
+            downscale (int, optional): Factor to reduce width and height by. Defaults to 1.
+
+        Raises:
+            ValueError: If downscale is not a positive integer.
+        """
+        if downscale <= 0 or not isinstance(downscale, int):
+            raise ValueError("Downscale must be a positive integer.")
+
+        self.surface = surface
+        self.grayscale = grayscale
+        self.downscale = downscale
+
+        width, height = surface.get_size()
+        height, width = -(-height // downscale), -(-width // downscale)
+        self.shape: Tuple[int, ...] = (height, width) if grayscale else (height, width, 3)
+
+        # Surfaces wrapping destination arrays (keyed by address), and scratch buffers for grayscale conversion
+        self._targets = {}
+        self._luma = np.empty((height, width), dtype=np.uint16) if grayscale else None
+        self._channel = np.empty((height, width), dtype=np.uint16) if grayscale else None
+
+    def capture_into(self, out: np.ndarray, reuse: bool = True):
+        """
+        Write the surface's current pixels into an array of shape `self.shape`.
+
+        The surface is locked while its pixels are read, and unlocked before this returns.
+
+        Args:
+            out (np.ndarray): C-contiguous uint8 destination array (e.g. a `SharedFrameRing` slot)
+            reuse (bool, optional): Whether `out` is long-lived and will be written again, so the surface
+                wrapping it is kept for reuse. Defaults to True.
+        """
+        if not self.grayscale and self.downscale == 1:
+            address = out.__array_interface__['data'][0]
+            target = self._targets.get(address)
+            if target is None:
+                target = pygame.image.frombuffer(out, self.surface.get_size(), "RGB")
+                if reuse:
+                    self._targets[address] = target
+            target.blit(self.surface, (0, 0))
+            return
+
+        pixels = pygame.surfarray.pixels3d(self.surface)
+        # surfarray indexes (x, y); transpose to the usual (row, column) image layout
+        frame = pixels[::self.downscale, ::self.downscale].transpose(1, 0, 2)
+        try:
+            if self.grayscale:
+                np.multiply(frame[..., 0], GRAYSCALE_WEIGHTS[0], out=self._luma, dtype=np.uint16)
+                for channel in (1, 2):
+                    np.multiply(frame[..., channel], GRAYSCALE_WEIGHTS[channel], out=self._channel, dtype=np.uint16)
+                    self._luma += self._channel
+                self._luma >>= 8
+                np.copyto(out, self._luma, casting='unsafe')
+            else:
+                np.copyto(out, frame)
+        finally:
+            # Release the surface lock held by the pixel view
+            del pixels, frame
+
+    def capture(self) -> np.ndarray:
+        """Return a copy of the surface's current pixels, of shape `self.shape`."""
+        out = np.empty(self.shape, dtype=np.uint8)
+        self.capture_into(out, reuse=False)
+        return out
+
+    def publish(self, ring: "SharedFrameRing"):
+        """Write the surface's current pixels straight into the next slot of a shared-memory ring."""
+        self.capture_into(ring.write_slot())
+        ring.commit()
+
+
+class SharedFrameRing:
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool):
+        """
+        Wrap a shared-memory block holding a ring buffer of uint8 frames.
+
+        Use `create()` in the writing process and `attach()` (with the same name) in readers. Readers
+        access frames as NumPy views of the shared block, so no pickling or copying between processes
+        is needed.
+
+        Args:
+            shm (SharedMemory): Shared-memory block laid out by `create()`
+            owner (bool): Whether this process created the block (and should unlink it)
+
+        Raises:
+            ValueError: If the block does not contain a frame ring.
+        """
+        self.shm = shm
+        self.owner = owner
+        self._header = np.ndarray((RING_HEADER_FIELDS,), dtype=np.int64, buffer=shm.buf)
+        if self._header[0] != RING_MAGIC:
+            raise ValueError(f"Shared memory block {shm.name} does not contain a frame ring.")
+
+        self.slots = int(self._header[1])
+        height, width, channels = (int(v) for v in self._header[2:5])
+        self.frame_shape: Tuple[int, ...] = (height, width) if channels == 1 else (height, width, channels)
+        self._frames = np.ndarray((self.slots,) + self.frame_shape, dtype=np.uint8, buffer=shm.buf,
+                                  offset=self._header.nbytes)
+
+    @classmethod
+    def create(cls, frame_shape: Tuple[int, ...], slots: int = 8, name: Optional[str] = None) -> "SharedFrameRing":
+        """
+        Create a new ring in shared memory.
+
+        Args:
+            frame_shape (tuple): (height, width) for grayscale or (height, width, channels) frames
+            slots (int, optional): Number of slots. The writer fills one while the other `slots - 1` frames
+                can be read. Defaults to 8.
+            name (str, optional): Shared memory name for readers to attach to. Defaults to a random name.
+
+        Returns:
+            SharedFrameRing: Ring owned by this process
+
+        Raises:
+            ValueError: If slots is not an integer of at least 2.
+        """
+        if slots < 2 or not isinstance(slots, int):
+            raise ValueError("Slots must be an integer of at least 2.")
+
+        height, width = frame_shape[:2]
+        channels = frame_shape[2] if len(frame_shape) == 3 else 1
+        size = RING_HEADER_FIELDS * 8 + slots * height * width * channels
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        header = np.ndarray((RING_HEADER_FIELDS,), dtype=np.int64, buffer=shm.buf)
+        header[:] = (RING_MAGIC, slots, height, width, channels, 0)
+        del header
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedFrameRing":
+        """Attach to a ring created by another process."""
+        return cls(shared_memory.SharedMemory(name=name), owner=False)
+
+    @property
+    def name(self) -> str:
+        """Shared memory name, for readers to attach to."""
+        return self.shm.name
+
+    @property
+    def frames_written(self) -> int:
+        """Total number of frames committed (the index of the next frame)."""
+        return int(self._header[5])
+
+    def write_slot(self) -> np.ndarray:
+        """Return the slot the next frame should be written to, as a view of the shared block."""
+        return self._frames[self.frames_written % self.slots]
+
+    def commit(self):
+        """Publish the frame written to `write_slot()`."""
+        self._header[5] += 1
+
+    def write(self, frame: np.ndarray):
+        """Copy a frame into the ring and publish it."""
+        np.copyto(self.write_slot(), frame)
+        self.commit()
+
+    def view(self, index: int) -> np.ndarray:
+        """
+        Return a zero-copy view of a frame by index.
+
+        The view's contents change once the writer wraps around, `slots` frames later.
+
+        Args:
+            index (int): Frame index (0 is the first frame written)
+
+        Returns:
+            np.ndarray: View of the frame's slot
+        """
+        return self._frames[index % self.slots]
+
+    def read(self, index: int) -> Optional[np.ndarray]:
+        """
+        Return a copy of a frame by index, if it is still held and was not overwritten while copying.
+
+        Args:
+            index (int): Frame index (0 is the first frame written)
+
+        Returns:
+            np.ndarray or None: Frame, or None if it has not been written yet or was overwritten
+        """
+        if not self.frames_written - self.slots < index < self.frames_written:
+            return None
+        frame = self.view(index).copy()
+        # The writer starts overwriting a slot as soon as it has committed the frame before it
+        if index <= self.frames_written - self.slots:
+            return None
+        return frame
+
+    def latest(self) -> Tuple[int, Optional[np.ndarray]]:
+        """Return the index and a copy of the most recently committed frame (-1 and None if none yet)."""
+        index = self.frames_written - 1
+        if index < 0:
+            return index, None
+        return index, self.read(index)
+
+    def close(self):
+        """Detach from the shared block, and free it if this process created it."""
+        self._header = self._frames = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
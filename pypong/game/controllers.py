@@ -0,0 +1,205 @@
+import random
+from typing import Callable, Optional, Tuple
+from ..config import GameState
+from .simulation import PaddleAction, SimulationState
+
+# A controller chooses a paddle action from the current state, for the left (True) or right (False) paddle.
+# Controllers used with `Tournament` must be picklable (module-level functions or class instances). A
+# controller with random choices can define `reseed(seed)`, which tournaments call before each match.
+Controller = Callable[[SimulationState, bool], PaddleAction]
+
+# Default object sizes (not included in SimulationState)
+BALL_SIZE = 10
+PADDLE_LENGTH = 60
+PADDLE_WIDTH = 5
+PADDLE_MARGIN = 2  # Gap between each paddle and its end of the screen
+
+# Computer player difficulty levels: (reaction time in ticks, maximum paddle speed)
+DIFFICULTY_LEVELS = {
+    "easy": (24, 4),
+    "medium": (12, 6),
+    "hard": (6, 8),
+    "expert": (0, 10),
+}
+
+def paddle_state(state: SimulationState, left: bool):
+    """
+    Get the position and speed of one paddle from a simulation state.
+
+    Args:
+        state (SimulationState): Simulation state
+        left (bool): True for the left paddle, False for the right
+
+    Returns:
+        tuple: Paddle (y-coordinate, vertical speed)
+    """
+    if left:
+        return state.l_paddle_y, state.l_paddle_v_speed
+    return state.r_paddle_y, state.r_paddle_v_speed
+
+def steer_towards(target_y: float, paddle_y: int, v_speed: int, max_speed: int = 4, dead_zone: int = 15) -> PaddleAction:
+    """
+    Choose the action that moves a paddle's centre towards a target y-coordinate.
+
+    Paddle speeds increase by 2 per press, and pressing against the direction of travel stops the paddle,
+    so the paddle is sped up to `max_speed` while far from the target and stopped within the dead zone.
+
+    Args:
+        target_y (float): y-coordinate to move the paddle's centre to
+        paddle_y (int): Paddle's current y-coordinate (top)
+        v_speed (int): Paddle's current vertical speed (positive is up)
+        max_speed (int, optional): Speed to accelerate to. Defaults to 4.
+        dead_zone (int, optional): Distance from the target within which the paddle stops. Defaults to 15.
+
+    Returns:
+        PaddleAction: Action to apply
+    """
+    offset = target_y - (paddle_y + PADDLE_LENGTH / 2)
+    if offset < -dead_zone:
+        # Target is above the paddle (pygame y increases downwards)
+        return PaddleAction.UP if v_speed < max_speed else PaddleAction.NONE
+    elif offset > dead_zone:
+        return PaddleAction.DOWN if v_speed > -max_speed else PaddleAction.NONE
+    elif v_speed > 0:
+        return PaddleAction.DOWN
+    elif v_speed < 0:
+        return PaddleAction.UP
+    return PaddleAction.NONE
+
+def idle_controller(state: SimulationState, left: bool) -> PaddleAction:
+    """Controller that never moves its paddle."""
+    return PaddleAction.NONE
+
+def tracking_controller(state: SimulationState, left: bool) -> PaddleAction:
+    """Controller that keeps its paddle level with the ball."""
+    paddle_y, v_speed = paddle_state(state, left)
+    return steer_towards(state.ball_y + BALL_SIZE / 2, paddle_y, v_speed)
+
+class RandomController:
+    def __init__(self, press_chance: float = 0.05, seed: Optional[int] = None):
+        """
+        Initialise a controller pressing up or down at random.
+
+        Args:
+            press_chance (float, optional): Chance of pressing a key each tick. Defaults to 0.05.
+            seed (int, optional): Seed for the controller's random choices.
+        """
+        self.press_chance = press_chance
+        self.rng = random.Random(seed)
+
+    def reseed(self, seed: Optional[int]):
+        """Restart the controller's random choices from a seed."""
+        self.rng.seed(seed)
+
+    def __call__(self, state: SimulationState, left: bool) -> PaddleAction:
+        if self.rng.random() < self.press_chance:
+            return self.rng.choice([PaddleAction.UP, PaddleAction.DOWN])
+        return PaddleAction.NONE
+
+
+def predict_intercept(ball_x: float, ball_y: float, h_speed: float, v_speed: float, target_x: float,
+                      screen_height: int, ball_size: int = BALL_SIZE) -> Optional[float]:
+    """
+    Predict the ball's y-coordinate when it reaches a target x-coordinate, in closed form.
+
+    Bounces off the top and bottom edges (`Ball.check_sides_hit()`) are mirror reflections, so rather than
+    stepping the ball forward, its unbounded path is folded back into the playing field: the ball's y
+    repeats with period 2 * (screen_height - ball_size), travelling down then up.
+
+    Args:
+        ball_x (float): Ball's x-coordinate (left edge)
+        ball_y (float): Ball's y-coordinate (top edge)
+        h_speed (float): Ball's horizontal speed
+        v_speed (float): Ball's vertical speed
+        target_x (float): x-coordinate of the ball's left edge at the intercept
+        screen_height (int): Height of the playing field
+        ball_size (int, optional): Ball side length. Defaults to BALL_SIZE.
+
+    Returns:
+        float or None: Ball's centre y-coordinate at the intercept, or None if the ball is moving away from it
+    """
+    if h_speed == 0:
+        return None
+    ticks = (target_x - ball_x) / h_speed
+    if ticks < 0:
+        return None
+
+    span = screen_height - ball_size
+    y = (ball_y + v_speed * ticks) % (2 * span)
+    if y > span:
+        y = 2 * span - y
+    return y + ball_size / 2
+
+
+class TrajectoryController:
+    def __init__(self, difficulty: str = "medium", screen_dims: Tuple[int, int] = (800, 600),
+                 reaction_ticks: Optional[int] = None, max_speed: Optional[int] = None):
+        """
+        Initialise a computer player that moves its paddle to where the ball will cross it.
+
+        The intercept is predicted analytically with `predict_intercept()`, and cached: the ball's
+        path only changes when a paddle hit changes its horizontal speed (`Ball.check_paddle_hit()`)
+        or a new point is served (which changes the score), so the prediction is recomputed then, rather
+        than every tick. The controller need not be called outside the PLAYING state. After each
+        new prediction, the paddle keeps heading for its previous target for `reaction_ticks` ticks. While
+        the ball moves away, the paddle returns to the centre.
+
+        Args:
+            difficulty (str, optional): One of DIFFICULTY_LEVELS ('easy', 'medium', 'hard' or 'expert').
+                Defaults to 'medium'.
+            screen_dims (tuple, optional): Playing field dimensions. Defaults to (800, 600).
+            reaction_ticks (int, optional): Ticks before reacting to a new ball path (overrides the difficulty).
+            max_speed (int, optional): Fastest paddle speed used, up to 10 (overrides the difficulty).
+
+        Raises:
+            ValueError: If the difficulty is unknown, or the reaction time or speed is out of range.
+        """
+        if difficulty not in DIFFICULTY_LEVELS:
+            raise ValueError(f"Difficulty must be one of {', '.join(DIFFICULTY_LEVELS)}.")
+        default_reaction, default_speed = DIFFICULTY_LEVELS[difficulty]
+        self.reaction_ticks = reaction_ticks if reaction_ticks is not None else default_reaction
+        self.max_speed = max_speed if max_speed is not None else default_speed
+        if self.reaction_ticks < 0:
+            raise ValueError("Reaction ticks must be a non-negative integer.")
+        if not 2 <= self.max_speed <= 10:
+            # Paddle speed changes in steps of 2, up to the paddle's limit of 10
+            raise ValueError("Max speed must be within 2 to 10.")
+
+        self.difficulty = difficulty
+        self.screen_width, self.screen_height = screen_dims
+        self.predictions = 0
+
+        # Intercept cache, keyed by the scores and the ball's horizontal speed
+        self._path_key: Optional[Tuple[int, int, int]] = None
+        self._last_tick = -1
+        self._target = self.screen_height / 2
+        self._next_target = self._target
+        self._react_tick = 0
+
+    def _intercept_x(self, left: bool) -> float:
+        """Ball x-coordinate (left edge) when it touches the face of this controller's paddle."""
+        if left:
+            return PADDLE_MARGIN + PADDLE_WIDTH
+        return self.screen_width - PADDLE_MARGIN - PADDLE_WIDTH - BALL_SIZE
+
+    def __call__(self, state: SimulationState, left: bool) -> PaddleAction:
+        if state.current_state != GameState.PLAYING or state.tick < self._last_tick:
+            # Between points (or rewound) - forget the cached path
+            self._path_key = None
+        self._last_tick = state.tick
+
+        # Every serve follows a point, which changes the score, even if the ball's speed is the same
+        path_key = (state.score_p1, state.score_p2, state.ball_h_speed)
+        if path_key != self._path_key:
+            self._path_key = path_key
+            self.predictions += 1
+            intercept = predict_intercept(state.ball_x, state.ball_y, state.ball_h_speed, state.ball_v_speed,
+                                          self._intercept_x(left), self.screen_height)
+            self._next_target = intercept if intercept is not None else self.screen_height / 2
+            self._react_tick = state.tick + self.reaction_ticks
+
+        if state.tick >= self._react_tick:
+            self._target = self._next_target
+
+        paddle_y, v_speed = paddle_state(state, left)
+        return steer_towards(self._target, paddle_y, v_speed, self.max_speed)
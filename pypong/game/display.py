@@ -0,0 +1,224 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, List, Optional, Tuple
+import pygame
+
+def render_dimensions(logical_dims: Tuple[int, int], render_scale: float) -> Tuple[int, int]:
+    """Return the render resolution for a logical resolution and render scale (at least 1x1 pixel)."""
+    return max(1, round(logical_dims[0] * render_scale)), max(1, round(logical_dims[1] * render_scale))
+
+
+class RenderBackend(ABC):
+    """
+    Interface the screens draw through, so the same drawing code can target different presentation paths.
+
+    Screens draw in the backend's pixels (`get_size()`), with images made by `create_image()` from
+    pygame surfaces: `SurfaceBackend` draws with software blits onto a `pygame.Surface`, and
+    `TextureBackend` (in `sdl2_backend`) submits textures and filled rects to an SDL renderer.
+    """
+    # Whether `present()` can update only the changed areas (otherwise every frame is drawn in full)
+    partial_updates = True
+
+    # Surface the frame is drawn on, if drawn on a surface (e.g. for frame capture)
+    surface: Optional[pygame.Surface] = None
+
+    @abstractmethod
+    def get_size(self) -> Tuple[int, int]:
+        """Return the size (width, height) of the frame in pixels."""
+
+    @abstractmethod
+    def create_surface(self, size: Tuple[int, int]) -> pygame.Surface:
+        """
+        Create a surface to draw content on (e.g. text), in the pixel format `create_image()` converts fastest.
+
+        Args:
+            size (tuple): Surface size (width, height)
+
+        Returns:
+            pygame.Surface: New surface
+        """
+
+    @abstractmethod
+    def create_image(self, surface: pygame.Surface):
+        """
+        Create an image that can be drawn by this backend from a surface's current content.
+
+        Args:
+            surface (pygame.Surface): Source surface (not modified afterwards)
+
+        Returns:
+            pygame.Surface or Texture: Image to pass to `blit()` and `blits()`
+        """
+
+    @abstractmethod
+    def fill(self, color, rect=None):
+        """
+        Fill a rect (or the whole frame) with a solid color.
+
+        Args:
+            color (Color or str or tuple): Fill color
+            rect (pygame.Rect, optional): Area to fill. Defaults to the whole frame.
+        """
+
+    @abstractmethod
+    def blit(self, image, dest, area=None):
+        """
+        Draw an image (or an area of it) at a position.
+
+        Args:
+            image (pygame.Surface or Texture): Image from `create_image()`
+            dest (tuple or pygame.Rect): Top-left position to draw at
+            area (pygame.Rect, optional): Area of the image to draw. Defaults to the whole image.
+        """
+
+    def blits(self, items: Iterable[tuple]):
+        """
+        Draw many images in one call, as `pygame.Surface.blits()`.
+
+        Args:
+            items (iterable): (image, dest) or (image, dest, area) tuples
+        """
+        for item in items:
+            self.blit(*item)
+
+    @abstractmethod
+    def present(self, dirty_rects: Optional[List[pygame.Rect]] = None):
+        """
+        Show the latest frame.
+
+        Args:
+            dirty_rects (list, optional): Changed areas of the frame. Defaults to the whole frame.
+        """
+
+
+class SurfaceBackend(RenderBackend):
+    def __init__(self, surface: pygame.Surface):
+        """
+        Initialise a backend drawing with software blits onto a surface.
+
+        On its own, the backend draws offscreen (e.g. for pixel observations) and `present()` does nothing.
+
+        Args:
+            surface (pygame.Surface): Surface to draw on
+        """
+        self.surface = surface
+
+    def get_size(self) -> Tuple[int, int]:
+        return self.surface.get_size()
+
+    def create_surface(self, size: Tuple[int, int]) -> pygame.Surface:
+        return pygame.Surface(size, 0, self.surface)
+
+    def create_image(self, surface: pygame.Surface) -> pygame.Surface:
+        # Surfaces are blitted as they are, so only need converting to the target's format
+        if surface.get_bitsize() != self.surface.get_bitsize() or surface.get_masks() != self.surface.get_masks():
+            return surface.convert(self.surface)
+        return surface
+
+    def fill(self, color, rect=None):
+        self.surface.fill(color, rect)
+
+    def blit(self, image: pygame.Surface, dest, area=None):
+        self.surface.blit(image, dest, area)
+
+    def blits(self, items: Iterable[tuple]):
+        self.surface.blits(items, doreturn=False)
+
+    def present(self, dirty_rects: Optional[List[pygame.Rect]] = None):
+        pass
+
+
+class ScaledDisplay(SurfaceBackend):
+    def __init__(self, window_dims: Tuple[int, int], logical_dims: Tuple[int, int], render_scale: float = 1.0,
+                 vsync: bool = False):
+        """
+        Open the window, with a render surface of a fixed resolution presented scaled to fit it.
+
+        Game objects and screen layouts are in logical units (`logical_dims`), independent of the window
+        size. Frames are drawn into `surface`, at `render_scale` times the logical resolution, and
+        `present()` scales the surface into the window, keeping its aspect ratio (letterboxed with black
+        bars if the window's differs). A render scale below 1 draws fewer pixels per frame.
+
+        When the render resolution equals the window size, `surface` is the window itself and frames are
+        presented without scaling.
+
+        Args:
+            window_dims (tuple): Window dimensions (width, height)
+            logical_dims (tuple): Logical playing field dimensions (width, height)
+            render_scale (float, optional): Render resolution relative to the logical resolution. Defaults to 1.
+            vsync (bool, optional): Ask for presenting to wait for the display's refresh, where the platform
+                supports it. Defaults to False.
+
+        Raises:
+            ValueError: If the render scale is not positive.
+        """
+        if render_scale <= 0:
+            raise ValueError("Render scale must be positive.")
+
+        self.window = None
+        if vsync:
+            try:
+                self.window = pygame.display.set_mode(window_dims, vsync=1)
+            except pygame.error:
+                pass
+        if self.window is None:
+            self.window = pygame.display.set_mode(window_dims)
+        self.logical_dims = logical_dims
+        self.render_scale = render_scale
+        self.render_dims = render_dimensions(logical_dims, render_scale)
+
+        # Largest area of the window with the render surface's aspect ratio, centred
+        window_width, window_height = self.window.get_size()
+        scale = min(window_width / self.render_dims[0], window_height / self.render_dims[1])
+        self.dest = pygame.Rect(0, 0, round(self.render_dims[0] * scale), round(self.render_dims[1] * scale))
+        self.dest.center = self.window.get_rect().center
+
+        self.scaled = self.render_dims != (window_width, window_height)
+        if self.scaled:
+            super().__init__(pygame.Surface(self.render_dims).convert(self.window))
+            self._dest_surface = self.window.subsurface(self.dest)
+            self.window.fill((0, 0, 0))
+            pygame.display.flip()
+        else:
+            super().__init__(self.window)
+            self._dest_surface = None
+
+    def to_window(self, rect: pygame.Rect) -> pygame.Rect:
+        """
+        Map a rect of the render surface to the window area it is presented in.
+
+        Args:
+            rect (pygame.Rect): Rect in render surface pixels
+
+        Returns:
+            pygame.Rect: Rect in window pixels, rounded outwards
+        """
+        if not self.scaled:
+            return pygame.Rect(rect)
+        scale_x = self.dest.width / self.render_dims[0]
+        scale_y = self.dest.height / self.render_dims[1]
+        left = int(rect.left * scale_x)
+        top = int(rect.top * scale_y)
+        right = -int(-rect.right * scale_x)
+        bottom = -int(-rect.bottom * scale_y)
+        return pygame.Rect(self.dest.x + left, self.dest.y + top, right - left, bottom - top)
+
+    def present(self, dirty_rects: Optional[List[pygame.Rect]] = None):
+        """
+        Show the latest frame in the window.
+
+        Args:
+            dirty_rects (list, optional): Changed areas of the render surface. Defaults to the whole surface.
+        """
+        if not self.scaled:
+            if dirty_rects is not None:
+                pygame.display.update(dirty_rects)
+            else:
+                pygame.display.flip()
+            return
+
+        # Scaling costs the same however little changed, but only the changed areas are sent to the window
+        pygame.transform.scale(self.surface, self.dest.size, self._dest_surface)
+        if dirty_rects is not None:
+            pygame.display.update([self.to_window(rect) for rect in dirty_rects])
+        else:
+            pygame.display.update(self.dest)
@@ -0,0 +1,290 @@
+import numpy as np
+import pygame
+from typing import Optional, Tuple
+from ..config import GameState, settings
+from .batch import ACTION_DOWN, ACTION_NONE, ACTION_UP, BatchSimulation
+from .capture import FrameCapture
+from .display import SurfaceBackend
+from .controllers import BALL_SIZE, PADDLE_LENGTH, Controller, tracking_controller
+from .screens import PlayingScreen
+from .simulation import PaddleAction, Simulation, SimulationInputs, SimulationState
+
+try:
+    from gymnasium import spaces
+except ImportError:
+    spaces = None
+
+# Discrete actions: 0 = no press, 1 = press up, 2 = press down
+ACTIONS = (PaddleAction.NONE, PaddleAction.UP, PaddleAction.DOWN)
+ACTION_CODES = np.array([ACTION_NONE, ACTION_UP, ACTION_DOWN], dtype=np.int32)
+
+# Observation: ball x, y, h_speed, v_speed, own paddle y, v_speed, opponent paddle y, v_speed
+OBSERVATION_SIZE = 8
+MAX_SPEED = 10.0
+
+def _action_space():
+    """Gymnasium action space, if gymnasium is installed."""
+    return spaces.Discrete(len(ACTIONS)) if spaces is not None else None
+
+def _observation_space(pixel_shape: Optional[Tuple[int, ...]] = None):
+    """Gymnasium observation space (for state or pixel observations), if gymnasium is installed."""
+    if spaces is None:
+        return None
+    if pixel_shape is not None:
+        return spaces.Box(low=0, high=255, shape=pixel_shape, dtype=np.uint8)
+    return spaces.Box(low=-np.inf, high=np.inf, shape=(OBSERVATION_SIZE,), dtype=np.float32)
+
+
+class PongEnv:
+    def __init__(self, agent_left: bool = True, opponent: Controller = tracking_controller, frame_skip: int = 4,
+                 max_steps: Optional[int] = None, screen_dims: Optional[Tuple[int, int]] = None,
+                 winning_score: Optional[int] = None, observation: str = "state", grayscale: bool = False,
+                 downscale: int = 1):
+        """
+        Initialise a Gymnasium-style environment in which an agent controls one paddle.
+
+        Each `step()` applies the agent's action (a single up/down press, as in `Game`) and then advances
+        the simulation `frame_skip` ticks, with the opponent controller acting every tick. Points are
+        continued automatically, and the episode terminates when the game is won.
+
+        Observations are float32 arrays of ball x, y, horizontal and vertical speed, then the agent's paddle
+        y and speed, then the opponent's. Positions are scaled by the screen dimensions and speeds by 10.
+        With `observation='pixels'`, observations are instead uint8 images of the playing screen, drawn
+        offscreen (with dirty rects) and read through `FrameCapture`, optionally grayscale or downscaled.
+        Rewards are +1 for each point the agent wins and -1 for each point it loses.
+
+        Args:
+            agent_left (bool, optional): Whether the agent controls the left paddle. Defaults to True.
+            opponent (Controller, optional): Controller for the other paddle. Defaults to tracking_controller.
+            frame_skip (int, optional): Ticks simulated per step. Defaults to 4.
+            max_steps (int, optional): Steps after which an episode is truncated. Defaults to no limit.
+            screen_dims (tuple, optional): Playing field dimensions. Defaults to settings.screen.LOGICAL_DIMENSIONS.
+            winning_score (int, optional): Score required to win. Defaults to settings.game.WINNING_SCORE.
+            observation (str, optional): 'state' or 'pixels'. Defaults to 'state'.
+            grayscale (bool, optional): Use a single luma channel for pixel observations. Defaults to False.
+            downscale (int, optional): Factor to reduce pixel observation size by. Defaults to 1.
+
+        Raises:
+            ValueError: If frame skip is not a positive integer, or the observation type is unknown.
+        """
+        if frame_skip <= 0 or not isinstance(frame_skip, int):
+            raise ValueError("Frame skip must be a positive integer.")
+        if observation not in ("state", "pixels"):
+            raise ValueError("Observation must be one of 'state' or 'pixels'.")
+
+        self.agent_left = agent_left
+        self.opponent = opponent
+        self.frame_skip = frame_skip
+        self.max_steps = max_steps
+        self.screen_dims = screen_dims
+        self.winning_score = winning_score
+        self.observation = observation
+        self.action_space = _action_space()
+
+        # Offscreen rendering for pixel observations
+        self.surface: Optional[pygame.Surface] = None
+        self.playing_screen: Optional[PlayingScreen] = None
+        self.frame_capture: Optional[FrameCapture] = None
+        if observation == "pixels":
+            dims = screen_dims or settings.screen.LOGICAL_DIMENSIONS
+            self.surface = pygame.Surface(dims)
+            self.backend = SurfaceBackend(self.surface)
+            self.playing_screen = PlayingScreen(dims)
+            self.frame_capture = FrameCapture(self.surface, grayscale, downscale)
+            self.observation_space = _observation_space(self.frame_capture.shape)
+        else:
+            self.observation_space = _observation_space()
+
+        self.simulation: Optional[Simulation] = None
+        self.state: Optional[SimulationState] = None
+        self.steps = 0
+
+    def reset(self, seed: Optional[int] = None, options: Optional[dict] = None):
+        """
+        Start a new episode (game), with play already under way.
+
+        Args:
+            seed (int, optional): Simulation seed
+            options (dict, optional): Unused, for Gymnasium compatibility
+
+        Returns:
+            tuple: (observation, info)
+        """
+        self.simulation = Simulation(self.screen_dims, winning_score=self.winning_score, seed=seed)
+        self.simulation.apply_inputs(SimulationInputs(advance=True))
+        self.state = self.simulation.get_state()
+        self.steps = 0
+        if self.playing_screen is not None:
+            self.playing_screen.invalidate()
+        return self._observation(), self._info()
+
+    def step(self, action: int):
+        """
+        Apply an action and advance the simulation `frame_skip` ticks.
+
+        Args:
+            action (int): 0 (no press), 1 (press up) or 2 (press down)
+
+        Returns:
+            tuple: (observation, reward, terminated, truncated, info)
+        """
+        reward = 0.0
+        agent_action = ACTIONS[action]
+        for i in range(self.frame_skip):
+            if self.state.current_state == GameState.GAME_OVER:
+                break
+
+            scores = (self.state.score_p1, self.state.score_p2)
+            opponent_action = self.opponent(self.state, not self.agent_left)
+            own_action = agent_action if i == 0 else PaddleAction.NONE
+            if self.agent_left:
+                inputs = SimulationInputs(left=own_action, right=opponent_action)
+            else:
+                inputs = SimulationInputs(left=opponent_action, right=own_action)
+
+            # Continue automatically after each point
+            if self.state.current_state == GameState.BETWEEN_POINTS:
+                inputs = inputs._replace(advance=True)
+            self.state = self.simulation.step(inputs)
+
+            point = (self.state.score_p1 - scores[0]) - (self.state.score_p2 - scores[1])
+            reward += point if self.agent_left else -point
+
+        self.steps += 1
+        terminated = self.state.current_state == GameState.GAME_OVER
+        truncated = self.max_steps is not None and self.steps >= self.max_steps and not terminated
+        return self._observation(), reward, terminated, truncated, self._info()
+
+    def _observation(self) -> np.ndarray:
+        """Build the observation array from the current state (or render it, for pixel observations)."""
+        if self.observation == "pixels":
+            sim = self.simulation
+            self.playing_screen.render_dirty(self.backend, sim.ball, sim.l_paddle, sim.r_paddle)
+            return self.frame_capture.capture()
+
+        s = self.state
+        width, height = self.simulation.screen_dims
+        own = (s.l_paddle_y, s.l_paddle_v_speed) if self.agent_left else (s.r_paddle_y, s.r_paddle_v_speed)
+        other = (s.r_paddle_y, s.r_paddle_v_speed) if self.agent_left else (s.l_paddle_y, s.l_paddle_v_speed)
+        return np.array([s.ball_x / width, s.ball_y / height, s.ball_h_speed / MAX_SPEED, s.ball_v_speed / MAX_SPEED,
+                         own[0] / height, own[1] / MAX_SPEED, other[0] / height, other[1] / MAX_SPEED],
+                        dtype=np.float32)
+
+    def _info(self) -> dict:
+        """Scores and tick count for the current state."""
+        return {"score_p1": self.state.score_p1, "score_p2": self.state.score_p2, "tick": self.state.tick}
+
+
+class VectorPongEnv:
+    def __init__(self, num_envs: int, frame_skip: int = 4, opponent: str = "tracking", max_steps: Optional[int] = None,
+                 screen_dims: Optional[Tuple[int, int]] = None, winning_score: Optional[int] = None,
+                 seed: Optional[int] = None):
+        """
+        Initialise many environments stepped together in one call, backed by `BatchSimulation`.
+
+        The agent controls the left paddle in every environment. Observations, actions and rewards are as
+        for `PongEnv`, batched along the first axis. Environments whose game is won (terminated) or
+        whose episode reaches `max_steps` (truncated) are reset automatically, and the returned observation
+        is the first of the new episode.
+
+        Physics follows `BatchSimulation`'s discrete per-tick rules, and the opponent is vectorized too.
+
+        Args:
+            num_envs (int): Number of environments.
+            frame_skip (int, optional): Ticks simulated per step. Defaults to 4.
+            opponent (str, optional): 'tracking' (follows the ball) or 'idle'. Defaults to 'tracking'.
+            max_steps (int, optional): Steps after which an episode is truncated. Defaults to no limit.
+            screen_dims (tuple, optional): Playing field dimensions. Defaults to settings.screen.LOGICAL_DIMENSIONS.
+            winning_score (int, optional): Score required to win. Defaults to settings.game.WINNING_SCORE.
+            seed (int, optional): Seed for the random ball starting positions and directions.
+
+        Raises:
+            ValueError: If frame skip is not a positive integer, or the opponent is unknown.
+        """
+        if frame_skip <= 0 or not isinstance(frame_skip, int):
+            raise ValueError("Frame skip must be a positive integer.")
+        if opponent not in ("tracking", "idle"):
+            raise ValueError("Opponent must be one of 'tracking' or 'idle'.")
+
+        self.num_envs = num_envs
+        self.frame_skip = frame_skip
+        self.opponent = opponent
+        self.max_steps = max_steps
+        self.batch = BatchSimulation(num_envs, screen_dims=screen_dims, winning_score=winning_score, seed=seed)
+        self.steps = np.zeros(num_envs, dtype=np.int64)
+        self.single_action_space = _action_space()
+        self.single_observation_space = _observation_space()
+
+    def reset(self, seed: Optional[int] = None, options: Optional[dict] = None):
+        """
+        Reset every environment.
+
+        Args:
+            seed (int, optional): New seed for the random ball starting positions and directions
+            options (dict, optional): Unused, for Gymnasium compatibility
+
+        Returns:
+            tuple: (observations, info)
+        """
+        if seed is not None:
+            self.batch.rng = np.random.default_rng(seed)
+        self.batch.reset()
+        self.steps[:] = 0
+        return self._observations(), {}
+
+    def step(self, actions):
+        """
+        Apply one action per environment and advance them all `frame_skip` ticks.
+
+        Args:
+            actions (array): Actions of shape (num_envs,) - 0 (no press), 1 (press up) or 2 (press down)
+
+        Returns:
+            tuple: (observations, rewards, terminated, truncated, info), each batched along the first axis
+        """
+        batch = self.batch
+        left_actions = ACTION_CODES[np.asarray(actions)]
+        rewards = np.zeros(self.num_envs, dtype=np.float32)
+        terminated = np.zeros(self.num_envs, dtype=bool)
+
+        for i in range(self.frame_skip):
+            finished = batch.step(left_actions if i == 0 else None, self._opponent_actions())
+            # Points and games won in finished matches still count, but no further rewards are given
+            rewards += (batch.scored_p1.astype(np.float32) - batch.scored_p2) * ~terminated
+            terminated |= finished
+
+        self.steps += 1
+        truncated = np.zeros(self.num_envs, dtype=bool)
+        if self.max_steps is not None:
+            truncated = (self.steps >= self.max_steps) & ~terminated
+            batch.reset_matches(truncated)
+        self.steps[terminated | truncated] = 0
+
+        return self._observations(), rewards, terminated, truncated, {}
+
+    def _opponent_actions(self) -> Optional[np.ndarray]:
+        """Vectorized version of `tracking_controller` for the right paddles (None if the opponent is idle)."""
+        if self.opponent == "idle":
+            return None
+
+        batch = self.batch
+        v_speed = batch.r_paddle_v_speed
+        offset = (batch.ball_y + BALL_SIZE / 2) - (batch.r_paddle_y + PADDLE_LENGTH / 2)
+        actions = np.full(self.num_envs, ACTION_NONE, dtype=np.int32)
+        above = offset < -15
+        below = offset > 15
+        level = ~above & ~below
+        actions[above & (v_speed < 4)] = ACTION_UP
+        actions[below & (v_speed > -4)] = ACTION_DOWN
+        actions[level & (v_speed > 0)] = ACTION_DOWN
+        actions[level & (v_speed < 0)] = ACTION_UP
+        return actions
+
+    def _observations(self) -> np.ndarray:
+        """Build the (num_envs, 8) observation array from the batch buffers."""
+        batch = self.batch
+        width, height = batch.screen_width, batch.screen_height
+        return np.stack([batch.ball_x / width, batch.ball_y / height,
+                         batch.ball_h_speed / MAX_SPEED, batch.ball_v_speed / MAX_SPEED,
+                         batch.l_paddle_y / height, batch.l_paddle_v_speed / MAX_SPEED,
+                         batch.r_paddle_y / height, batch.r_paddle_v_speed / MAX_SPEED], axis=1).astype(np.float32)
@@ -0,0 +1,210 @@
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+import numpy as np
+from ..config import GameState
+from .recording import MatchRecording, MatchReplay
+from .simulation import SNAPSHOT_SIZE, SimulationState
+
+# Name of each frame in a PNG sequence, by frame index
+PNG_PATTERN = "frame_{:06d}.png"
+
+class ExportChunk(NamedTuple):
+    """A run of ticks rendered by one worker, starting from a snapshot of the replay at its first tick."""
+    first_frame: int  # Index of the chunk's first frame in the whole export
+    frames: int  # Number of frames the chunk renders
+    end_tick: int  # Tick the chunk stops at
+    snapshot: Tuple[int, ...]  # Simulation state, as written by `Simulation.snapshot_into()`
+    rng_state: object  # Random generator state returned with the snapshot
+    replay_index: int  # Index of the next recorded input to apply
+
+def _replay_ticks(replay: MatchReplay, end_tick: int) -> Iterator[SimulationState]:
+    """
+    Step a replay up to a tick, yielding the state after each tick.
+
+    As in `MatchReplay.run()`, the simulation is only stepped in the PLAYING state.
+    """
+    simulation = replay.simulation
+    while simulation.tick < end_tick and not replay.finished:
+        replay.apply_due_inputs()
+        if replay.finished or simulation.current_state != GameState.PLAYING:
+            return
+        yield simulation.step()
+
+def _frame_count(state: SimulationState, hold_frames: int) -> int:
+    """Return the number of frames shown for a tick: one while playing, or a static screen held for a while."""
+    return 1 if state.current_state == GameState.PLAYING else hold_frames
+
+
+# Render settings and screens for the current worker process (set by `_init_worker`)
+_worker_options: dict = {}
+_worker_screens: dict = {}
+
+def _init_worker(options: dict):
+    """Start pygame headlessly in a worker process, and create its screens and render surface once."""
+    global _worker_options, _worker_screens
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    import pygame
+    from .capture import FrameCapture
+    from .display import SurfaceBackend
+    from .screens import BetweenPointsScreen, GameOverScreen, PlayingScreen
+
+    pygame.init()
+    screen_dims = options["recording"].screen_dims
+    backend = SurfaceBackend(pygame.Surface(options["size"]))
+    _worker_options = options
+    _worker_screens = {
+        "backend": backend,
+        "capture": FrameCapture(backend.surface),
+        "playing": PlayingScreen(screen_dims),
+        "between_points": BetweenPointsScreen(screen_dims),
+        "game_over": GameOverScreen(screen_dims),
+    }
+
+def _render_chunk(chunk: ExportChunk) -> int:
+    """Render a chunk's frames in a worker process, writing them to the output. Returns the frames written."""
+    import pygame
+    options, screens = _worker_options, _worker_screens
+    backend = screens["backend"]
+    recording: MatchRecording = options["recording"]
+    hold_frames = options["hold_frames"]
+
+    simulation = recording.create_simulation()
+    simulation.restore_from(chunk.snapshot, 0, chunk.rng_state)
+    replay = MatchReplay(recording, simulation)
+    replay.index = chunk.replay_index
+
+    frames = np.load(options["path"], mmap_mode="r+") if options["format"] == "npy" else None
+    index = chunk.first_frame
+    try:
+        for state in _replay_ticks(replay, chunk.end_tick):
+            scores = (state.score_p1, state.score_p2)
+            if state.current_state == GameState.PLAYING:
+                screens["playing"].render(backend, simulation.ball, simulation.l_paddle, simulation.r_paddle)
+            elif state.current_state == GameState.BETWEEN_POINTS:
+                screens["between_points"].render(backend, scores)
+            else:
+                screens["game_over"].render(backend, state.winner, scores)
+
+            count = _frame_count(state, hold_frames)
+            if frames is not None:
+                screens["capture"].capture_into(frames[index], reuse=False)
+                frames[index + 1:index + count] = frames[index]
+            else:
+                first = os.path.join(options["path"], PNG_PATTERN.format(index))
+                pygame.image.save(backend.surface, first)
+                for i in range(index + 1, index + count):
+                    shutil.copyfile(first, os.path.join(options["path"], PNG_PATTERN.format(i)))
+            index += count
+    finally:
+        if frames is not None:
+            frames.flush()
+            del frames
+    return index - chunk.first_frame
+
+
+class FrameExporter:
+    def __init__(self, recording: MatchRecording, size: Optional[Tuple[int, int]] = None,
+                 hold_frames: Optional[int] = None, chunk_ticks: int = 600, max_workers: Optional[int] = None):
+        """
+        Initialise an exporter rendering every frame of a recorded match to images, headlessly.
+
+        Frames are drawn by the game's own `PlayingScreen`, `BetweenPointsScreen` and `GameOverScreen`, with
+        SDL's dummy video driver, at one frame per physics tick (so the frame rate is the recording's tick
+        rate). A point ending or the game ending is shown as the between points or game over screen, held
+        for `hold_frames` frames, as a replay takes no time between points.
+
+        The match is re-simulated once to take a snapshot at every `chunk_ticks`-th tick, and chunks are
+        then rendered in parallel across a process pool, each worker restoring the snapshot at the start of
+        its chunk and writing its frames straight to their place in the output.
+
+        Args:
+            recording (MatchRecording): Recorded match
+            size (tuple, optional): Frame size (width, height). Defaults to the recording's playing field size.
+            hold_frames (int, optional): Frames a static screen is held for. Defaults to one second's worth.
+            chunk_ticks (int, optional): Ticks rendered by a worker at a time. Defaults to 600.
+            max_workers (int, optional): Worker processes. Defaults to the number of CPUs.
+
+        Raises:
+            ValueError: If hold frames or chunk ticks are not positive integers.
+        """
+        if hold_frames is None:
+            hold_frames = recording.tick_rate
+        if not isinstance(hold_frames, int) or hold_frames < 1:
+            raise ValueError("Hold frames must be a positive integer.")
+        if not isinstance(chunk_ticks, int) or chunk_ticks < 1:
+            raise ValueError("Chunk ticks must be a positive integer.")
+
+        self.recording = recording
+        self.size = tuple(size) if size is not None else tuple(recording.screen_dims)
+        self.hold_frames = hold_frames
+        self.chunk_ticks = chunk_ticks
+        self.max_workers = max_workers
+
+    def plan(self) -> List[ExportChunk]:
+        """Re-simulate the match, splitting it into chunks that each start from a snapshot."""
+        replay = MatchReplay(self.recording)
+        simulation = replay.simulation
+        chunks = []
+        first_frame = 0
+        snapshot = [0] * SNAPSHOT_SIZE
+        while True:
+            rng_state = simulation.snapshot_into(snapshot)
+            start = tuple(snapshot), rng_state, replay.index
+            frames = sum(_frame_count(state, self.hold_frames)
+                         for state in _replay_ticks(replay, simulation.tick + self.chunk_ticks))
+            if frames == 0:
+                return chunks
+            chunks.append(ExportChunk(first_frame, frames, simulation.tick, *start))
+            first_frame += frames
+
+    def export_png(self, directory: str) -> int:
+        """
+        Render the match to a PNG sequence (`frame_000000.png`, ...).
+
+        Args:
+            directory (str): Directory to write frames to (created if needed)
+
+        Returns:
+            int: Number of frames written
+        """
+        os.makedirs(directory, exist_ok=True)
+        return self._render(self.plan(), directory, "png")
+
+    def export_npy(self, path: str) -> int:
+        """
+        Render the match to a single `.npy` file holding a (frames, height, width, 3) uint8 array.
+
+        The file is memory-mapped, both by workers writing frames and by readers (`np.load(path,
+        mmap_mode="r")`), so a long match never has to fit in memory.
+
+        Args:
+            path (str): File to write
+
+        Returns:
+            int: Number of frames written
+        """
+        chunks = self.plan()
+        total = chunks[-1].first_frame + chunks[-1].frames if chunks else 0
+        frames = np.lib.format.open_memmap(path, mode="w+", dtype=np.uint8,
+                                           shape=(total, self.size[1], self.size[0], 3))
+        frames.flush()
+        del frames
+        return self._render(chunks, path, "npy")
+
+    def export(self, path: str) -> int:
+        """Render the match to a `.npy` file if the path ends in `.npy`, otherwise to a PNG sequence in a directory."""
+        if path.endswith(".npy"):
+            return self.export_npy(path)
+        return self.export_png(path)
+
+    def _render(self, chunks: List[ExportChunk], path: str, output_format: str) -> int:
+        """Render chunks across the process pool, returning the total number of frames written."""
+        if not chunks:
+            return 0
+        options = {"recording": self.recording, "size": self.size, "hold_frames": self.hold_frames,
+                   "path": path, "format": output_format}
+        with ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_worker,
+                                 initargs=(options,)) as executor:
+            return sum(executor.map(_render_chunk, chunks))
@@ -1,18 +1,42 @@
+import os
 import pygame
-import random
-from typing import Optional
+import time
+from typing import Optional, Tuple
 import logging
 from ..config import GameState, settings
 from .screens import StartScreen
 from .screens import PlayingScreen
 from .screens import BetweenPointsScreen
 from .screens import GameOverScreen
+from .screens import TimingOverlay
 from .objects import Ball
 from .objects import Paddle
+from .simulation import BASE_TICK_RATE, PaddleAction, Simulation, SimulationInputs, SimulationState
+from .timestep import FixedTimestep
+from .display import RenderBackend, ScaledDisplay
+from .profiling import FrameProfiler
+from .pacing import FramePacer
+from .recording import MatchRecorder, MatchRecording, MatchReplay
+from .rollback import SnapshotRing
+from .controllers import TrajectoryController
+from .multiball import MultiballSimulation
+from .telemetry import MatchTelemetry, TelemetryWriter
+from .results import GameResult, ResultsStore
 
 class Game:
-    def __init__(self):
-        """Initialise the PyPong game with game setup, settings configuration, and initial game state."""
+    def __init__(self, replay: Optional[MatchRecording] = None, replay_speed: float = 1.0,
+                 simulation: Optional[Simulation] = None, local_services: bool = True):
+        """
+        Initialise the PyPong game with game setup, settings configuration, and initial game state.
+
+        Args:
+            replay (MatchRecording, optional): Recorded match to play back instead of taking keyboard input.
+            replay_speed (float, optional): Playback speed multiplier for a replay. Defaults to 1.
+            simulation (Simulation, optional): Simulation to show instead of creating one (e.g. a mirror of a
+                network server's). Its playing field size and tick rate are used.
+            local_services (bool, optional): Whether to offer recording, rewinding and the computer player, and
+                to collect telemetry and results. Turn off when the game is decided elsewhere. Defaults to True.
+        """
         # Set up logging
         logging.basicConfig(level=logging.INFO,
                             format='%(asctime)s - %(levelname)s - %(message)s')
@@ -22,11 +46,31 @@ class Game:
         pygame.init()
         pygame.display.set_caption("PyPong")
 
-        # Pygame screen setup
-        self.screen_dims = settings.screen.SCREEN_DIMENSIONS
-        self.screen = pygame.display.set_mode(self.screen_dims)
-        self.clock = pygame.time.Clock()
+        # Pygame screen setup: screens draw at a fixed logical resolution, presented scaled to the window
+        # Replays and given simulations are drawn at their own playing field size, whatever the settings
+        if replay is not None:
+            self.screen_dims = tuple(replay.screen_dims)
+        elif simulation is not None:
+            self.screen_dims = tuple(simulation.screen_dims)
+        else:
+            self.screen_dims = settings.screen.LOGICAL_DIMENSIONS
+        self.display = self.create_display()
+        self.screen = self.display.surface  # None unless drawn on a surface
         self.fps = settings.screen.FPS
+        self.dirty_rects = settings.screen.DIRTY_RECTS
+        self.idle_fps = settings.screen.IDLE_FPS
+        self.last_drawn_state: Optional[GameState] = None
+
+        # Fixed-timestep physics, decoupled from the render frame rate
+        if replay is not None:
+            tick_rate = replay.tick_rate
+        elif simulation is not None:
+            tick_rate = BASE_TICK_RATE / simulation.dt
+        else:
+            tick_rate = settings.physics.TICK_RATE
+        self.timestep = FixedTimestep(tick_rate * replay_speed, settings.physics.MAX_FRAME_TIME)
+        self.previous_state: Optional[SimulationState] = None
+        self.previous_extra_balls: Tuple[Tuple[int, int], ...] = ()  # Extra ball positions before the latest tick
 
         # Screens
         self.start_screen = StartScreen(self.screen_dims)
@@ -34,72 +78,210 @@ class Game:
         self.between_points_screen = BetweenPointsScreen(self.screen_dims)
         self.game_over_screen = GameOverScreen(self.screen_dims)
 
-        # Game state management
-        self.current_state = GameState.START_SCREEN
-        self.winning_score = settings.game.WINNING_SCORE
-        self.win_by_two = settings.game.WIN_BY_TWO
-        self.winner: Optional[str] = None
+        # Frame timing instrumentation and pacing
+        self.profiler = FrameProfiler(settings.debug.TIMING_WINDOW)
+        self.pacer = FramePacer(settings.screen.FRAME_PACING, self.profiler)
+        self.timing_overlay = TimingOverlay()
+        self.show_timing_overlay = settings.debug.SHOW_TIMING_OVERLAY
 
-        # Scoring
-        self.score_p1 = 0  # p1 is left paddle
-        self.score_p2 = 0
-
-        # Game objects
+        # Headless simulation (game state, scoring and game objects)
         self.key_bindings = settings.key_bindings
-        self.ball = Ball(screen_size=self.screen_dims)
-        self.l_paddle = Paddle(left=True, screen_size=self.screen_dims) #p1
-        self.r_paddle = Paddle(left=False, screen_size=self.screen_dims)
-
-    def reset_game(self):
-        """Reset the game to its initial state."""
-        # Reset scores
-        self.score_p1 = 0
-        self.score_p2 = 0
-        self.winner = None
-        self.current_state = GameState.START_SCREEN
+        self.replay: Optional[MatchReplay] = None
+        self.recorder: Optional[MatchRecorder] = None
+        self.rewind_buffer: Optional[SnapshotRing] = None
+        if replay is not None:
+            self.simulation = replay.create_simulation()
+            self.replay = MatchReplay(replay, self.simulation)
+        elif simulation is not None:
+            self.simulation = simulation
+        elif settings.game.BALL_COUNT > 1:
+            # Recordings and rewind snapshots only hold one ball, so neither is available in multiball mode
+            self.simulation = MultiballSimulation(settings.game.BALL_COUNT, self.screen_dims,
+                                                  dt=BASE_TICK_RATE / settings.physics.TICK_RATE)
+        else:
+            self.simulation = Simulation(self.screen_dims, dt=BASE_TICK_RATE / settings.physics.TICK_RATE)
+            if local_services and settings.recording.RECORD_MATCHES:
+                self.start_recording()
+            elif local_services and settings.game.REWIND_SECONDS > 0:
+                # Rewinding would make a recording diverge from what was played, so is only offered unrecorded
+                self.rewind_buffer = SnapshotRing(max(1, round(settings.game.REWIND_SECONDS * tick_rate)))
+
+        # Replays were already played, so have no computer player and are neither measured nor stored again
+        local_services = local_services and replay is None
+
+        # Optional computer player (its presses are recorded like a player's, so replays don't need it).
+        # It only follows the ball in SimulationState, the first ball in multiball mode.
+        self.computer: Optional[TrajectoryController] = None
+        self.computer_left = settings.game.COMPUTER_PLAYER == "left"
+        if local_services and settings.game.COMPUTER_PLAYER is not None:
+            if settings.game.COMPUTER_PLAYER not in ("left", "right"):
+                raise ValueError("Computer player must be 'left', 'right' or None.")
+            self.computer = TrajectoryController(settings.game.COMPUTER_DIFFICULTY, self.screen_dims)
+
+        # Gameplay telemetry
+        self.telemetry: Optional[MatchTelemetry] = None
+        if settings.telemetry.ENABLED and local_services:
+            self.start_telemetry()
+
+        # Persistent results
+        self.results: Optional[ResultsStore] = None
+        self.result_recorded = False  # Whether the current game over has been stored
+        if settings.results.ENABLED and local_services:
+            self.start_results()
+
+        # Pixel frame capture (requires NumPy)
+        self.frame_capture = None
+        self.frame_ring = None
+        if settings.capture.CAPTURE_FRAMES:
+            self.start_capture(settings.capture.GRAYSCALE, settings.capture.DOWNSCALE,
+                               settings.capture.RING_SLOTS, settings.capture.SHARED_MEMORY_NAME)
+
+    def create_display(self) -> RenderBackend:
+        """
+        Open the window with the render backend chosen in settings.screen.RENDER_BACKEND (with vsync, if
+        frames are paced by it).
 
-        # Reset game objects
-        self.reset_objects()
+        Returns:
+            RenderBackend: Backend the screens draw with
 
-    def reset_objects(self):
-        """Reset ball and paddles. Randomised starting direction for Ball."""
-        # Paddle speeds reset to 0
-        self.l_paddle.v_speed = self.r_paddle.v_speed = 0
+        Raises:
+            ValueError: If the render backend is unknown.
+        """
+        backend = settings.screen.RENDER_BACKEND
+        # Vsync-aligned frame pacing relies on presenting waiting for the display's refresh
+        vsync = settings.screen.FRAME_PACING == "vsync"
+        if backend == "surface":
+            return ScaledDisplay(settings.screen.SCREEN_DIMENSIONS, self.screen_dims, settings.screen.RENDER_SCALE,
+                                 vsync)
+        if backend == "texture":
+            from .sdl2_backend import TextureBackend
+
+            return TextureBackend(settings.screen.SCREEN_DIMENSIONS, self.screen_dims, settings.screen.RENDER_SCALE,
+                                  settings.screen.RENDER_DRIVER, vsync)
+        raise ValueError("Render backend must be 'surface' or 'texture'.")
+
+    def start_recording(self):
+        """Record this session's inputs to a new file in settings.recording.RECORDINGS_DIR."""
+        os.makedirs(settings.recording.RECORDINGS_DIR, exist_ok=True)
+        filename = f"match_{time.strftime('%Y%m%d_%H%M%S')}_{self.simulation.seed:x}.pprc"
+        path = os.path.join(settings.recording.RECORDINGS_DIR, filename)
+        self.recorder = MatchRecorder(path, self.simulation, settings.physics.TICK_RATE)
+        self.rewind_buffer = None
+        self.logger.info(f"Recording inputs to {path}")
+
+    def start_telemetry(self):
+        """Start emitting gameplay telemetry to settings.telemetry.PATH, from a background writer thread."""
+        writer = TelemetryWriter(settings.telemetry.PATH, settings.telemetry.MAX_BYTES,
+                                 settings.telemetry.BACKUP_COUNT, settings.telemetry.BATCH_SIZE,
+                                 settings.telemetry.FLUSH_INTERVAL)
+        self.telemetry = MatchTelemetry(writer, self.simulation, settings.physics.TICK_RATE)
+        self.logger.info(f"Writing telemetry to {settings.telemetry.PATH}")
+
+    def start_results(self):
+        """Store each game's result in the SQLite database at settings.results.PATH."""
+        self.results = ResultsStore(settings.results.PATH, settings.results.BATCH_SIZE,
+                                    settings.results.FLUSH_INTERVAL)
+        self.logger.info(f"Storing results in {settings.results.PATH}")
+
+    def player_names(self) -> tuple:
+        """Return the names results are stored under for the left and right players."""
+        names = [settings.results.PLAYER_1, settings.results.PLAYER_2]
+        if self.computer is not None:
+            names[0 if self.computer_left else 1] = f"Computer ({settings.game.COMPUTER_DIFFICULTY})"
+        return tuple(names)
+
+    def game_result(self) -> GameResult:
+        """Return the result of the current game (unfinished, unless it is over)."""
+        return GameResult.from_simulation(self.simulation, *self.player_names())
+
+    def record_result(self):
+        """Store the result of the current game."""
+        self.results.add(self.game_result())
+        self.result_recorded = True
+
+    def start_capture(self, grayscale: bool = False, downscale: int = 1, slots: int = 8, name: Optional[str] = None):
+        """
+        Publish every drawn frame into a shared-memory ring buffer, for other processes to read.
 
-        # Paddles moved back to centre
-        self.l_paddle.rect.top = self.r_paddle.rect.top = (self.screen_dims[1] // 2 - self.r_paddle.rect.height // 2)
+        Args:
+            grayscale (bool, optional): Capture a single luma channel instead of RGB. Defaults to False.
+            downscale (int, optional): Factor to reduce frame width and height by. Defaults to 1.
+            slots (int, optional): Number of frames in the ring. Defaults to 8.
+            name (str, optional): Shared memory name readers attach to. Defaults to a random name, which is
+                also used if the name is already in use.
 
-        # Random starting position (on net line) and direction for ball
-        self.ball.rect.left = self.ball.screen_width // 2 - self.ball.side_length // 2
-        self.ball.rect.top = random.randint(0, self.ball.screen_height)
-        self.ball.h_speed = random.choice([-1, 1]) * 3
-        self.ball.v_speed = random.choice([-1, 1]) * 5
+        Returns:
+            SharedFrameRing: Ring the frames are published to
 
-    def update_game_objects(self):
-        """
-        Update ball position and check if edges or paddles have been hit.
-        Update paddle positions.
+        Raises:
+            ValueError: If frames are not drawn on a surface (the texture render backend).
         """
-        # Update ball and paddle positions
-        self.ball.move()
-
-        # Change direction if ball hits either side (top/bottom)
-        self.ball.check_sides_hit()
+        from .capture import FrameCapture, SharedFrameRing
+
+        if self.screen is None:
+            raise ValueError("Frame capture requires the surface render backend.")
+
+        self.frame_capture = FrameCapture(self.screen, grayscale, downscale)
+        try:
+            self.frame_ring = SharedFrameRing.create(self.frame_capture.shape, slots, name)
+        except FileExistsError:
+            # Held by another game, or left behind by one that did not close its ring
+            self.logger.warning(f"Shared memory '{name}' is already in use, publishing frames to a random name")
+            self.frame_ring = SharedFrameRing.create(self.frame_capture.shape, slots)
+        self.logger.info(f"Publishing frames to shared memory '{self.frame_ring.name}'")
+        return self.frame_ring
+
+    @property
+    def current_state(self) -> GameState:
+        """Get current game state from the simulation."""
+        return self.simulation.current_state
+
+    @current_state.setter
+    def current_state(self, value: GameState):
+        """Set current game state on the simulation."""
+        self.simulation.current_state = value
+
+    @property
+    def winner(self) -> Optional[str]:
+        """Get winner of the current game (None if game not yet won)."""
+        return self.simulation.winner
+
+    @property
+    def score_p1(self) -> int:
+        """Get Player 1 (left paddle) score."""
+        return self.simulation.score_p1
+
+    @property
+    def score_p2(self) -> int:
+        """Get Player 2 (right paddle) score."""
+        return self.simulation.score_p2
+
+    @property
+    def ball(self) -> Ball:
+        """Get the simulation's ball."""
+        return self.simulation.ball
+
+    @property
+    def l_paddle(self) -> Paddle:
+        """Get the simulation's left paddle (Player 1)."""
+        return self.simulation.l_paddle
+
+    @property
+    def r_paddle(self) -> Paddle:
+        """Get the simulation's right paddle (Player 2)."""
+        return self.simulation.r_paddle
 
-        # Change direction and speed if ball hits either paddle
-        if self.ball.h_speed < 0:
-            self.ball.check_paddle_hit(self.l_paddle)
-        else:
-            self.ball.check_paddle_hit(self.r_paddle)
+    def reset_game(self):
+        """Reset the game to its initial state."""
+        self.simulation.reset_game()
 
-        # End point if ball hits either end
-        if self.ball.check_ends_hit() == "left":
-            self.end_point("left")
-        if self.ball.check_ends_hit() == "right":
-            self.end_point("right")
+    def reset_objects(self):
+        """Reset ball and paddles. Randomised starting direction for Ball."""
+        self.simulation.reset_objects()
 
-        self.l_paddle.move()
-        self.r_paddle.move()
+    def update_game_objects(self):
+        """Advance the simulation by one tick."""
+        self.simulation.step()
 
     def end_point(self, side: str = None):
         """
@@ -108,32 +290,20 @@ class Game:
         Args:
             side (str, optional): Side which lost the point ("left" or "right").
         """
-        # Update scores and check if game won
-        if side == "left":
-            self.score_p2 += 1
-            if self.game_over_condition():
-                self.winner = "Player 2"
-                self.current_state = GameState.GAME_OVER
-            else:
-                self.current_state = GameState.BETWEEN_POINTS
-        elif side == "right":
-            self.score_p1 += 1
-            if self.game_over_condition():
-                self.winner = "Player 1"
-                self.current_state = GameState.GAME_OVER
-            else:
-                self.current_state = GameState.BETWEEN_POINTS
-        else:
-            raise ValueError(f"`end_point()` expected a string of either 'left' or 'right'")
-
-        self.reset_objects()
+        self.simulation.end_point(side)
 
     def game_over_condition(self) -> bool:
         """Check if winning conditions have been fulfilled - return a boolean."""
-        if self.score_p1 >= self.winning_score or self.score_p2 >= self.winning_score:
-            if abs(self.score_p1 - self.score_p2) >= 2:
-                return True
-        return False
+        return self.simulation.game_over_condition()
+
+    def apply_inputs(self, inputs: SimulationInputs):
+        """
+        Apply inputs from the local players (key presses) to the game.
+
+        Args:
+            inputs (SimulationInputs): Inputs to apply
+        """
+        self.simulation.apply_inputs(inputs)
 
     def _handle_start_screen_events(self, event):
         """
@@ -143,7 +313,7 @@ class Game:
             event (pygame.event.Event): Pygame event to process
         """
         if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
-            self.current_state = GameState.PLAYING
+            self.apply_inputs(SimulationInputs(advance=True))
             self.logger.info("Game started")
 
     def _handle_playing_screen_events(self, event):
@@ -154,29 +324,34 @@ class Game:
             event (pygame.event.Event): Pygame event to process
         """
         if event.type == pygame.KEYDOWN:
-            # Left paddle controls
-            if event.key == self.key_bindings.left_up:
-                if self.l_paddle.v_speed >= 0:
-                    self.l_paddle.v_speed += 2
-                else:
-                    self.l_paddle.v_speed = 0
-            elif event.key == self.key_bindings.left_down:
-                if self.l_paddle.v_speed <= 0:
-                    self.l_paddle.v_speed -= 2
+            inputs = self._inputs_from_key(event.key)
+            # Keys for the computer's paddle are ignored
+            if self.computer is not None:
+                if self.computer_left:
+                    inputs = inputs._replace(left=PaddleAction.NONE)
                 else:
-                    self.l_paddle.v_speed = 0
+                    inputs = inputs._replace(right=PaddleAction.NONE)
+            self.apply_inputs(inputs)
 
-            # Right paddle controls
-            elif event.key == self.key_bindings.right_up:
-                if self.r_paddle.v_speed >= 0:
-                    self.r_paddle.v_speed += 2
-                else:
-                    self.r_paddle.v_speed = 0
-            elif event.key == self.key_bindings.right_down:
-                if self.r_paddle.v_speed <= 0:
-                    self.r_paddle.v_speed -= 2
-                else:
-                    self.r_paddle.v_speed = 0
+    def _inputs_from_key(self, key) -> SimulationInputs:
+        """
+        Map a key press to simulation inputs using the current key bindings.
+
+        Args:
+            key (int): Pygame key constant
+
+        Returns:
+            SimulationInputs: Paddle action for the player bound to the key (no action if unbound)
+        """
+        if key == self.key_bindings.left_up:
+            return SimulationInputs(left=PaddleAction.UP)
+        elif key == self.key_bindings.left_down:
+            return SimulationInputs(left=PaddleAction.DOWN)
+        elif key == self.key_bindings.right_up:
+            return SimulationInputs(right=PaddleAction.UP)
+        elif key == self.key_bindings.right_down:
+            return SimulationInputs(right=PaddleAction.DOWN)
+        return SimulationInputs()
 
     def _handle_between_points_events(self, event):
         """
@@ -186,7 +361,7 @@ class Game:
             event (pygame.event.Event): Pygame event to process
         """
         if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
-            self.current_state = GameState.PLAYING
+            self.apply_inputs(SimulationInputs(advance=True))
             self.logger.info("Continuing to next point")
 
     def _handle_game_over_events(self, event):
@@ -197,22 +372,44 @@ class Game:
             event (pygame.event.Event): Pygame event to process
         """
         if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
-            self.reset_game()
+            self.apply_inputs(SimulationInputs(advance=True))
             self.logger.info("Restarting game")
 
-    def handle_events(self) -> bool:
+    def handle_events(self, events: Optional[list] = None) -> bool:
         """
         Handle pygame events and state transitions.
 
+        Args:
+            events (list, optional): Events to handle. Defaults to all events in the pygame event queue.
+
         Returns:
             bool: False if game should quit, True otherwise
         """
-        for event in pygame.event.get():
+        if events is None:
+            events = pygame.event.get()
+
+        for event in events:
             # Closing the game
             if event.type == pygame.QUIT:
                 return False
 
+            # Timing overlay can be toggled in any state
+            if event.type == pygame.KEYDOWN and event.key == self.key_bindings.toggle_timing_overlay:
+                self.toggle_timing_overlay()
+                continue
+
+            # Inputs come from the recording during a replay
+            if self.replay is not None:
+                continue
+
+            # Rewinding is available mid-point and straight after a point ends
+            if (event.type == pygame.KEYDOWN and event.key == self.key_bindings.rewind
+                    and self.current_state in (GameState.PLAYING, GameState.BETWEEN_POINTS)):
+                self.rewind()
+                continue
+
             # State-specific event handling
+            previous_state = self.current_state
             if self.current_state == GameState.START_SCREEN:
                 self._handle_start_screen_events(event)
             elif self.current_state == GameState.PLAYING:
@@ -222,62 +419,282 @@ class Game:
             elif self.current_state == GameState.GAME_OVER:
                 self._handle_game_over_events(event)
 
-            # Update game objects if in playing state
-            if self.current_state == GameState.PLAYING:
-                self.update_game_objects()
+            if self.telemetry is not None and self.current_state != previous_state:
+                self.telemetry.state_changed(previous_state)
 
         return True
 
+    def apply_computer_input(self, simulation: Simulation, state: SimulationState):
+        """
+        Apply the computer player's press (if any) for the next tick.
+
+        Args:
+            simulation (Simulation): Simulation to apply the press to
+            state (SimulationState): State before the tick
+        """
+        action = self.computer(state, self.computer_left)
+        if action == PaddleAction.NONE:
+            return
+        if self.computer_left:
+            simulation.apply_inputs(SimulationInputs(left=action))
+        else:
+            simulation.apply_inputs(SimulationInputs(right=action))
+
+    def run_tick(self, simulation: Simulation) -> Optional[SimulationState]:
+        """
+        Run one physics tick: apply any recorded inputs due (during a replay), save a rewind snapshot, apply
+        the computer player's press and step the simulation.
+
+        Args:
+            simulation (Simulation): Simulation to advance (the game's own, or `ThreadedGame`'s engine)
+
+        Returns:
+            SimulationState or None: State before the tick, or None if no tick was run (outside the PLAYING
+                state, or at the end of a replay)
+        """
+        if self.replay is not None:
+            # Replay stops (frozen on its final state) at the end of the recording
+            self.replay.apply_due_inputs()
+            if self.replay.finished:
+                return None
+        if simulation.current_state != GameState.PLAYING:
+            return None
+
+        if self.rewind_buffer is not None:
+            self.rewind_buffer.save(simulation)
+        state = simulation.get_state()
+        if self.computer is not None:
+            self.apply_computer_input(simulation, state)
+        simulation.step()
+        return state
+
+    def rewind(self, seconds: Optional[float] = None) -> int:
+        """
+        Instantly restore the game to how it was a number of seconds ago (at most settings.game.REWIND_SECONDS).
+
+        Args:
+            seconds (float, optional): How far to go back. Defaults to settings.game.REWIND_SECONDS.
+
+        Returns:
+            int: Number of physics ticks rewound (0 if rewinding is disabled or nothing has been played yet)
+        """
+        if self.rewind_buffer is None:
+            return 0
+        if seconds is None:
+            seconds = settings.game.REWIND_SECONDS
+        ticks = self.rewind_buffer.rewind(self.simulation, round(seconds * self.timestep.tick_rate))
+        if ticks:
+            # Nothing to interpolate from, and no catching up on the time before the rewind
+            self.previous_state = None
+            self.timestep.reset()
+            self.playing_screen.invalidate()
+            if self.telemetry is not None:
+                self.telemetry.rewound(ticks)
+            self.logger.info(f"Rewound {ticks / self.timestep.tick_rate:.1f} seconds")
+        return ticks
+
+    def toggle_timing_overlay(self):
+        """Show or hide the frame timing overlay."""
+        self.show_timing_overlay = not self.show_timing_overlay
+        # Playing screen must be fully redrawn to remove the overlay
+        self.playing_screen.invalidate()
+
+    def wait_for_events(self) -> list:
+        """
+        Block until an event arrives, or the idle redraw interval passes (settings.screen.IDLE_FPS).
+
+        Used on static screens, which only change in response to input, instead of redrawing at full FPS.
+
+        Returns:
+            list: Pending events (empty if the wait timed out)
+        """
+        timeout = 1000 // self.idle_fps if self.idle_fps > 0 else 0
+        event = pygame.event.wait(timeout)
+        if event.type == pygame.NOEVENT:
+            return pygame.event.get()
+        return [event] + pygame.event.get()
+
+    def update_physics(self):
+        """
+        Run however many fixed physics ticks are due since the last frame.
+
+        Stores the state before the latest tick so the playing screen can interpolate between ticks.
+        Ticks stop early if a point ends, and no ticks are run outside the PLAYING state.
+        During a replay, recorded inputs are applied before each tick.
+        """
+        # Don't catch up on time spent on other screens
+        if self.last_drawn_state != GameState.PLAYING:
+            self.timestep.reset()
+        ticks = self.timestep.advance()
+
+        if self.replay is not None:
+            self.replay.apply_due_inputs()
+
+        if self.current_state != GameState.PLAYING:
+            self.previous_state = None
+            return
+
+        for _ in range(ticks):
+            previous_extra_balls = tuple(ball.rect.topleft for ball in getattr(self.simulation, "extra_balls", ()))
+            previous_state = self.run_tick(self.simulation)
+            if previous_state is None:
+                break
+            self.previous_state, self.previous_extra_balls = previous_state, previous_extra_balls
+            if self.current_state != GameState.PLAYING:
+                self.previous_state = None
+                break
+
+    @property
+    def alpha(self) -> float:
+        """Get the interpolation factor between the previous and current physics tick, for drawing."""
+        return self.timestep.alpha
+
     def draw_start_screen(self):
         """Render start screen."""
-        self.start_screen.render(self.screen, self.key_bindings)
+        self.start_screen.render(self.display, self.key_bindings)
 
-    def draw_playing_screen(self):
-        """Render playing screen."""
-        self.playing_screen.render(self.screen, self.ball, self.l_paddle, self.r_paddle)
+    def draw_playing_screen(self) -> Optional[list]:
+        """
+        Render playing screen.
+
+        Returns:
+            list or None: Changed screen rects if dirty-rect rendering is enabled, otherwise None
+        """
+        extra_balls = getattr(self.simulation, "extra_balls", ())
+        if not self.dirty_rects or not self.display.partial_updates:
+            self.playing_screen.render(self.display, self.ball, self.l_paddle, self.r_paddle,
+                                       self.previous_state, self.alpha, extra_balls, self.previous_extra_balls)
+            return None
+
+        # Whole screen must be redrawn if another screen was shown last frame
+        if self.last_drawn_state != GameState.PLAYING:
+            self.playing_screen.invalidate()
+        return self.playing_screen.render_dirty(self.display, self.ball, self.l_paddle, self.r_paddle,
+                                                self.previous_state, self.alpha, extra_balls,
+                                                self.previous_extra_balls)
 
     def draw_between_points_screen(self):
         """Render between points screen."""
         self.between_points_screen.render(
-            self.screen,
+            self.display,
             (self.score_p1, self.score_p2),
         )
 
     def draw_game_over_screen(self):
         """Render game over screen."""
         self.game_over_screen.render(
-            self.screen,
+            self.display,
             self.winner,
             (self.score_p1, self.score_p2)
         )
 
-    def run(self):
-        """Main game loop."""
-        running = True
-        while running:
-            # Handle events
-            running = self.handle_events()
+    def draw_screen(self) -> Optional[list]:
+        """
+        Render the screen for the current state, timed under the name of its draw method.
 
-            # Draw screen based on current state
-            if self.current_state == GameState.START_SCREEN:
-                self.draw_start_screen()
-            elif self.current_state == GameState.PLAYING:
-                self.update_game_objects()
-                self.draw_playing_screen()
-            elif self.current_state == GameState.BETWEEN_POINTS:
-                self.draw_between_points_screen()
-            elif self.current_state == GameState.GAME_OVER:
-                self.draw_game_over_screen()
+        Returns:
+            list or None: Changed screen rects if only part of the screen was redrawn, otherwise None
+        """
+        if self.current_state == GameState.START_SCREEN:
+            draw = self.draw_start_screen
+        elif self.current_state == GameState.PLAYING:
+            draw = self.draw_playing_screen
+        elif self.current_state == GameState.BETWEEN_POINTS:
+            draw = self.draw_between_points_screen
+        else:
+            draw = self.draw_game_over_screen
+
+        with self.profiler.measure(draw.__name__):
+            return draw()
+
+    def run_frame(self) -> bool:
+        """
+        Run one iteration of the main loop: handle events, advance physics, draw, present and control frame rate.
+
+        Returns:
+            bool: False if game should quit, True otherwise
+        """
+        frame_start = time.perf_counter()
+
+        # Handle events, blocking while an unchanged static screen is shown
+        events = None
+        if (self.current_state != GameState.PLAYING and self.current_state == self.last_drawn_state
+                and self.replay is None):
+            with self.profiler.measure("idle_wait"):
+                events = self.wait_for_events()
+            # Time spent waiting for input is not part of the frame schedule
+            self.pacer.reset()
+        with self.profiler.measure("events"):
+            if events is None:
+                events = pygame.event.get()
+            if any(event.type == pygame.KEYDOWN for event in events):
+                self.pacer.input_received()
+            running = self.handle_events(events)
+
+        # Advance physics at the fixed tick rate (independent of frame rate)
+        with self.profiler.measure("physics"):
+            self.update_physics()
+
+        # Store each result before the game can be reset
+        if self.results is not None:
+            if self.current_state == GameState.GAME_OVER:
+                if not self.result_recorded:
+                    self.record_result()
+            else:
+                self.result_recorded = False
+
+        # Draw screen based on current state
+        dirty_rects = self.draw_screen()
+        self.last_drawn_state = self.current_state
+
+        if self.show_timing_overlay:
+            overlay_rect = self.timing_overlay.render(self.display, self.profiler)
+            if dirty_rects is not None:
+                dirty_rects.append(overlay_rect)
+
+        if self.frame_ring is not None:
+            with self.profiler.measure("capture"):
+                self.frame_capture.publish(self.frame_ring)
 
-            # Update display
-            pygame.display.flip()
+        # Update display (only the changed areas, if known)
+        with self.profiler.measure("present"):
+            self.display.present(dirty_rects)
+        self.pacer.presented()
 
-            # Clear event queue
-            pygame.event.clear()
+        # Clear event queue
+        pygame.event.clear()
 
-            # Control frame rate
-            self.clock.tick(self.fps)
+        # Control frame rate
+        with self.profiler.measure("sleep"):
+            self.pacer.wait(self.fps)
+
+        frame_time = time.perf_counter() - frame_start
+        self.profiler.record("frame", frame_time)
+        if self.telemetry is not None:
+            self.telemetry.frame(frame_time)
+        return running
+
+    def run(self):
+        """Main game loop."""
+        running = True
+        self.timestep.reset()
+        while running:
+            running = self.run_frame()
+        self.close()
+
+    def close(self):
+        """Finish writing the recording, shared frames, telemetry and results, and quit pygame."""
+        if self.results is not None:
+            if self.current_state in (GameState.PLAYING, GameState.BETWEEN_POINTS):
+                # Quit mid-game
+                self.record_result()
+            self.results.close()
+        if self.recorder is not None:
+            self.recorder.close()
+        if self.frame_ring is not None:
+            self.frame_ring.close()
+        if self.telemetry is not None:
+            self.telemetry.close()
 
         # Quit the game
         pygame.quit()
-
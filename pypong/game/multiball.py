@@ -0,0 +1,185 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+import pygame
+from ..config import GameState
+from .objects import Ball
+from .simulation import Simulation
+
+# Side length of spatial hash cells, about twice the default ball size
+CELL_SIZE = 24
+
+def find_overlapping_pairs(rects: Sequence[pygame.Rect], cell_size: int = CELL_SIZE) -> List[Tuple[int, int]]:
+    """
+    Find every pair of overlapping rects with a spatial hash broadphase.
+
+    Each rect is added to the grid cells it covers, and is only tested against rects already in those
+    cells, so the cost grows with the number of rects and how crowded each cell is, rather than with
+    every pair. Unlike sorting along one axis, this stays fast when many rects share an x-interval
+    (e.g. balls all served from the net).
+
+    Args:
+        rects (sequence): Rects to test
+        cell_size (int, optional): Side length of grid cells. Defaults to CELL_SIZE.
+
+    Returns:
+        list: (i, j) index pairs of overlapping rects, with i < j
+    """
+    cells: Dict[Tuple[int, int], List[int]] = {}
+    pairs = []
+    for i, rect in enumerate(rects):
+        x0, x1 = rect.left // cell_size, (rect.right - 1) // cell_size
+        y0, y1 = rect.top // cell_size, (rect.bottom - 1) // cell_size
+        # A rect covering several cells can meet the same rect in more than one of them
+        found = set() if x0 != x1 or y0 != y1 else None
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [i]
+                    continue
+                for j in bucket:
+                    if rect.colliderect(rects[j]):
+                        if found is not None:
+                            if j in found:
+                                continue
+                            found.add(j)
+                        pairs.append((j, i))
+                bucket.append(i)
+    return pairs
+
+
+class MultiballSimulation(Simulation):
+    def __init__(self, ball_count: int = 8, screen_dims: Optional[Tuple[int, int]] = None,
+                 winning_score: Optional[int] = None, win_by_two: Optional[bool] = None, seed: Optional[int] = None,
+                 dt: float = 1.0, ball_collisions: bool = True):
+        """
+        Initialise a simulation with many balls in play at once.
+
+        Every ball that leaves an end scores a point and is served again straight away from the net, so
+        play only stops when the game is won. Each tick, all balls and both paddles go through one
+        spatial hash broadphase (`find_overlapping_pairs()`), and only the overlapping pairs it finds are
+        resolved: a ball bounces off a paddle as in `Ball.check_paddle_hit()`, and two balls exchange
+        speeds along the axis they collided on.
+
+        `self.ball` is the first of `self.balls`, and is the only ball in `SimulationState` snapshots.
+
+        Args:
+            ball_count (int, optional): Number of balls. Defaults to 8.
+            screen_dims (tuple, optional): Playing field dimensions. Defaults to settings.screen.LOGICAL_DIMENSIONS.
+            winning_score (int, optional): Score required to win. Defaults to settings.game.WINNING_SCORE.
+            win_by_two (bool, optional): Whether a winning margin of 2 is required. Defaults to settings.game.WIN_BY_TWO.
+            seed (int, optional): Seed for the random ball starting positions and directions.
+            dt (float, optional): Length of each step in base ticks (1/BASE_TICK_RATE seconds). Defaults to 1.
+            ball_collisions (bool, optional): Whether balls bounce off each other. Defaults to True.
+
+        Raises:
+            ValueError: If ball_count is not a positive integer.
+        """
+        if not isinstance(ball_count, int) or ball_count < 1:
+            raise ValueError("Ball count must be a positive integer.")
+        super().__init__(screen_dims, winning_score, win_by_two, seed, dt, swept_collisions=False)
+        self.ball_collisions = ball_collisions
+        self.extra_balls = [Ball(color=self.ball.color, screen_size=self.screen_dims) for _ in range(ball_count - 1)]
+        self.balls = [self.ball] + self.extra_balls
+        for ball in self.extra_balls:
+            self.serve_ball(ball)
+
+        # Broadphase statistics for the latest tick
+        self.overlapping_pairs = 0
+
+    def reset_objects(self):
+        """Reset paddles, and serve every ball."""
+        super().reset_objects()
+        for ball in self.extra_balls:
+            self.serve_ball(ball)
+
+    def update_game_objects(self):
+        """
+        Move every ball, bouncing off the sides, paddles and other balls, score balls that reach either end
+        and move the paddles.
+        """
+        for ball in self.balls:
+            ball.move(self.dt, self.tick)
+            ball.check_sides_hit()
+
+        self.resolve_collisions()
+
+        for ball in self.balls:
+            side = ball.check_ends_hit()
+            if side:
+                self.score_ball(ball, side)
+                if self.current_state == GameState.GAME_OVER:
+                    return
+
+        self.l_paddle.move(self.dt, self.tick)
+        self.r_paddle.move(self.dt, self.tick)
+
+    def resolve_collisions(self):
+        """Bounce balls off paddles and each other, for the overlapping pairs found by the broadphase."""
+        # Paddles are the first two rects, so in any pair containing a paddle it is found by its index
+        paddles = (self.l_paddle, self.r_paddle)
+        rects = [self.l_paddle.rect, self.r_paddle.rect]
+        rects.extend(ball.rect for ball in self.balls)
+        pairs = find_overlapping_pairs(rects)
+        self.overlapping_pairs = len(pairs)
+
+        for i, j in pairs:
+            if i < 2 or j < 2:
+                if i < 2 and j < 2:
+                    continue
+                paddle, ball = (paddles[i], self.balls[j - 2]) if i < 2 else (paddles[j], self.balls[i - 2])
+                # Only bounce a ball travelling towards the paddle (as `Ball.check_paddle_hit()` is only
+                # checked against the paddle the ball is moving towards)
+                if (ball.h_speed < 0) == paddle.left:
+                    ball.bounce_off_paddle()
+                    self.hits += 1
+                    self.rally_hits += 1
+                    if self.telemetry is not None:
+                        self.telemetry.paddle_hit(ball)
+            elif self.ball_collisions:
+                self.bounce_balls(self.balls[i - 2], self.balls[j - 2])
+
+    @staticmethod
+    def bounce_balls(a: Ball, b: Ball):
+        """
+        Bounce two overlapping balls off each other.
+
+        The balls are equal squares, so they collide along the axis they overlap least on, and (as equal
+        masses in an elastic collision) exchange speeds along it. Balls already moving apart are left alone.
+
+        Args:
+            a (Ball): First ball
+            b (Ball): Second ball
+        """
+        overlap_x = min(a.rect.right, b.rect.right) - max(a.rect.left, b.rect.left)
+        overlap_y = min(a.rect.bottom, b.rect.bottom) - max(a.rect.top, b.rect.top)
+        if overlap_x <= overlap_y:
+            if (b.rect.x - a.rect.x) * (b.h_speed - a.h_speed) < 0:
+                a.h_speed, b.h_speed = b.h_speed, a.h_speed
+        else:
+            if (b.rect.y - a.rect.y) * (b.v_speed - a.v_speed) < 0:
+                a.v_speed, b.v_speed = b.v_speed, a.v_speed
+
+    def score_ball(self, ball: Ball, side: str):
+        """
+        Update the score for a ball that reached an end, then serve it again (or end the game if won).
+
+        Args:
+            ball (Ball): Ball that reached an end
+            side (str): Side which lost the point ("left" or "right")
+        """
+        if side == "left":
+            self.score_p2 += 1
+        else:
+            self.score_p1 += 1
+
+        if self.game_over_condition():
+            self.winner = "Player 1" if self.score_p1 > self.score_p2 else "Player 2"
+            self.current_state = GameState.GAME_OVER
+
+        self.end_rally()
+        if self.telemetry is not None:
+            self.telemetry.point_ended(side)
+        if self.current_state == GameState.GAME_OVER:
+            self.reset_objects()
+        else:
+            self.serve_ball(ball)
@@ -0,0 +1,4 @@
+from .client import NetworkClient, NetworkGame
+from .host import HostedMatch, MatchHost
+from .protocol import DEFAULT_PORT, NetInput
+from .server import GameServer, MatchSession
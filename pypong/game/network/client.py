@@ -0,0 +1,248 @@
+import logging
+import select
+import socket
+import struct
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+from ...config import GameState
+from ..game import Game
+from ..objects import Paddle
+from ..simulation import BASE_TICK_RATE, PaddleAction, Simulation, SimulationInputs, SimulationState
+from .protocol import (JOIN, MAX_PACKET_SIZE, PROTOCOL_VERSION, WELCOME, InputPacketRecord, MessageType, NetInput,
+                       decode_snapshot, encode_inputs, values_to_state)
+
+SNAPSHOT_HISTORY = 64  # Received snapshots kept as delta baselines
+MAX_PREDICTION_SECONDS = 0.25  # Furthest the mirror is predicted ahead of the latest snapshot
+
+class NetworkClient:
+    def __init__(self, server_address: Tuple[str, int]):
+        """
+        Initialise a client of a `GameServer`, predicting its own paddle locally.
+
+        The client keeps a mirror `Simulation` holding the latest server state. Its own paddle responds to
+        presses immediately: each press is applied locally, numbered and sent (and resent until the server
+        acknowledges it). When a snapshot arrives, the mirror is reset to the server's state and any inputs
+        the server has not yet applied are replayed on top, re-simulating the paddle up to the client's
+        current tick, so mispredictions are corrected without discarding recent presses. The client's tick
+        is kept within MAX_PREDICTION_SECONDS of the server's, so it cannot run away while the server is
+        paused (e.g. waiting for the other player to rejoin).
+
+        Args:
+            server_address (tuple): Server (host, port)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.server_address = server_address
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.bind(("", 0))
+        self.socket.setblocking(False)
+
+        # Set by connect()
+        self.side: Optional[int] = None
+        self.tick_rate: Optional[int] = None
+        self.max_prediction_ticks = 0
+        self.simulation: Optional[Simulation] = None
+
+        self.next_input = 1
+        self.pending: List[InputPacketRecord] = []
+        self.snapshots: "OrderedDict[int, Tuple[int, ...]]" = OrderedDict()
+        self.latest_snapshot = 0
+        self.server_state: Optional[SimulationState] = None
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+    def connect(self, timeout: float = 5.0, retry_interval: float = 0.25):
+        """
+        Join the server, retrying until it answers.
+
+        Args:
+            timeout (float, optional): Seconds to keep trying. Defaults to 5.
+            retry_interval (float, optional): Seconds between JOIN requests. Defaults to 0.25.
+
+        Raises:
+            ConnectionError: If the server is full or does not answer within the timeout.
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            self._send(JOIN.pack(MessageType.JOIN, PROTOCOL_VERSION))
+            ready, _, _ = select.select([self.socket], [], [], retry_interval)
+            if not ready:
+                continue
+            self.receive()
+            if self.simulation is not None:
+                return
+        raise ConnectionError(f"No response from server at {self.server_address[0]}:{self.server_address[1]}.")
+
+    @property
+    def paddle(self) -> Paddle:
+        """The paddle this client controls, in the mirror simulation."""
+        return self.simulation.l_paddle if self.side == 0 else self.simulation.r_paddle
+
+    def press(self, action: NetInput):
+        """
+        Press a key: predict its effect on this client's paddle immediately and send it to the server.
+
+        Args:
+            action (NetInput): UP, DOWN or ADVANCE
+        """
+        record = InputPacketRecord(self.next_input, self.simulation.tick, action)
+        self.next_input += 1
+        self.pending.append(record)
+        self._predict(record)
+        self.send_inputs()
+
+    def _predict(self, record: InputPacketRecord):
+        """Apply an input's effect on this client's paddle to the mirror (presses only count while playing)."""
+        if record.action != NetInput.ADVANCE and self.simulation.current_state == GameState.PLAYING:
+            action = PaddleAction.UP if record.action == NetInput.UP else PaddleAction.DOWN
+            Simulation.apply_paddle_action(self.paddle, action)
+
+    def send_inputs(self):
+        """Send unacknowledged inputs, and acknowledge the latest snapshot received."""
+        self._send(encode_inputs(self.latest_snapshot, self.pending))
+
+    def tick(self):
+        """Advance the predicted paddle one tick, and send inputs (which also keeps the connection alive)."""
+        if self.simulation.current_state == GameState.PLAYING:
+            self.paddle.move(self.simulation.dt, self.simulation.tick)
+        self.simulation.tick += 1
+        self.send_inputs()
+
+    def receive(self) -> bool:
+        """
+        Handle every datagram waiting on the socket.
+
+        Returns:
+            bool: True if a newer snapshot was received
+        """
+        updated = False
+        while True:
+            try:
+                data, _ = self.socket.recvfrom(MAX_PACKET_SIZE)
+            except (BlockingIOError, InterruptedError):
+                return updated
+            except ConnectionResetError:
+                continue
+            self.bytes_received += len(data)
+            try:
+                updated |= self._handle_datagram(data)
+            except (struct.error, ValueError, IndexError):
+                self.logger.debug("Ignoring malformed datagram from server")
+
+    def _handle_datagram(self, data: bytes) -> bool:
+        """Handle one datagram from the server, returning True if it was a newer snapshot."""
+        message = data[0]
+        if message == MessageType.WELCOME:
+            if self.simulation is None:
+                _, self.side, width, height, winning_score, self.tick_rate = WELCOME.unpack_from(data)
+                self.simulation = Simulation((width, height), winning_score=winning_score,
+                                             dt=BASE_TICK_RATE / self.tick_rate)
+                self.max_prediction_ticks = max(1, round(self.tick_rate * MAX_PREDICTION_SECONDS))
+                self.logger.info(f"Connected as Player {self.side + 1}")
+        elif message == MessageType.FULL:
+            raise ConnectionError("Server already has two players.")
+        elif message == MessageType.SNAPSHOT and self.simulation is not None:
+            decoded = decode_snapshot(data, self.snapshots)
+            if decoded is None:
+                return False
+            sequence, input_ack, values = decoded
+            self.snapshots[sequence] = values
+            while len(self.snapshots) > SNAPSHOT_HISTORY:
+                self.snapshots.popitem(last=False)
+            # Snapshots can arrive out of order - only the newest is applied
+            if sequence > self.latest_snapshot:
+                self.latest_snapshot = sequence
+                self._reconcile(values_to_state(values), input_ack)
+                return True
+        return False
+
+    def _reconcile(self, state: SimulationState, input_ack: int):
+        """
+        Reset the mirror to an authoritative server state, then replay inputs the server has not applied yet.
+
+        Args:
+            state (SimulationState): Server state
+            input_ack (int): Sequence of the last of this client's inputs the server has applied
+        """
+        self.server_state = state
+        self.pending = [record for record in self.pending if record.sequence > input_ack]
+        # Ticks the server has not run (e.g. while paused) are not predicted
+        predicted_tick = min(max(self.simulation.tick, state.tick), state.tick + self.max_prediction_ticks)
+        self.simulation.set_state(state)
+
+        # Re-simulate this client's paddle from the server tick up to the predicted tick
+        replay = iter(self.pending)
+        record = next(replay, None)
+        for tick in range(state.tick, predicted_tick):
+            while record is not None and record.tick <= tick:
+                self._predict(record)
+                record = next(replay, None)
+            if self.simulation.current_state == GameState.PLAYING:
+                self.paddle.move(self.simulation.dt, tick)
+        while record is not None:
+            self._predict(record)
+            record = next(replay, None)
+        self.simulation.tick = predicted_tick
+
+    def _send(self, payload: bytes):
+        """Send a datagram to the server, ignoring transient socket errors."""
+        try:
+            self.bytes_sent += self.socket.sendto(payload, self.server_address)
+        except (BlockingIOError, InterruptedError, ConnectionResetError):
+            pass
+
+    def close(self):
+        """Tell the server this client is leaving, and close the socket."""
+        self._send(bytes([MessageType.LEAVE]))
+        self.socket.close()
+
+
+class NetworkGame(Game):
+    def __init__(self, client: NetworkClient):
+        """
+        Initialise the game window for a networked match, driven by a connected `NetworkClient`.
+
+        Drawing and key handling are as for a local `Game`, except that the mirror simulation is shown,
+        and either player's up/down keys (and SPACE) are sent to the server for this client's paddle.
+
+        Args:
+            client (NetworkClient): Connected client
+        """
+        # The server's state is authoritative, and both paddles are played over the network
+        super().__init__(simulation=client.simulation, local_services=False)
+        self.client = client
+        # Static screens can change when the other player presses SPACE, so check for snapshots every tick
+        self.idle_fps = client.tick_rate
+
+    def apply_inputs(self, inputs: SimulationInputs):
+        """
+        Send the local player's inputs to the server (either player's keys control this client's paddle).
+
+        Args:
+            inputs (SimulationInputs): Inputs to send
+        """
+        if inputs.advance:
+            self.client.press(NetInput.ADVANCE)
+        for action in (inputs.left, inputs.right):
+            if action == PaddleAction.UP:
+                self.client.press(NetInput.UP)
+            elif action == PaddleAction.DOWN:
+                self.client.press(NetInput.DOWN)
+
+    def update_physics(self):
+        """Apply the latest server snapshot, then advance the predicted paddle by the ticks due."""
+        self.client.receive()
+        ticks = self.timestep.advance()
+        self.previous_state = None
+        for _ in range(ticks):
+            self.previous_state = self.simulation.get_state()
+            self.client.tick()
+        if self.current_state != GameState.PLAYING:
+            self.previous_state = None
+
+    def run(self):
+        """Main game loop, leaving the server on exit."""
+        try:
+            super().run()
+        finally:
+            self.client.close()
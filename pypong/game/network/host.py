@@ -0,0 +1,239 @@
+import asyncio
+import logging
+import time
+from itertools import count
+from typing import Dict, Iterable, Optional, Tuple
+from ...config import settings
+from ..simulation import BASE_TICK_RATE, Simulation, SimulationState
+from .protocol import DEFAULT_PORT, MessageType, NetInput
+from .server import MatchSession
+
+class HostedMatch:
+    def __init__(self, match_id: int, session: MatchSession):
+        """
+        Initialise a match run by a `MatchHost`.
+
+        Inputs for locally controlled paddles are queued with `submit()` (or put on `inputs` directly) and
+        applied at the start of the match's next tick, in the order they were queued.
+
+        Args:
+            match_id (int): Match identifier within the host
+            session (MatchSession): Authoritative state of the match
+        """
+        self.match_id = match_id
+        self.session = session
+        self.simulation = session.simulation
+        self.inputs: asyncio.Queue = asyncio.Queue()  # (side, NetInput) from in-process controllers
+        self._ticked = asyncio.Event()
+
+    @property
+    def state(self) -> SimulationState:
+        """Current state of the match."""
+        return self.simulation.get_state()
+
+    def submit(self, side: int, action: NetInput):
+        """
+        Queue an input for a locally controlled paddle.
+
+        Args:
+            side (int): Paddle the input is for (0 left, 1 right)
+            action (NetInput): UP, DOWN or ADVANCE
+        """
+        self.inputs.put_nowait((side, action))
+
+    async def next_state(self) -> SimulationState:
+        """Wait for the match's next tick, and return the state after it."""
+        ticked = self._ticked
+        await ticked.wait()
+        return self.simulation.get_state()
+
+    def tick(self):
+        """Apply queued inputs, advance the match one tick and wake anything waiting on `next_state()`."""
+        while not self.inputs.empty():
+            side, action = self.inputs.get_nowait()
+            self.session.apply_input(side, action)
+        self.session.tick()
+
+        self._ticked.set()
+        self._ticked = asyncio.Event()
+
+
+class _HostProtocol(asyncio.DatagramProtocol):
+    """Passes datagrams from the host's UDP endpoint to the host."""
+    def __init__(self, host: "MatchHost"):
+        self.host = host
+
+    def datagram_received(self, data: bytes, address: Tuple[str, int]):
+        self.host.route_datagram(data, address)
+
+
+class MatchHost:
+    def __init__(self, tick_rate: Optional[int] = None, snapshot_interval: int = 1, client_timeout: float = 10.0,
+                 max_matches: Optional[int] = None):
+        """
+        Initialise a host running many independent matches in one process, on one asyncio event loop.
+
+        Every match is a headless `Simulation` (the `Game` state machine without a window) advanced by a
+        single shared scheduler, `run()`, rather than each match having its own loop and clock. Inputs come
+        from in-process queues (`HostedMatch.submit()`) or from `NetworkClient`s over one shared UDP
+        endpoint (`serve_udp()`), where each joining client is paired into the first match with a free
+        paddle.
+
+        Args:
+            tick_rate (int, optional): Physics ticks per second for every match. Defaults to settings.physics.TICK_RATE.
+            snapshot_interval (int, optional): Ticks between snapshots sent to clients. Defaults to 1.
+            client_timeout (float, optional): Seconds of silence after which a client is dropped. Defaults to 10.
+            max_matches (int, optional): Maximum concurrent matches. Defaults to no limit.
+        """
+        self.logger = logging.getLogger(__name__)
+        self.tick_rate = tick_rate if tick_rate is not None else settings.physics.TICK_RATE
+        self.dt = 1.0 / self.tick_rate
+        self.snapshot_interval = snapshot_interval
+        self.client_timeout = client_timeout
+        self.max_matches = max_matches
+
+        self.matches: Dict[int, HostedMatch] = {}
+        self._match_ids = count(1)
+        self.client_matches: Dict[Tuple[str, int], HostedMatch] = {}
+        self.transport: Optional[asyncio.DatagramTransport] = None
+        self.address: Optional[Tuple[str, int]] = None
+
+        # Scheduler statistics
+        self.ticks = 0
+        self.last_tick_time = 0.0
+        self.overruns = 0
+        self._running = False
+
+    def create_match(self, local_sides: Iterable[int] = (0, 1), seed: Optional[int] = None,
+                     winning_score: Optional[int] = None) -> HostedMatch:
+        """
+        Start a new match.
+
+        Args:
+            local_sides (iterable, optional): Paddles controlled through in-process queues. Any others are
+                left for network clients to join. Defaults to both.
+            seed (int, optional): Simulation seed
+            winning_score (int, optional): Score required to win. Defaults to settings.game.WINNING_SCORE.
+
+        Returns:
+            HostedMatch: The new match
+
+        Raises:
+            RuntimeError: If the host already runs the maximum number of matches.
+        """
+        if self.max_matches is not None and len(self.matches) >= self.max_matches:
+            raise RuntimeError(f"Host is already running the maximum of {self.max_matches} matches.")
+
+        simulation = Simulation(winning_score=winning_score, seed=seed, dt=BASE_TICK_RATE / self.tick_rate)
+        session = MatchSession(simulation, self.tick_rate, self._send, self.snapshot_interval,
+                               self.client_timeout, local_sides)
+        match = HostedMatch(next(self._match_ids), session)
+        self.matches[match.match_id] = match
+        return match
+
+    def remove_match(self, match_id: int):
+        """Stop running a match, forgetting any clients connected to it."""
+        match = self.matches.pop(match_id, None)
+        if match is None:
+            return
+        for address in match.session.clients:
+            self.client_matches.pop(address, None)
+
+    def route_datagram(self, data: bytes, address: Tuple[str, int]):
+        """
+        Pass a datagram to the match its sender belongs to, pairing new clients into matches as they join.
+
+        Args:
+            data (bytes): Datagram payload
+            address (tuple): Sender's (host, port)
+        """
+        if not data:
+            return
+        match = self.client_matches.get(address)
+        if match is None:
+            if data[0] != MessageType.JOIN:
+                return
+            match = next((m for m in self.matches.values() if m.session.free_sides), None)
+            if match is None:
+                try:
+                    match = self.create_match(local_sides=())
+                except RuntimeError:
+                    self._send(bytes([MessageType.FULL]), address)
+                    return
+            self.client_matches[address] = match
+
+        match.session.handle_datagram(data, address)
+        if address not in match.session.clients:
+            # Client left (or its join was refused)
+            del self.client_matches[address]
+            self._remove_if_abandoned(match)
+
+    def _remove_if_abandoned(self, match: HostedMatch):
+        """Remove a network match once every player has left or timed out."""
+        if not match.session.clients and not match.session.local_sides:
+            self.remove_match(match.match_id)
+
+    def _send(self, payload: bytes, address: Tuple[str, int]):
+        """Send a datagram from the host's UDP endpoint (if serving)."""
+        if self.transport is not None:
+            self.transport.sendto(payload, address)
+
+    async def serve_udp(self, host: str = "0.0.0.0", port: int = DEFAULT_PORT) -> Tuple[str, int]:
+        """
+        Accept `NetworkClient`s on a UDP endpoint shared by every match.
+
+        Args:
+            host (str, optional): Address to listen on. Defaults to all interfaces.
+            port (int, optional): UDP port (0 picks a free port). Defaults to DEFAULT_PORT.
+
+        Returns:
+            tuple: Address the endpoint is bound to
+        """
+        loop = asyncio.get_running_loop()
+        self.transport, _ = await loop.create_datagram_endpoint(lambda: _HostProtocol(self), local_addr=(host, port))
+        self.address = self.transport.get_extra_info("sockname")
+        self.logger.info(f"Hosting matches on {self.address[0]}:{self.address[1]}")
+        return self.address
+
+    def tick(self):
+        """Advance every match one tick, and forget clients that have timed out or left."""
+        for match in list(self.matches.values()):
+            had_clients = bool(match.session.clients)
+            match.tick()
+            if had_clients and not match.session.clients:
+                self._remove_if_abandoned(match)
+
+        for address, match in list(self.client_matches.items()):
+            if address not in match.session.clients:
+                del self.client_matches[address]
+
+    async def run(self):
+        """
+        Tick every match at the tick rate until `stop()` is called.
+
+        If a tick overruns so far that the host falls more than settings.physics.MAX_FRAME_TIME behind,
+        the missed ticks are skipped rather than run back to back.
+        """
+        loop = asyncio.get_running_loop()
+        self._running = True
+        next_tick = loop.time()
+        while self._running:
+            started = time.perf_counter()
+            self.tick()
+            self.ticks += 1
+            self.last_tick_time = time.perf_counter() - started
+
+            next_tick += self.dt
+            now = loop.time()
+            if now - next_tick > settings.physics.MAX_FRAME_TIME:
+                self.overruns += 1
+                next_tick = now
+            # Always yield, so datagrams and in-process controllers are serviced between ticks
+            await asyncio.sleep(max(0.0, next_tick - now))
+
+    def stop(self):
+        """Stop the scheduler after the current tick, and close the UDP endpoint."""
+        self._running = False
+        if self.transport is not None:
+            self.transport.close()
+            self.transport = None
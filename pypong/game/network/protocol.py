@@ -0,0 +1,143 @@
+import struct
+from enum import IntEnum
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from ...config import GameState
+from ..simulation import WINNERS, SimulationState
+
+PROTOCOL_VERSION = 1
+DEFAULT_PORT = 47474
+MAX_PACKET_SIZE = 1024
+MAX_INPUTS_PER_PACKET = 32  # Unacknowledged inputs resent in every input packet
+
+class MessageType(IntEnum):
+    """First byte of every datagram."""
+    JOIN = 1      # client -> server: request a paddle
+    WELCOME = 2   # server -> client: assigned side and match settings
+    FULL = 3      # server -> client: both paddles are taken
+    INPUT = 4     # client -> server: unacknowledged inputs and the latest snapshot received
+    SNAPSHOT = 5  # server -> client: state, delta-compressed against the client's acknowledged snapshot
+    LEAVE = 6     # client -> server: disconnecting
+
+class NetInput(IntEnum):
+    """Inputs a client sends for its own paddle (the same presses `KeyBindings` defines)."""
+    UP = 1
+    DOWN = 2
+    ADVANCE = 3  # SPACE - start, continue or restart the game
+
+class InputPacketRecord(NamedTuple):
+    """A client input, numbered so the server applies each exactly once however many times it is resent."""
+    sequence: int
+    tick: int  # Client's predicted simulation tick when the input was made
+    action: NetInput
+
+JOIN = struct.Struct("<BH")                # type, protocol version
+WELCOME = struct.Struct("<BBHHHH")         # type, side (0 left, 1 right), width, height, winning score, tick rate
+INPUT_HEADER = struct.Struct("<BIB")       # type, latest snapshot sequence received, input count
+INPUT_RECORD = struct.Struct("<IIB")       # input sequence, client tick, action
+SNAPSHOT_HEADER = struct.Struct("<BIIIH")  # type, sequence, baseline sequence (0 = none), last input applied, field mask
+
+# Snapshot fields, in mask bit order
+STATE_FIELDS = ("tick", "current_state", "score_p1", "score_p2", "winner", "ball_x", "ball_y", "ball_h_speed",
+                "ball_v_speed", "l_paddle_y", "l_paddle_v_speed", "r_paddle_y", "r_paddle_v_speed")
+
+def state_to_values(state: SimulationState) -> Tuple[int, ...]:
+    """Flatten a simulation state to the integer snapshot fields."""
+    return (state.tick, state.current_state.value, state.score_p1, state.score_p2, WINNERS.index(state.winner),
+            state.ball_x, state.ball_y, state.ball_h_speed, state.ball_v_speed,
+            state.l_paddle_y, state.l_paddle_v_speed, state.r_paddle_y, state.r_paddle_v_speed)
+
+def values_to_state(values: Tuple[int, ...]) -> SimulationState:
+    """Rebuild a simulation state from integer snapshot fields."""
+    fields = dict(zip(STATE_FIELDS, values))
+    fields["current_state"] = GameState(fields["current_state"])
+    fields["winner"] = WINNERS[fields["winner"]]
+    return SimulationState(**fields)
+
+def encode_snapshot(sequence: int, values: Tuple[int, ...], input_ack: int, baseline_sequence: int = 0,
+                    baseline: Optional[Tuple[int, ...]] = None) -> bytes:
+    """
+    Encode a snapshot, sending only the fields that differ from the baseline the client already has.
+
+    Args:
+        sequence (int): Snapshot sequence number (from 1)
+        values (tuple): Snapshot fields
+        input_ack (int): Sequence number of the last input from this client that has been applied
+        baseline_sequence (int, optional): Sequence of the baseline snapshot (0 sends every field)
+        baseline (tuple, optional): Fields of the baseline snapshot
+
+    Returns:
+        bytes: Datagram payload
+    """
+    if baseline is None:
+        baseline_sequence = 0
+        mask = (1 << len(values)) - 1
+        changed = values
+    else:
+        mask = 0
+        changed = []
+        for i, (value, old) in enumerate(zip(values, baseline)):
+            if value != old:
+                mask |= 1 << i
+                changed.append(value)
+
+    header = SNAPSHOT_HEADER.pack(MessageType.SNAPSHOT, sequence, baseline_sequence, input_ack, mask)
+    return header + struct.pack(f"<{len(changed)}i", *changed)
+
+def decode_snapshot(data: bytes, baselines: Dict[int, Tuple[int, ...]]) -> Optional[Tuple[int, int, Tuple[int, ...]]]:
+    """
+    Decode a snapshot against the snapshots already received.
+
+    Args:
+        data (bytes): Datagram payload
+        baselines (dict): Snapshot sequence to fields, for snapshots previously received
+
+    Returns:
+        tuple or None: (sequence, input ack, fields), or None if the baseline is no longer held
+    """
+    _, sequence, baseline_sequence, input_ack, mask = SNAPSHOT_HEADER.unpack_from(data)
+    if baseline_sequence == 0:
+        values = [0] * len(STATE_FIELDS)
+    elif baseline_sequence in baselines:
+        values = list(baselines[baseline_sequence])
+    else:
+        return None
+
+    indices = [i for i in range(len(STATE_FIELDS)) if mask & (1 << i)]
+    changed = struct.unpack_from(f"<{len(indices)}i", data, SNAPSHOT_HEADER.size)
+    for i, value in zip(indices, changed):
+        values[i] = value
+    return sequence, input_ack, tuple(values)
+
+def encode_inputs(acked_snapshot: int, inputs: List[InputPacketRecord]) -> bytes:
+    """
+    Encode a client's input packet.
+
+    Args:
+        acked_snapshot (int): Latest snapshot sequence received (the server's next delta baseline)
+        inputs (list): Unacknowledged inputs, oldest first (only the newest MAX_INPUTS_PER_PACKET are sent)
+
+    Returns:
+        bytes: Datagram payload
+    """
+    inputs = inputs[-MAX_INPUTS_PER_PACKET:]
+    payload = bytearray(INPUT_HEADER.pack(MessageType.INPUT, acked_snapshot, len(inputs)))
+    for record in inputs:
+        payload += INPUT_RECORD.pack(record.sequence, record.tick, record.action)
+    return bytes(payload)
+
+def decode_inputs(data: bytes) -> Tuple[int, List[InputPacketRecord]]:
+    """
+    Decode a client's input packet.
+
+    Args:
+        data (bytes): Datagram payload
+
+    Returns:
+        tuple: (acknowledged snapshot sequence, list of InputPacketRecord)
+    """
+    _, acked_snapshot, count = INPUT_HEADER.unpack_from(data)
+    inputs = []
+    for i in range(count):
+        sequence, tick, action = INPUT_RECORD.unpack_from(data, INPUT_HEADER.size + i * INPUT_RECORD.size)
+        inputs.append(InputPacketRecord(sequence, tick, NetInput(action)))
+    return acked_snapshot, inputs
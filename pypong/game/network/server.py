@@ -0,0 +1,266 @@
+import logging
+import select
+import socket
+import struct
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, Optional, Tuple
+from ...config import GameState, settings
+from ..simulation import BASE_TICK_RATE, PaddleAction, Simulation, SimulationInputs
+from ..timestep import FixedTimestep
+from .protocol import (DEFAULT_PORT, JOIN, MAX_PACKET_SIZE, PROTOCOL_VERSION, WELCOME, MessageType, NetInput,
+                       decode_inputs, encode_snapshot, state_to_values)
+
+SNAPSHOT_HISTORY = 64  # Snapshots kept as delta baselines
+
+class ClientConnection:
+    def __init__(self, address: Tuple[str, int], side: int):
+        """
+        Initialise the server's record of a connected client.
+
+        Args:
+            address (tuple): Client's (host, port)
+            side (int): Paddle controlled by the client (0 left, 1 right)
+        """
+        self.address = address
+        self.side = side
+        self.last_input = 0       # Sequence of the last input applied
+        self.acked_snapshot = 0   # Latest snapshot the client has received (delta baseline)
+        self.last_heard = time.monotonic()
+
+
+class MatchSession:
+    def __init__(self, simulation: Simulation, tick_rate: int, send: Callable[[bytes, Tuple[str, int]], None],
+                 snapshot_interval: int = 1, client_timeout: float = 10.0, local_sides: Iterable[int] = ()):
+        """
+        Initialise the authoritative state of one networked match, independent of how datagrams are carried.
+
+        Clients send numbered up/down/advance inputs (resending them until acknowledged), which are applied
+        exactly once, in order. Every `snapshot_interval` ticks each client is sent the state,
+        delta-compressed against the latest snapshot it has acknowledged, together with the last of its
+        inputs applied, so it can reconcile its predicted paddle.
+
+        Args:
+            simulation (Simulation): Simulation of the match
+            tick_rate (int): Physics ticks per second (sent to clients)
+            send (callable): Called with (payload, address) to send a datagram
+            snapshot_interval (int, optional): Ticks between snapshots. Defaults to 1.
+            client_timeout (float, optional): Seconds of silence after which a client is dropped. Defaults to 10.
+            local_sides (iterable, optional): Paddles controlled in-process with `apply_input()` rather than
+                by network clients (0 left, 1 right). Defaults to none.
+        """
+        self.logger = logging.getLogger(__name__)
+        self.simulation = simulation
+        self.tick_rate = tick_rate
+        self.send = send
+        self.snapshot_interval = snapshot_interval
+        self.client_timeout = client_timeout
+        self.local_sides = set(local_sides)
+
+        self.clients: Dict[Tuple[str, int], ClientConnection] = {}
+        self.ticks = 0
+        self.sequence = 0
+        self.history: "OrderedDict[int, Tuple[int, ...]]" = OrderedDict()
+
+    @property
+    def free_sides(self) -> list:
+        """Paddles not yet controlled by a client or locally."""
+        taken = self.local_sides | {client.side for client in self.clients.values()}
+        return [side for side in (0, 1) if side not in taken]
+
+    @property
+    def ready(self) -> bool:
+        """Check if both paddles are controlled."""
+        return not self.free_sides
+
+    def handle_datagram(self, data: bytes, address: Tuple[str, int]):
+        """
+        Handle one datagram from a client, ignoring it if malformed.
+
+        Args:
+            data (bytes): Datagram payload
+            address (tuple): Sender's (host, port)
+        """
+        try:
+            self._handle_datagram(data, address)
+        except (struct.error, ValueError, IndexError):
+            self.logger.debug(f"Ignoring malformed datagram from {address}")
+
+    def _handle_datagram(self, data: bytes, address: Tuple[str, int]):
+        """Handle one datagram from a client."""
+        message = data[0]
+        client = self.clients.get(address)
+
+        if message == MessageType.JOIN:
+            _, version = JOIN.unpack_from(data)
+            if version != PROTOCOL_VERSION:
+                return
+            if client is None:
+                free = self.free_sides
+                if not free:
+                    self.send(bytes([MessageType.FULL]), address)
+                    return
+                client = self.clients[address] = ClientConnection(address, free[0])
+                self.logger.info(f"Player {client.side + 1} joined from {address[0]}:{address[1]}")
+            # Answer repeated JOINs too, in case the WELCOME was lost
+            width, height = self.simulation.screen_dims
+            self.send(WELCOME.pack(MessageType.WELCOME, client.side, width, height,
+                                   self.simulation.winning_score, self.tick_rate), address)
+
+        elif client is None:
+            return
+
+        elif message == MessageType.INPUT:
+            client.last_heard = time.monotonic()
+            acked_snapshot, inputs = decode_inputs(data)
+            client.acked_snapshot = max(client.acked_snapshot, acked_snapshot)
+            for record in inputs:
+                if record.sequence > client.last_input:
+                    self.apply_input(client.side, record.action)
+                    client.last_input = record.sequence
+
+        elif message == MessageType.LEAVE:
+            del self.clients[address]
+            self.logger.info(f"Player {client.side + 1} left")
+
+    def apply_input(self, side: int, action: NetInput):
+        """
+        Apply an input to a paddle, or advance the game (ignored until both paddles are controlled).
+
+        Args:
+            side (int): Paddle the input is for (0 left, 1 right)
+            action (NetInput): UP, DOWN or ADVANCE
+        """
+        if not self.ready:
+            return
+        if action == NetInput.ADVANCE:
+            self.simulation.apply_inputs(SimulationInputs(advance=True))
+            return
+
+        paddle_action = PaddleAction.UP if action == NetInput.UP else PaddleAction.DOWN
+        if side == 0:
+            self.simulation.apply_inputs(SimulationInputs(left=paddle_action))
+        else:
+            self.simulation.apply_inputs(SimulationInputs(right=paddle_action))
+
+    def tick(self):
+        """Advance the simulation one tick (paused mid-point while a player is missing) and send snapshots."""
+        self.drop_silent_clients()
+        if self.ready or self.simulation.current_state != GameState.PLAYING:
+            self.simulation.step()
+        self.ticks += 1
+        if self.clients and self.ticks % self.snapshot_interval == 0:
+            self.send_snapshots()
+
+    def send_snapshots(self):
+        """Send the current state to every client, delta-compressed against its acknowledged snapshot."""
+        self.sequence += 1
+        values = state_to_values(self.simulation.get_state())
+        self.history[self.sequence] = values
+        while len(self.history) > SNAPSHOT_HISTORY:
+            self.history.popitem(last=False)
+
+        for client in self.clients.values():
+            baseline = self.history.get(client.acked_snapshot)
+            self.send(encode_snapshot(self.sequence, values, client.last_input,
+                                      client.acked_snapshot, baseline), client.address)
+
+    def drop_silent_clients(self):
+        """Forget clients that have not been heard from within the timeout."""
+        now = time.monotonic()
+        for address, client in list(self.clients.items()):
+            if now - client.last_heard > self.client_timeout:
+                del self.clients[address]
+                self.logger.info(f"Player {client.side + 1} timed out")
+
+
+class GameServer:
+    def __init__(self, host: str = "0.0.0.0", port: int = DEFAULT_PORT, tick_rate: Optional[int] = None,
+                 snapshot_interval: int = 1, client_timeout: float = 10.0, simulation: Optional[Simulation] = None):
+        """
+        Initialise an authoritative server for a two-player networked match over UDP.
+
+        The server owns the only real simulation, in a `MatchSession`, and the first two clients to join
+        control the left and right paddles.
+
+        Args:
+            host (str, optional): Address to listen on. Defaults to all interfaces.
+            port (int, optional): UDP port to listen on (0 picks a free port). Defaults to DEFAULT_PORT.
+            tick_rate (int, optional): Physics ticks per second. Defaults to settings.physics.TICK_RATE.
+            snapshot_interval (int, optional): Ticks between snapshots. Defaults to 1.
+            client_timeout (float, optional): Seconds of silence after which a client is dropped. Defaults to 10.
+            simulation (Simulation, optional): Simulation to serve. Defaults to a new one at the tick rate.
+        """
+        # Set up logging
+        logging.basicConfig(level=logging.INFO,
+                            format='%(asctime)s - %(levelname)s - %(message)s')
+        self.logger = logging.getLogger(__name__)
+        self.tick_rate = tick_rate if tick_rate is not None else settings.physics.TICK_RATE
+        self.simulation = (simulation if simulation is not None
+                           else Simulation(dt=BASE_TICK_RATE / self.tick_rate))
+        self.session = MatchSession(self.simulation, self.tick_rate, self._send, snapshot_interval, client_timeout)
+        self.timestep = FixedTimestep(self.tick_rate, settings.physics.MAX_FRAME_TIME)
+
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.bind((host, port))
+        self.socket.setblocking(False)
+        self.address = self.socket.getsockname()
+
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+    def receive(self):
+        """Handle every datagram waiting on the socket."""
+        while True:
+            try:
+                data, address = self.socket.recvfrom(MAX_PACKET_SIZE)
+            except (BlockingIOError, InterruptedError):
+                return
+            except ConnectionResetError:
+                # Windows reports ICMP port unreachable from an earlier send here
+                continue
+            self.bytes_received += len(data)
+            self.session.handle_datagram(data, address)
+
+    def tick(self):
+        """Receive inputs, advance the match one tick and send snapshots."""
+        self.receive()
+        self.session.tick()
+
+    def _send(self, payload: bytes, address: Tuple[str, int]):
+        """Send a datagram, ignoring transient socket errors (UDP gives no delivery guarantee anyway)."""
+        try:
+            self.bytes_sent += self.socket.sendto(payload, address)
+        except (BlockingIOError, InterruptedError, ConnectionResetError):
+            pass
+
+    def update(self, timeout: float = 0.0) -> int:
+        """
+        Wait up to `timeout` for datagrams, then run every tick that is due in real time.
+
+        Returns:
+            int: Number of ticks run
+        """
+        select.select([self.socket], [], [], timeout)
+        ticks = self.timestep.advance()
+        for _ in range(ticks):
+            self.tick()
+        if ticks == 0:
+            self.receive()
+        return ticks
+
+    def serve_forever(self):
+        """Run the server at its tick rate until interrupted."""
+        self.logger.info(f"Serving on {self.address[0]}:{self.address[1]} at {self.tick_rate} ticks/s")
+        self.timestep.reset()
+        try:
+            while True:
+                self.update(timeout=self.timestep.dt - self.timestep.accumulator)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.close()
+
+    def close(self):
+        """Close the server socket."""
+        self.socket.close()
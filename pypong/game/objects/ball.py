@@ -1,6 +1,35 @@
 import pygame
 
+def tick_displacement(speed: float, dt: float, tick: int) -> int:
+    """
+    Return the whole pixels moved at a speed during one tick, without losing sub-pixel movement.
+
+    Positions are integers, so rounding each tick's movement (`speed * dt`) on its own would change speeds
+    and angles at tick rates other than multiples of BASE_TICK_RATE (or stop slow objects altogether).
+    Instead, the movement is the difference between the rounded distances covered by the end and the start
+    of the tick, so over any run of ticks at one speed the rounding error never exceeds half a pixel,
+    whatever the tick rate. This depends only on the tick, so needs no extra state to snapshot.
+
+    Args:
+        speed (float): Speed in pixels per base tick
+        dt (float): Length of the tick in base ticks
+        tick (int): Index of the tick (e.g. `Simulation.tick`)
+
+    Returns:
+        int: Pixels moved during the tick
+    """
+    return round(speed * dt * (tick + 1)) - round(speed * dt * tick)
+
+def sub_pixel_offset(speed: float, dt: float, tick: int) -> float:
+    """Return the part of the distance covered at a speed by the start of a tick that whole pixels leave out."""
+    distance = speed * dt * tick
+    return distance - round(distance)
+
+
 class Ball:
+    # Fixed attributes (no per-instance __dict__), so balls are compact and cheap to snapshot
+    __slots__ = ("screen_width", "screen_height", "side_length", "rect", "h_speed", "v_speed", "color")
+
     def __init__(self, side_length: int=10, x_pos=None, y_pos=None, h_speed: int=3, v_speed: int=5,
                  color: str="white", screen_size: tuple=(800, 600)):
         """
@@ -68,17 +97,29 @@ class Ball:
 
 
     def check_paddle_hit(self, paddle):
-        """Reverse horizontal speed and increase the same by 1 if the ball hits either paddle."""
+        """
+        Reverse horizontal speed and increase the same by 1 if the ball hits either paddle.
+
+        Returns:
+            bool: True if the ball hit the paddle
+        """
         if self.rect.colliderect(paddle):
-            self.h_speed *= -1
-            if self.h_speed < 0:
-                self.h_speed -= 1
-            else:
-                self.h_speed += 1
+            self.bounce_off_paddle()
 
             # Add angle variation - max/reset logic
             #     offset = (self.y - paddle.y) / paddle.height
             #     self.dy = (offset - 0.5) * 2  # Maps to range [-1, 1]
+            return True
+        return False
+
+
+    def bounce_off_paddle(self):
+        """Reverse horizontal speed and increase the same by 1."""
+        self.h_speed *= -1
+        if self.h_speed < 0:
+            self.h_speed -= 1
+        else:
+            self.h_speed += 1
 
 
     def check_ends_hit(self):
@@ -91,12 +132,134 @@ class Ball:
             return False
 
 
-    def move(self):
-        """Update ball position based on current horizontal and vertical speeds."""
-        self.rect.x += self.h_speed
-        self.rect.y += self.v_speed
+    def move(self, dt: float=1.0, tick: int=0):
+        """
+        Update ball position based on current horizontal and vertical speeds.
+
+        Args:
+            dt (float, optional): Length of the step in ticks. Defaults to 1.
+            tick (int, optional): Index of the step, to carry sub-pixel movement over (see
+                `tick_displacement()`). Defaults to 0.
+        """
+        self.rect.x += tick_displacement(self.h_speed, dt, tick)
+        self.rect.y += tick_displacement(self.v_speed, dt, tick)
+
+
+    def sweep(self, l_paddle, r_paddle, dt: float=1.0, max_bounces: int=8, tick: int=0):
+        """
+        Move the ball with swept (continuous) collision detection against the top/bottom edges and paddles.
+
+        Unlike `move()` followed by `check_sides_hit()` and `check_paddle_hit()`, the exact time of impact
+        within the step is found, the ball is bounced at that point and continues for the rest of the step,
+        so fast balls cannot tunnel through a paddle and several bounces can be resolved in one step.
+        As with `check_paddle_hit()`, only the paddle the ball is travelling towards is checked.
+
+        Args:
+            l_paddle (Paddle): Left paddle
+            r_paddle (Paddle): Right paddle
+            dt (float, optional): Length of the step in ticks. Defaults to 1.
+            max_bounces (int, optional): Maximum number of bounces resolved in one step. Defaults to 8.
+            tick (int, optional): Index of the step, to carry sub-pixel movement over (see
+                `tick_displacement()`). Defaults to 0.
+
+        Returns:
+            int: Number of paddle hits during the step
+        """
+        # Start from the exact position, including sub-pixel movement, inside the playing field
+        # (see `check_sides_hit()`)
+        max_y = self.screen_height - self.side_length
+        x = self.rect.x + sub_pixel_offset(self.h_speed, dt, tick)
+        y = min(max(self.rect.y + sub_pixel_offset(self.v_speed, dt, tick), 0.0), float(max_y))
+        remaining = dt
+        paddle_hits = 0
+
+        for _ in range(max_bounces + 1):
+            dx = self.h_speed * remaining
+            dy = self.v_speed * remaining
+
+            # Earliest impact as a fraction of the remaining step
+            impact_time = 1.0
+            impact = None
+            if dy < 0:
+                wall_time = -y / dy
+            elif dy > 0:
+                wall_time = (self.screen_height - self.side_length - y) / dy
+            else:
+                wall_time = None
+            if wall_time is not None and wall_time <= impact_time:
+                impact_time = max(wall_time, 0.0)
+                impact = "wall"
 
+            paddle = l_paddle if self.h_speed < 0 else r_paddle
+            paddle_time = self._time_of_impact(x, y, dx, dy, paddle.rect)
+            if paddle_time is not None and paddle_time < impact_time:
+                impact_time = paddle_time
+                impact = "paddle"
+
+            # Move to point of impact (or end of step) and bounce
+            x += dx * impact_time
+            y += dy * impact_time
+            remaining *= 1.0 - impact_time
+
+            if impact == "wall":
+                self.v_speed = abs(self.v_speed) if dy < 0 else -abs(self.v_speed)
+            elif impact == "paddle":
+                self.bounce_off_paddle()
+                paddle_hits += 1
+            if impact is None or remaining <= 0:
+                break
+
+        # Leave out the sub-pixel movement at the end of the step, as `move()` does
+        self.rect.x = round(x - sub_pixel_offset(self.h_speed, dt, tick + 1))
+        self.rect.y = min(max(round(y - sub_pixel_offset(self.v_speed, dt, tick + 1)), 0), max_y)
+        return paddle_hits
+
+
+    def _time_of_impact(self, x: float, y: float, dx: float, dy: float, rect):
+        """
+        Find when the moving ball first overlaps a static rect (swept AABB test).
 
-    def draw(self, screen):
-        """Draw ball on screen."""
-        pygame.draw.rect(screen, self.color, self.rect)
\ No newline at end of file
+        Args:
+            x (float): Ball x-coordinate at the start of the movement
+            y (float): Ball y-coordinate at the start of the movement
+            dx (float): Horizontal displacement over the movement
+            dy (float): Vertical displacement over the movement
+            rect (pygame.Rect): Static rect to test against
+
+        Returns:
+            float or None: Time of impact as a fraction (0-1) of the movement, or None if no impact
+        """
+        entry_times = []
+        exit_times = []
+        for pos, delta, low, high in ((x, dx, rect.left, rect.right), (y, dy, rect.top, rect.bottom)):
+            if delta > 0:
+                entry_times.append((low - (pos + self.side_length)) / delta)
+                exit_times.append((high - pos) / delta)
+            elif delta < 0:
+                entry_times.append((high - pos) / delta)
+                exit_times.append((low - (pos + self.side_length)) / delta)
+            elif pos + self.side_length <= low or pos >= high:
+                # Not moving on this axis and no overlap
+                return None
+
+        if not entry_times:
+            return None
+        entry = max(entry_times)
+        exit = min(exit_times)
+        if entry >= exit or entry >= 1 or exit <= 0:
+            return None
+        return max(entry, 0.0)
+
+
+    def draw(self, screen, position=None):
+        """
+        Draw ball on screen.
+
+        Args:
+            screen (pygame.Surface): Pygame screen surface
+            position (tuple, optional): (x, y) to draw at instead of the current position, e.g. when interpolating.
+        """
+        if position is None:
+            pygame.draw.rect(screen, self.color, self.rect)
+        else:
+            pygame.draw.rect(screen, self.color, (position[0], position[1], self.rect.width, self.rect.height))
\ No newline at end of file
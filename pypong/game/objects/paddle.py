@@ -1,6 +1,10 @@
 import pygame
+from .ball import tick_displacement
 
 class Paddle:
+    # Fixed attributes (no per-instance __dict__), so paddles are compact and cheap to snapshot
+    __slots__ = ("screen_width", "screen_height", "left", "width", "rect", "_v_speed", "color")
+
     def __init__(self, left: bool=True, width: int=5, length: int=60, y_pos=None, v_speed: int=0, color: str="white",
                  screen_size: tuple=(800, 600)):
         """
@@ -104,18 +108,32 @@ class Paddle:
             self.rect.bottom = self.screen_height
 
 
-    def move(self):
+    def move(self, dt: float=1.0, tick: int=0):
         """
         Move paddle according to current vertical speed.
         Call check_edges_hit() to prevent paddle moving off-screen.
+
+        Args:
+            dt (float, optional): Length of the step in ticks. Defaults to 1.
+            tick (int, optional): Index of the step, to carry sub-pixel movement over (see
+                `tick_displacement()`). Defaults to 0.
         """
         # Subtracts speed value to account for pygame coordinates increasing from top to bottom
-        self.rect.top -=self._v_speed
+        self.rect.top -= tick_displacement(self._v_speed, dt, tick)
 
         self.check_edges_hit()
 
         return
 
-    def draw(self, screen):
-        """Draw paddle on screen."""
-        pygame.draw.rect(screen, self.color, self.rect)
\ No newline at end of file
+    def draw(self, screen, position=None):
+        """
+        Draw paddle on screen.
+
+        Args:
+            screen (pygame.Surface): Pygame screen surface
+            position (tuple, optional): (x, y) to draw at instead of the current position, e.g. when interpolating.
+        """
+        if position is None:
+            pygame.draw.rect(screen, self.color, self.rect)
+        else:
+            pygame.draw.rect(screen, self.color, (position[0], position[1], self.rect.width, self.rect.height))
\ No newline at end of file
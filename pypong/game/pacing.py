@@ -0,0 +1,144 @@
+import time
+from typing import Callable, Optional
+import pygame
+from .profiling import FrameProfiler
+
+# Frame pacing strategies (settings.screen.FRAME_PACING)
+PACING_STRATEGIES = ("sleep", "busy", "hybrid", "vsync")
+
+# Consecutive frames presented in under half the frame interval before "vsync" pacing falls back to "hybrid"
+VSYNC_FALLBACK_FRAMES = 10
+
+class FramePacer:
+    def __init__(self, strategy: str = "sleep", profiler: Optional[FrameProfiler] = None, spin_time: float = 0.002,
+                 time_source: Callable[[], float] = time.perf_counter):
+        """
+        Initialise a frame pacing controller, which ends each frame at a steady frame rate.
+
+        Strategies trade CPU time for steadier frame intervals:
+
+        - "sleep": `pygame.time.Clock.tick()`, sleeping out the rest of the frame (least CPU, but the OS
+          can wake the game late, especially on Windows)
+        - "busy": `pygame.time.Clock.tick_busy_loop()`, spinning until the frame is due (most accurate, one
+          core kept busy)
+        - "hybrid": sleep until `spin_time` before the frame is due, then spin for the rest (accurate,
+          with only a little spinning)
+        - "vsync": no waiting, as presenting the frame waits for the display's refresh (the display must
+          be opened with vsync). If VSYNC_FALLBACK_FRAMES frames in a row come back in under half the frame
+          interval, vsync is evidently not in effect, and from then on frames are paced as "hybrid" instead.
+          A single short frame (e.g. one presented just after a late one) does not count.
+
+        Unlike `Clock.tick()`, "hybrid" and "vsync" schedule frames against fixed deadlines, so a late
+        frame is followed by a shorter wait rather than pushing every later frame back.
+
+        The pacer records each frame interval's deviation from the target interval ("jitter"), and the
+        time from a frame taking input events off the queue to that frame being presented
+        ("input_latency"), as phases of the frame profiler. pygame does not expose SDL's event timestamps,
+        so time an event spent queued before the frame took it is not included.
+
+        Args:
+            strategy (str, optional): One of PACING_STRATEGIES. Defaults to "sleep".
+            profiler (FrameProfiler, optional): Profiler to record jitter and input latency in.
+            spin_time (float, optional): Time (seconds) spun rather than slept by "hybrid". Defaults to 0.002.
+            time_source (callable, optional): Monotonic clock returning seconds. Defaults to time.perf_counter.
+
+        Raises:
+            ValueError: If the strategy is unknown or spin time is negative.
+        """
+        if strategy not in PACING_STRATEGIES:
+            raise ValueError(f"Frame pacing strategy must be one of {', '.join(PACING_STRATEGIES)}.")
+        if spin_time < 0:
+            raise ValueError("Spin time must be non-negative.")
+
+        self.strategy = strategy
+        self.profiler = profiler if profiler is not None else FrameProfiler()
+        self.spin_time = spin_time
+        self.time_source = time_source
+        self.clock = pygame.time.Clock()
+
+        # Pacer statistics
+        self.frames = 0
+        self.missed_deadlines = 0
+        self.vsync_fallback = False  # Whether "vsync" pacing fell back to "hybrid"
+        self._short_frames = 0  # Consecutive frames presented in under half the frame interval
+
+        self._deadline: Optional[float] = None
+        self._last_frame: Optional[float] = None
+        self._last_interval: Optional[float] = None
+        self._input_time: Optional[float] = None
+
+    def wait(self, fps: int):
+        """
+        Wait until the next frame is due, then record the frame interval.
+
+        Args:
+            fps (int): Target frame rate (0 for no limit)
+        """
+        period = 1.0 / fps if fps > 0 else 0.0
+        if self.strategy == "sleep":
+            self.clock.tick(fps)
+        elif self.strategy == "busy":
+            self.clock.tick_busy_loop(fps)
+        elif self.strategy == "hybrid" or self.vsync_fallback:
+            self._wait_for_deadline(period)
+        else:
+            if self._last_interval is not None and self._last_interval < period / 2:
+                self._short_frames += 1
+            else:
+                self._short_frames = 0
+            if self._short_frames >= VSYNC_FALLBACK_FRAMES:
+                # "vsync", but presenting is not waiting for a refresh
+                self.vsync_fallback = True
+                self._wait_for_deadline(period)
+            else:
+                self._deadline = None
+
+        now = self.time_source()
+        if self._last_frame is not None:
+            self._last_interval = now - self._last_frame
+            if period > 0:
+                self.profiler.record("jitter", abs(self._last_interval - period))
+        self._last_frame = now
+        self.frames += 1
+
+    def _wait_for_deadline(self, period: float):
+        """Sleep, then spin, until the next frame deadline, one period after the last."""
+        now = self.time_source()
+        if period <= 0:
+            self._deadline = None
+            return
+        if self._deadline is None or now - self._deadline > period:
+            # First frame, or more than a whole frame late - start a new schedule rather than catching up
+            if self._deadline is not None:
+                self.missed_deadlines += 1
+            self._deadline = now
+        self._deadline += period
+
+        remaining = self._deadline - now
+        if remaining > self.spin_time:
+            time.sleep(remaining - self.spin_time)
+        while self.time_source() < self._deadline:
+            pass
+
+    def input_received(self, when: Optional[float] = None):
+        """
+        Note that the current frame took input events off the queue (the first time in a frame counts).
+
+        Args:
+            when (float, optional): time.perf_counter() time the events were received. Defaults to now.
+        """
+        if self._input_time is None:
+            self._input_time = when if when is not None else self.time_source()
+
+    def presented(self):
+        """Note that the current frame was presented, recording the latency of any input it handled."""
+        if self._input_time is not None:
+            self.profiler.record("input_latency", self.time_source() - self._input_time)
+            self._input_time = None
+
+    def reset(self):
+        """Forget the frame schedule (e.g. after a long pause), so the next frame starts a new one."""
+        self._deadline = None
+        self._last_frame = None
+        self._last_interval = None
+        self._short_frames = 0
@@ -0,0 +1,118 @@
+import math
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict
+
+class RollingStats:
+    def __init__(self, window: int = 300):
+        """
+        Initialise a rolling window of timing samples.
+
+        Args:
+            window (int, optional): Number of most recent samples kept. Defaults to 300.
+        """
+        self.samples = deque(maxlen=window)
+
+    def add(self, value: float):
+        """Add a sample, discarding the oldest if the window is full."""
+        self.samples.append(value)
+
+    def percentile(self, percent: float) -> float:
+        """
+        Get a percentile of the samples in the window (nearest-rank method).
+
+        Args:
+            percent (float): Percentile between 0 and 100
+
+        Returns:
+            float: Sample at the given percentile (0.0 if there are no samples)
+        """
+        if not self.samples:
+            return 0.0
+        return self._nearest_rank(sorted(self.samples), percent)
+
+    def percentiles(self) -> Dict[str, float]:
+        """Get p50, p95 and p99 of the samples in the window, sorting them only once."""
+        if not self.samples:
+            return {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+        ordered = sorted(self.samples)
+        return {"p50": self._nearest_rank(ordered, 50),
+                "p95": self._nearest_rank(ordered, 95),
+                "p99": self._nearest_rank(ordered, 99)}
+
+    @staticmethod
+    def _nearest_rank(ordered: list, percent: float) -> float:
+        """Get the sample at a percentile of an already sorted list."""
+        rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+        return ordered[rank - 1]
+
+
+class FrameProfiler:
+    def __init__(self, window: int = 300):
+        """
+        Initialise a profiler recording how long each phase of a frame takes.
+
+        Phases are named freely (e.g. "events", "physics", "draw_playing_screen", "present", "sleep"),
+        and a rolling window of durations is kept for each so percentiles reflect recent frames.
+
+        Args:
+            window (int, optional): Number of most recent samples kept per phase. Defaults to 300.
+        """
+        self.window = window
+        self.phases: Dict[str, RollingStats] = {}
+
+    def record(self, phase: str, seconds: float):
+        """
+        Record a duration for a phase.
+
+        Args:
+            phase (str): Phase name
+            seconds (float): Duration in seconds
+        """
+        stats = self.phases.get(phase)
+        if stats is None:
+            stats = self.phases[phase] = RollingStats(self.window)
+        stats.add(seconds)
+
+    @contextmanager
+    def measure(self, phase: str):
+        """
+        Context manager recording the duration of the enclosed block for a phase.
+
+        Args:
+            phase (str): Phase name
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(phase, time.perf_counter() - start)
+
+    def percentiles(self, phase: str) -> Dict[str, float]:
+        """
+        Get p50, p95 and p99 durations for a phase, in milliseconds.
+
+        Args:
+            phase (str): Phase name
+
+        Returns:
+            dict: Percentile name ('p50', 'p95', 'p99') to duration in milliseconds
+        """
+        stats = self.phases.get(phase)
+        if stats is None:
+            return {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+        return {name: value * 1000 for name, value in stats.percentiles().items()}
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get p50, p95 and p99 durations (milliseconds) for every recorded phase.
+
+        Returns:
+            dict: Phase name to percentiles
+        """
+        return {phase: self.percentiles(phase) for phase in self.phases}
+
+    def reset(self):
+        """Discard all recorded samples."""
+        self.phases.clear()
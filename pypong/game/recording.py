@@ -0,0 +1,258 @@
+import struct
+from enum import IntEnum
+from typing import Callable, List, NamedTuple, Optional
+from ..config import GameState
+from .simulation import BASE_TICK_RATE, PaddleAction, Simulation, SimulationInputs, SimulationState
+
+# File layout: one header, then fixed-size (tick, code) records appended as inputs arrive
+MAGIC = b"PPRC"
+VERSION = 1
+HEADER = struct.Struct("<4sHQHHHHB")  # magic, version, seed, width, height, winning score, tick rate, swept
+RECORD = struct.Struct("<IB")         # tick, input code
+
+class InputCode(IntEnum):
+    """Codes stored in recording records."""
+    END = 0
+    LEFT_UP = 1
+    LEFT_DOWN = 2
+    RIGHT_UP = 3
+    RIGHT_DOWN = 4
+    ADVANCE = 5
+
+class InputRecord(NamedTuple):
+    """A single recorded input, applied before the simulation tick it is keyed by."""
+    tick: int
+    code: InputCode
+
+def encode_inputs(inputs: SimulationInputs) -> List[InputCode]:
+    """
+    Convert simulation inputs to recording codes, in the order `Simulation.apply_inputs` applies them.
+
+    Args:
+        inputs (SimulationInputs): Inputs to encode
+
+    Returns:
+        list: Input codes (empty if the inputs do nothing)
+    """
+    codes = []
+    if inputs.advance:
+        codes.append(InputCode.ADVANCE)
+    if inputs.left == PaddleAction.UP:
+        codes.append(InputCode.LEFT_UP)
+    elif inputs.left == PaddleAction.DOWN:
+        codes.append(InputCode.LEFT_DOWN)
+    if inputs.right == PaddleAction.UP:
+        codes.append(InputCode.RIGHT_UP)
+    elif inputs.right == PaddleAction.DOWN:
+        codes.append(InputCode.RIGHT_DOWN)
+    return codes
+
+def decode_input(code: InputCode) -> SimulationInputs:
+    """
+    Convert a recording code back to simulation inputs.
+
+    Args:
+        code (InputCode): Code to decode
+
+    Returns:
+        SimulationInputs: Equivalent inputs (no input for END)
+    """
+    if code == InputCode.ADVANCE:
+        return SimulationInputs(advance=True)
+    elif code == InputCode.LEFT_UP:
+        return SimulationInputs(left=PaddleAction.UP)
+    elif code == InputCode.LEFT_DOWN:
+        return SimulationInputs(left=PaddleAction.DOWN)
+    elif code == InputCode.RIGHT_UP:
+        return SimulationInputs(right=PaddleAction.UP)
+    elif code == InputCode.RIGHT_DOWN:
+        return SimulationInputs(right=PaddleAction.DOWN)
+    return SimulationInputs()
+
+
+class MatchRecorder:
+    def __init__(self, path: str, simulation: Simulation, tick_rate: int = BASE_TICK_RATE, flush_every: int = 64):
+        """
+        Record the inputs applied to a simulation to a compact, append-only binary file.
+
+        Only the simulation's seed and settings (in the header) and its inputs (as 5-byte records keyed
+        by tick) are stored, which is enough for the match to be re-simulated exactly. The recorder
+        attaches itself to the simulation, which must not have been stepped yet.
+
+        Args:
+            path (str): File to write
+            simulation (Simulation): Simulation to record
+            tick_rate (int, optional): Physics tick rate the simulation is stepped at. Defaults to BASE_TICK_RATE.
+            flush_every (int, optional): Number of records buffered before they are written. Defaults to 64.
+
+        Raises:
+            ValueError: If the simulation has already been stepped.
+        """
+        if simulation.tick != 0:
+            raise ValueError("Recording must start before the simulation is stepped.")
+
+        self.path = path
+        self.simulation = simulation
+        self.flush_every = flush_every
+        self._buffer = bytearray()
+        self._buffered = 0
+
+        self._file = open(path, "wb")
+        self._file.write(HEADER.pack(MAGIC, VERSION, simulation.seed, simulation.screen_dims[0],
+                                     simulation.screen_dims[1], simulation.winning_score, tick_rate,
+                                     simulation.swept_collisions))
+        simulation.recorder = self
+
+    def record(self, tick: int, inputs: SimulationInputs):
+        """
+        Append the inputs applied at a tick.
+
+        Args:
+            tick (int): Simulation tick the inputs were applied before
+            inputs (SimulationInputs): Inputs applied
+        """
+        for code in encode_inputs(inputs):
+            self._buffer += RECORD.pack(tick, code)
+            self._buffered += 1
+        if self._buffered >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        """Write buffered records to the file."""
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._file.flush()
+            self._buffer.clear()
+            self._buffered = 0
+
+    def close(self):
+        """Write an END record at the current tick, flush and close the file, and detach from the simulation."""
+        if self._file.closed:
+            return
+        self._buffer += RECORD.pack(self.simulation.tick, InputCode.END)
+        self.flush()
+        self._file.close()
+        if self.simulation.recorder is self:
+            self.simulation.recorder = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class MatchRecording:
+    def __init__(self, seed: int, screen_dims: tuple, winning_score: int, tick_rate: int,
+                 swept_collisions: bool, records: List[InputRecord]):
+        """
+        Initialise a recorded match.
+
+        Args:
+            seed (int): Seed of the recorded simulation
+            screen_dims (tuple): Playing field dimensions
+            winning_score (int): Score required to win
+            tick_rate (int): Physics tick rate the match was played at
+            swept_collisions (bool): Whether swept collision detection was used
+            records (list): Recorded inputs, in order
+        """
+        self.seed = seed
+        self.screen_dims = screen_dims
+        self.winning_score = winning_score
+        self.tick_rate = tick_rate
+        self.swept_collisions = swept_collisions
+        self.records = records
+
+    @classmethod
+    def load(cls, path: str) -> "MatchRecording":
+        """
+        Read a recording written by `MatchRecorder`.
+
+        A trailing partial record (e.g. from a recording still being written) is ignored.
+
+        Args:
+            path (str): File to read
+
+        Returns:
+            MatchRecording: Recorded match
+
+        Raises:
+            ValueError: If the file is not a PyPong recording of a supported version.
+        """
+        with open(path, "rb") as f:
+            data = f.read()
+
+        if len(data) < HEADER.size:
+            raise ValueError(f"{path} is too short to be a PyPong recording.")
+        magic, version, seed, width, height, winning_score, tick_rate, swept = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a PyPong recording.")
+        if version != VERSION:
+            raise ValueError(f"Unsupported recording version {version} (expected {VERSION}).")
+
+        body = memoryview(data)[HEADER.size:]
+        body = body[:len(body) - len(body) % RECORD.size]
+        records = [InputRecord(tick, InputCode(code)) for tick, code in RECORD.iter_unpack(body)]
+        return cls(seed, (width, height), winning_score, tick_rate, bool(swept), records)
+
+    def create_simulation(self) -> Simulation:
+        """Create a fresh simulation with the recorded seed and settings."""
+        return Simulation(self.screen_dims, winning_score=self.winning_score, seed=self.seed,
+                          dt=BASE_TICK_RATE / self.tick_rate, swept_collisions=self.swept_collisions)
+
+
+class MatchReplay:
+    def __init__(self, recording: MatchRecording, simulation: Optional[Simulation] = None):
+        """
+        Drive a simulation with the inputs of a recorded match.
+
+        Args:
+            recording (MatchRecording): Recorded match
+            simulation (Simulation, optional): Simulation to drive. Defaults to a new one from the recording.
+        """
+        self.recording = recording
+        self.simulation = simulation if simulation is not None else recording.create_simulation()
+        self.index = 0
+
+    @property
+    def finished(self) -> bool:
+        """Check if all recorded inputs have been applied and the recording has ended."""
+        if self.index >= len(self.recording.records):
+            return True
+        record = self.recording.records[self.index]
+        return record.code == InputCode.END and record.tick <= self.simulation.tick
+
+    def apply_due_inputs(self):
+        """Apply every recorded input keyed by the simulation's current tick."""
+        records = self.recording.records
+        while self.index < len(records) and records[self.index].tick <= self.simulation.tick:
+            record = records[self.index]
+            if record.code == InputCode.END:
+                return
+            self.simulation.apply_inputs(decode_input(record.code))
+            self.index += 1
+
+    def run(self, on_tick: Optional[Callable[[SimulationState], None]] = None) -> SimulationState:
+        """
+        Re-simulate the whole match headlessly, as fast as possible.
+
+        As in `Game`, the simulation is only stepped in the PLAYING state.
+
+        Args:
+            on_tick (callable, optional): Called with the simulation state after every tick
+
+        Returns:
+            SimulationState: Final state of the match
+        """
+        while not self.finished:
+            self.apply_due_inputs()
+            if self.finished:
+                break
+            if self.simulation.current_state == GameState.PLAYING:
+                state = self.simulation.step()
+                if on_tick is not None:
+                    on_tick(state)
+            else:
+                # Waiting for input outside PLAYING, but the next input is for a later tick
+                break
+        return self.simulation.get_state()
@@ -0,0 +1,294 @@
+import logging
+import os
+import sqlite3
+import time
+from typing import Dict, Iterable, List, NamedTuple, Optional
+from .simulation import Simulation
+
+# Elo rating of a player's first match, and the most a rating moves in one match
+INITIAL_RATING = 1500.0
+K_FACTOR = 32.0
+
+# Player aggregate columns, summed across a batch before being added to the stored totals
+AGGREGATE_COLUMNS = ("played", "wins", "losses", "unfinished", "points_for", "points_against", "hits")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS matches (
+    id INTEGER PRIMARY KEY,
+    finished_at REAL NOT NULL,
+    source TEXT NOT NULL,
+    left_player TEXT NOT NULL,
+    right_player TEXT NOT NULL,
+    winner TEXT,
+    score_left INTEGER NOT NULL,
+    score_right INTEGER NOT NULL,
+    ticks INTEGER NOT NULL,
+    hits INTEGER NOT NULL,
+    longest_rally INTEGER NOT NULL,
+    seed INTEGER,
+    left_rating REAL NOT NULL,
+    right_rating REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS matches_left_player ON matches (left_player);
+CREATE INDEX IF NOT EXISTS matches_right_player ON matches (right_player);
+CREATE TABLE IF NOT EXISTS players (
+    name TEXT PRIMARY KEY,
+    played INTEGER NOT NULL DEFAULT 0,
+    wins INTEGER NOT NULL DEFAULT 0,
+    losses INTEGER NOT NULL DEFAULT 0,
+    unfinished INTEGER NOT NULL DEFAULT 0,
+    points_for INTEGER NOT NULL DEFAULT 0,
+    points_against INTEGER NOT NULL DEFAULT 0,
+    hits INTEGER NOT NULL DEFAULT 0,
+    rating REAL NOT NULL
+);
+"""
+
+INSERT_MATCH = """
+INSERT INTO matches (finished_at, source, left_player, right_player, winner, score_left, score_right, ticks,
+                     hits, longest_rally, seed, left_rating, right_rating)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+UPSERT_PLAYER = f"""
+INSERT INTO players (name, {", ".join(AGGREGATE_COLUMNS)}, rating)
+VALUES (?, {", ".join("?" for _ in AGGREGATE_COLUMNS)}, ?)
+ON CONFLICT (name) DO UPDATE SET
+    {", ".join(f"{column} = {column} + excluded.{column}" for column in AGGREGATE_COLUMNS)},
+    rating = excluded.rating
+"""
+
+class GameResult(NamedTuple):
+    """Result of a finished (or abandoned) game between two named players or controllers."""
+    left: str  # Player 1 (left paddle)
+    right: str  # Player 2 (right paddle)
+    winner: Optional[str]  # Name of the winner, or None if the game was abandoned unfinished
+    score_left: int
+    score_right: int
+    ticks: int  # Simulation ticks the game took
+    hits: int = 0  # Paddle hits in the game
+    longest_rally: int = 0  # Most paddle hits in one point
+    seed: Optional[int] = None  # Simulation seed, to replay the game
+    source: str = "game"  # Where the result came from, e.g. "game" or "tournament"
+    finished_at: Optional[float] = None  # Unix time the game finished. Defaults to when it was added.
+
+    @classmethod
+    def from_simulation(cls, simulation: Simulation, left: str, right: str, source: str = "game") -> "GameResult":
+        """
+        Take the result of a simulation's current game (unfinished if no one has won yet).
+
+        Args:
+            simulation (Simulation): Simulation whose game is over
+            left (str): Name of Player 1 (left paddle)
+            right (str): Name of Player 2 (right paddle)
+            source (str, optional): Where the result came from. Defaults to "game".
+
+        Returns:
+            GameResult: Result of the game
+        """
+        winner = {"Player 1": left, "Player 2": right}.get(simulation.winner)
+        longest_rally = max(simulation.longest_rally, simulation.rally_hits)
+        return cls(left, right, winner, simulation.score_p1, simulation.score_p2,
+                   simulation.tick - simulation.game_start_tick, simulation.hits, longest_rally, simulation.seed, source)
+
+    @classmethod
+    def from_match_result(cls, result) -> "GameResult":
+        """Convert a tournament `MatchResult`."""
+        return cls(result.left, result.right, result.winner, result.score_left, result.score_right, result.ticks,
+                   result.hits, result.longest_rally, result.seed, "tournament")
+
+
+def expected_score(rating: float, opponent_rating: float) -> float:
+    """Return a player's expected score (win probability) against an opponent, under the Elo model."""
+    return 1.0 / (1.0 + 10.0 ** ((opponent_rating - rating) / 400.0))
+
+
+class ResultsStore:
+    def __init__(self, path: str, batch_size: int = 500, flush_interval: float = 1.0,
+                 k_factor: float = K_FACTOR, initial_rating: float = INITIAL_RATING):
+        """
+        Open (or create) a SQLite database of game results, with per-player totals and Elo ratings.
+
+        `add()` only buffers a result. Buffered results are written together, in one transaction, once
+        `batch_size` are waiting or the oldest has waited `flush_interval` seconds (checked when results
+        are added), and on `flush()` or `close()`. The database uses write-ahead logging, so readers
+        (e.g. a leaderboard in another process) never block the writer.
+
+        Each player's totals and rating are kept up to date as results are written, rather than
+        recomputed from every match: ratings are updated match by match, in the order results were added,
+        and a batch's totals are summed before being added to the stored ones. Unfinished games count
+        towards `played` and `unfinished` but leave ratings unchanged.
+
+        Args:
+            path (str): Database file (its directory is created if missing)
+            batch_size (int, optional): Results written together. Defaults to 500.
+            flush_interval (float, optional): Longest time (seconds) a result stays buffered. Defaults to 1.
+            k_factor (float, optional): Most a rating moves in one match. Defaults to K_FACTOR.
+            initial_rating (float, optional): Rating of a player's first match. Defaults to INITIAL_RATING.
+
+        Raises:
+            ValueError: If batch_size, flush_interval or k_factor is not positive.
+        """
+        if batch_size <= 0 or flush_interval <= 0 or k_factor <= 0:
+            raise ValueError("Batch size, flush interval and K-factor must be positive.")
+
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.k_factor = k_factor
+        self.initial_rating = initial_rating
+
+        self.logger = logging.getLogger(__name__)
+
+        # Store statistics
+        self.results_written = 0
+        self.batches_written = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(path)
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        # With WAL, a crash can only lose the latest transactions, never corrupt the database
+        self._connection.execute("PRAGMA synchronous = NORMAL")
+        self._connection.executescript(SCHEMA)
+
+        # Current ratings, so each batch's rating updates need no reads
+        self._ratings: Dict[str, float] = dict(self._connection.execute("SELECT name, rating FROM players"))
+        self._pending: List[GameResult] = []
+        self._oldest_pending = 0.0
+
+    def add(self, result: GameResult):
+        """
+        Buffer a result to be written (writing the batch if it is full or has waited long enough).
+
+        Args:
+            result (GameResult): Result to store
+        """
+        if result.finished_at is None:
+            result = result._replace(finished_at=time.time())
+        if not self._pending:
+            self._oldest_pending = time.monotonic()
+        self._pending.append(result)
+        if len(self._pending) >= self.batch_size or time.monotonic() - self._oldest_pending >= self.flush_interval:
+            self.flush()
+
+    def add_many(self, results: Iterable[GameResult]) -> int:
+        """
+        Buffer many results, in order (e.g. from a tournament).
+
+        Args:
+            results (iterable): GameResult objects
+
+        Returns:
+            int: Number of results added
+        """
+        count = 0
+        for result in results:
+            self.add(result)
+            count += 1
+        return count
+
+    def flush(self):
+        """
+        Write every buffered result, updating player totals and ratings, in one transaction.
+
+        If the write fails (e.g. the database is locked or the disk is full), the error is logged and the
+        results stay buffered, to be retried by the next flush: storing results must never take the game down.
+
+        Returns:
+            bool: True if every buffered result has been written
+        """
+        if not self._pending:
+            return True
+        batch, self._pending = self._pending, []
+
+        ratings = dict(self._ratings)
+        totals: Dict[str, list] = {}
+        rows = []
+        for result in batch:
+            left_rating = ratings.get(result.left, self.initial_rating)
+            right_rating = ratings.get(result.right, self.initial_rating)
+            rows.append((result.finished_at, result.source, result.left, result.right, result.winner,
+                         result.score_left, result.score_right, result.ticks, result.hits, result.longest_rally,
+                         result.seed, left_rating, right_rating))
+
+            if result.winner is not None:
+                left_score = 1.0 if result.winner == result.left else 0.0
+                change = self.k_factor * (left_score - expected_score(left_rating, right_rating))
+                left_rating += change
+                right_rating -= change
+            ratings[result.left] = left_rating
+            ratings[result.right] = right_rating
+
+            for name, scored, conceded in ((result.left, result.score_left, result.score_right),
+                                           (result.right, result.score_right, result.score_left)):
+                row = totals.setdefault(name, [0] * len(AGGREGATE_COLUMNS))
+                row[0] += 1
+                if result.winner is None:
+                    row[3] += 1
+                elif result.winner == name:
+                    row[1] += 1
+                else:
+                    row[2] += 1
+                row[4] += scored
+                row[5] += conceded
+                row[6] += result.hits
+
+        try:
+            with self._connection:
+                self._connection.executemany(INSERT_MATCH, rows)
+                self._connection.executemany(UPSERT_PLAYER, [(name, *row, ratings[name])
+                                                             for name, row in totals.items()])
+        except sqlite3.Error as e:
+            self.logger.warning(f"Could not store {len(batch)} results, keeping them for the next flush: {e}")
+            self._pending = batch + self._pending
+            return False
+        self._ratings = ratings
+        self.results_written += len(batch)
+        self.batches_written += 1
+        return True
+
+    def leaderboard(self, limit: Optional[int] = None) -> List[dict]:
+        """
+        Return players' totals and ratings, highest rated first (writing any buffered results first).
+
+        Args:
+            limit (int, optional): Number of players to return. Defaults to all.
+
+        Returns:
+            list: Dicts of 'name', 'rating' and the totals in AGGREGATE_COLUMNS
+        """
+        return self._query_players("ORDER BY rating DESC LIMIT ?", (limit if limit is not None else -1,))
+
+    def player(self, name: str) -> Optional[dict]:
+        """Return a player's totals and rating, as in `leaderboard()` (None if they have no results)."""
+        rows = self._query_players("WHERE name = ?", (name,))
+        return rows[0] if rows else None
+
+    def _query_players(self, clause: str, parameters: tuple) -> List[dict]:
+        """Select players' totals and ratings as dicts, after writing any buffered results."""
+        self.flush()
+        cursor = self._connection.execute(f"SELECT name, rating, {', '.join(AGGREGATE_COLUMNS)} FROM players "
+                                          + clause, parameters)
+        columns = [description[0] for description in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor]
+
+    def match_count(self) -> int:
+        """Return the number of results stored (writing any buffered results first)."""
+        self.flush()
+        return self._connection.execute("SELECT COUNT(*) FROM matches").fetchone()[0]
+
+    def close(self):
+        """Write any buffered results and close the database (results that cannot be written are dropped)."""
+        try:
+            if not self.flush():
+                self.logger.warning(f"Dropped {len(self._pending)} results that could not be stored")
+        finally:
+            self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
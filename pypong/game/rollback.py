@@ -0,0 +1,209 @@
+from array import array
+from typing import Dict, Optional
+from .simulation import SNAPSHOT_SIZE, PaddleAction, Simulation, SimulationInputs, SimulationState
+
+class SnapshotRing:
+    def __init__(self, capacity: int):
+        """
+        Initialise a fixed-size ring buffer of past simulation states, one slot per tick.
+
+        Snapshots are written into a single preallocated integer array (slot = tick % capacity), so saving
+        every tick allocates nothing, and a tick older than `capacity` ticks is simply overwritten.
+
+        Args:
+            capacity (int): Number of ticks held
+
+        Raises:
+            ValueError: If capacity is not a positive integer.
+        """
+        if not isinstance(capacity, int) or capacity < 1:
+            raise ValueError("Capacity must be a positive integer.")
+        self.capacity = capacity
+        self.values = array("q", bytes(8 * SNAPSHOT_SIZE * capacity))
+        self.rng_states = [None] * capacity
+        self.ticks = array("q", [-1]) * capacity  # Tick held in each slot (-1 = empty)
+        self.newest_tick: Optional[int] = None
+
+    def __contains__(self, tick: int) -> bool:
+        return tick >= 0 and self.ticks[tick % self.capacity] == tick
+
+    @property
+    def oldest_tick(self) -> Optional[int]:
+        """Earliest tick that can be restored (None if empty)."""
+        return min((tick for tick in self.ticks if tick >= 0), default=None)
+
+    def save(self, simulation: Simulation):
+        """Store the simulation's current state, under its current tick."""
+        tick = simulation.tick
+        slot = tick % self.capacity
+        self.rng_states[slot] = simulation.snapshot_into(self.values, slot * SNAPSHOT_SIZE)
+        self.ticks[slot] = tick
+        self.newest_tick = tick
+
+    def load(self, simulation: Simulation, tick: int):
+        """
+        Restore the simulation to the state saved at a tick.
+
+        Args:
+            simulation (Simulation): Simulation to restore
+            tick (int): Tick to restore
+
+        Raises:
+            ValueError: If the tick is not held (never saved, or already overwritten).
+        """
+        if tick not in self:
+            raise ValueError(f"Tick {tick} is not held in the snapshot ring.")
+        slot = tick % self.capacity
+        simulation.restore_from(self.values, slot * SNAPSHOT_SIZE, self.rng_states[slot])
+
+    def discard_after(self, tick: int):
+        """Forget snapshots later than a tick (e.g. after rewinding, as that future will be overwritten)."""
+        for slot, held in enumerate(self.ticks):
+            if held > tick:
+                self.ticks[slot] = -1
+                self.rng_states[slot] = None
+        if self.newest_tick is not None and self.newest_tick > tick:
+            self.newest_tick = tick if tick in self else None
+
+    def rewind(self, simulation: Simulation, ticks: int) -> int:
+        """
+        Restore the simulation to its state `ticks` ticks before the newest snapshot, or the oldest held.
+
+        Args:
+            simulation (Simulation): Simulation to restore
+            ticks (int): Number of ticks to go back
+
+        Returns:
+            int: Number of ticks actually rewound (0 if nothing is held)
+        """
+        oldest = self.oldest_tick
+        if oldest is None:
+            return 0
+        newest = self.newest_tick
+        target = max(newest - ticks, oldest)
+        self.load(simulation, target)
+        self.discard_after(target)
+        return newest - target
+
+    def clear(self):
+        """Forget every snapshot."""
+        for slot in range(self.capacity):
+            self.ticks[slot] = -1
+            self.rng_states[slot] = None
+        self.newest_tick = None
+
+
+def merge_inputs(first: Optional[SimulationInputs], second: SimulationInputs) -> SimulationInputs:
+    """Combine inputs for the same tick from different sources (e.g. the local and the remote player)."""
+    if first is None:
+        return second
+    return SimulationInputs(
+        left=second.left if second.left != PaddleAction.NONE else first.left,
+        right=second.right if second.right != PaddleAction.NONE else first.right,
+        advance=first.advance or second.advance,
+    )
+
+
+class RollbackSimulation:
+    def __init__(self, simulation: Simulation, max_rollback: int = 8):
+        """
+        Initialise rollback netcode around a simulation: it runs ahead on the inputs known so far, and an
+        input that arrives late (for a tick already simulated) rewinds to that tick and re-simulates.
+
+        Presses are impulses rather than held buttons, so a missing remote input is predicted as no press,
+        and only a tick that actually had a press is ever corrected. Snapshots are saved in a `SnapshotRing`
+        before every tick, so re-simulating N ticks costs one restore plus N steps.
+
+        The simulation should not have a recorder attached, as re-simulated inputs would be recorded again.
+
+        Args:
+            simulation (Simulation): Simulation to run
+            max_rollback (int, optional): Furthest back (in ticks) a late input can be applied. Defaults to 8.
+
+        Raises:
+            ValueError: If max_rollback is not a positive integer.
+        """
+        if not isinstance(max_rollback, int) or max_rollback < 1:
+            raise ValueError("Max rollback must be a positive integer.")
+        self.simulation = simulation
+        self.max_rollback = max_rollback
+        self.snapshots = SnapshotRing(max_rollback + 1)
+        self.inputs: Dict[int, SimulationInputs] = {}
+        self._rollback_from: Optional[int] = None
+
+        # Rollback statistics
+        self.rollbacks = 0
+        self.resimulated_ticks = 0
+
+    @property
+    def tick(self) -> int:
+        """Next tick to be simulated."""
+        return self.simulation.tick
+
+    def add_input(self, tick: int, inputs: SimulationInputs):
+        """
+        Add inputs for a tick, merged with any already known for it.
+
+        Inputs for a tick that has already been simulated are applied by re-simulating from that tick on
+        the next `step()`.
+
+        Args:
+            tick (int): Tick the inputs were made on
+            inputs (SimulationInputs): Inputs to add
+
+        Raises:
+            ValueError: If the tick is further back than max_rollback.
+        """
+        current = self.simulation.tick
+        if tick < current - self.max_rollback:
+            raise ValueError(f"Input for tick {tick} is more than {self.max_rollback} ticks late.")
+        self.inputs[tick] = merge_inputs(self.inputs.get(tick), inputs)
+        if tick < current and (self._rollback_from is None or tick < self._rollback_from):
+            self._rollback_from = tick
+
+    def step(self, inputs: Optional[SimulationInputs] = None) -> SimulationState:
+        """
+        Re-simulate from the earliest late input (if any), then advance one tick.
+
+        Args:
+            inputs (SimulationInputs, optional): Inputs for the tick about to be simulated (e.g. the local player's)
+
+        Returns:
+            SimulationState: State of the simulation after the tick
+        """
+        if inputs is not None:
+            self.add_input(self.simulation.tick, inputs)
+        if self._rollback_from is not None:
+            self._resimulate()
+
+        tick = self.simulation.tick
+        self.snapshots.save(self.simulation)
+        state = self.simulation.step(self.inputs.get(tick))
+        # Inputs leaving the rollback window can no longer be re-applied
+        self.inputs.pop(tick - self.max_rollback, None)
+        return state
+
+    def _resimulate(self):
+        """Restore the snapshot at the earliest late input and step back up to the current tick."""
+        start, target = self._rollback_from, self.simulation.tick
+        self._rollback_from = None
+        self.snapshots.load(self.simulation, start)
+        while self.simulation.tick < target:
+            tick = self.simulation.tick
+            self.snapshots.save(self.simulation)
+            self.simulation.step(self.inputs.get(tick))
+        self.rollbacks += 1
+        self.resimulated_ticks += target - start
+
+    def rewind(self, ticks: int) -> int:
+        """
+        Go back up to `ticks` ticks (at most max_rollback), forgetting inputs after the restored tick.
+
+        Returns:
+            int: Number of ticks actually rewound
+        """
+        rewound = self.snapshots.rewind(self.simulation, ticks)
+        for tick in [t for t in self.inputs if t >= self.simulation.tick]:
+            del self.inputs[tick]
+        self._rollback_from = None
+        return rewound
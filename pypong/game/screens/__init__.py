@@ -1,4 +1,7 @@
 from .start_screen import StartScreen
 from .playing_screen import PlayingScreen
 from .between_points_screen import BetweenPointsScreen
-from .game_over_screen import GameOverScreen
\ No newline at end of file
+from .game_over_screen import GameOverScreen
+from .timing_overlay import TimingOverlay
+from .screen_cache import ScreenCache
+from .text_cache import TextCache, text_cache
\ No newline at end of file
@@ -1,5 +1,7 @@
 import pygame
 from ...config import settings
+from .screen_cache import ScreenCache
+from .text_cache import text_cache
 
 class BetweenPointsScreen:
     def __init__(self, screen_dims):
@@ -7,7 +9,7 @@ class BetweenPointsScreen:
         Initialise the game over screen.
 
         Args:
-             screen_dims (tuple): Screen dimensions
+             screen_dims (tuple): Logical screen dimensions, which the layout is in
         """
         self.screen_dims = screen_dims
 
@@ -15,32 +17,52 @@ class BetweenPointsScreen:
         self.title_font = pygame.font.Font(settings.fonts.DEFAULT_FONT, settings.fonts.TITLE_SIZE)
         self.menu_font = pygame.font.Font(settings.fonts.DEFAULT_FONT, settings.fonts.MENU_SIZE)
 
+        # Pre-rendered screen content
+        self.cache = ScreenCache(screen_dims)
+
 
     def render(self, screen, scores):
         """
         Render the between points screen.
 
+        The content is drawn once into a cached surface, and only redrawn when the scores change.
+
+        Args:
+             screen (RenderBackend): Render backend to draw with
+             scores (tuple): Final scores for both players (score_p1, score_p2)
+        """
+        key = (tuple(scores), settings.game.WINNING_SCORE, settings.game.WIN_BY_TWO)
+        image = self.cache.get(screen, key)
+        if image is None:
+            self._draw(self.cache.new_surface(screen, key), scores)
+            image = self.cache.get(screen, key)
+        screen.blit(image, (0, 0))
+
+    def _draw(self, screen, scores):
+        """
+        Draw the between points screen content.
+
         Args:
-             screen (pygame.Surface): Pygame screen surface
+             screen (pygame.Surface): Surface to draw on
              scores (tuple): Final scores for both players (score_p1, score_p2)
         """
         # Clear screen
         screen.fill(settings.colors.BLACK)
 
         # Current score
-        p1_text = self.title_font.render(f"Player 1: ", True, settings.colors.WHITE)
-        p2_text = self.title_font.render(f"Player 2: ", True, settings.colors.WHITE)
+        p1_text = text_cache.render(self.title_font, f"Player 1: ", True, settings.colors.WHITE)
+        p2_text = text_cache.render(self.title_font, f"Player 2: ", True, settings.colors.WHITE)
 
         # Colour-coding for scores
         if scores[0] > scores[1]:
-            p1_score_text = self.title_font.render(f"{scores[0]}", True, settings.colors.FOREST_GREEN)
-            p2_score_text = self.title_font.render(f"{scores[1]}", True, settings.colors.CRIMSON)
+            p1_score_text = text_cache.render(self.title_font, f"{scores[0]}", True, settings.colors.FOREST_GREEN)
+            p2_score_text = text_cache.render(self.title_font, f"{scores[1]}", True, settings.colors.CRIMSON)
         elif scores[0] < scores[1]:
-            p1_score_text = self.title_font.render(f"{scores[0]}", True, settings.colors.CRIMSON)
-            p2_score_text = self.title_font.render(f"{scores[1]}", True, settings.colors.FOREST_GREEN)
+            p1_score_text = text_cache.render(self.title_font, f"{scores[0]}", True, settings.colors.CRIMSON)
+            p2_score_text = text_cache.render(self.title_font, f"{scores[1]}", True, settings.colors.FOREST_GREEN)
         else:
-            p1_score_text = self.title_font.render(f"{scores[0]}", True, settings.colors.BURLYWOOD)
-            p2_score_text = self.title_font.render(f"{scores[1]}", True, settings.colors.BURLYWOOD)
+            p1_score_text = text_cache.render(self.title_font, f"{scores[0]}", True, settings.colors.BURLYWOOD)
+            p2_score_text = text_cache.render(self.title_font, f"{scores[1]}", True, settings.colors.BURLYWOOD)
 
         p1_comb_width = p1_text.get_width() + p1_score_text.get_width()
         p2_comb_width = p2_text.get_width() + p2_score_text.get_width()
@@ -57,8 +79,8 @@ class BetweenPointsScreen:
 
         # 'Continue' instructions
         win_by_two_text = "(win by 2 points)" if settings.game.WIN_BY_TWO else ""
-        continue_text_1 = self.menu_font.render(f"First to {settings.game.WINNING_SCORE} {win_by_two_text}", True, "grey")
-        continue_text_2 = self.menu_font.render(f"Press SPACE to continue", True, settings.colors.WHITE)
+        continue_text_1 = text_cache.render(self.menu_font, f"First to {settings.game.WINNING_SCORE} {win_by_two_text}", True, "grey")
+        continue_text_2 = text_cache.render(self.menu_font, f"Press SPACE to continue", True, settings.colors.WHITE)
         continue_rect_1 = continue_text_1.get_rect(center=(self.screen_dims[0] // 2, self.screen_dims[1] // 2 + 50))
         continue_rect_2 = continue_text_2.get_rect(center=(self.screen_dims[0] // 2, self.screen_dims[1] // 2 + 50 +
                                                            continue_rect_1.height * 2))
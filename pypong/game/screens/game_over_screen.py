@@ -1,5 +1,7 @@
 import pygame
 from ...config import settings
+from .screen_cache import ScreenCache
+from .text_cache import text_cache
 
 class GameOverScreen:
     def __init__(self, screen_dims):
@@ -7,7 +9,7 @@ class GameOverScreen:
         Initialise the game over screen.
 
         Args:
-             screen_dims (tuple): Screen dimensions
+             screen_dims (tuple): Logical screen dimensions, which the layout is in
         """
         self.screen_dims = screen_dims
 
@@ -15,12 +17,33 @@ class GameOverScreen:
         self.title_font = pygame.font.Font(settings.fonts.DEFAULT_FONT, settings.fonts.TITLE_SIZE)
         self.menu_font = pygame.font.Font(settings.fonts.DEFAULT_FONT, settings.fonts.MENU_SIZE)
 
+        # Pre-rendered screen content
+        self.cache = ScreenCache(screen_dims)
+
     def render(self, screen, winner, scores):
         """
         Render the game over screen.
 
+        The content is drawn once into a cached surface, and only redrawn when the winner or scores change.
+
+        Args:
+             screen (RenderBackend): Render backend to draw with
+             winner (str): Name of the winning player
+             scores (tuple): Final scores for both players (score_p1, score_p2)
+        """
+        key = (winner, tuple(scores))
+        image = self.cache.get(screen, key)
+        if image is None:
+            self._draw(self.cache.new_surface(screen, key), winner, scores)
+            image = self.cache.get(screen, key)
+        screen.blit(image, (0, 0))
+
+    def _draw(self, screen, winner, scores):
+        """
+        Draw the game over screen content.
+
         Args:
-             screen (pygame.Surface): Pygame screen surface
+             screen (pygame.Surface): Surface to draw on
              winner (str): Name of the winning player
              scores (tuple): Final scores for both players (score_p1, score_p2)
         """
@@ -28,12 +51,13 @@ class GameOverScreen:
         screen.fill(settings.colors.BLACK)
 
         # Game over text
-        game_over_text = self.title_font.render(f"GAME OVER - {winner} wins!", True, settings.colors.GREEN)
+        game_over_text = text_cache.render(self.title_font, f"GAME OVER - {winner} wins!", True, settings.colors.GREEN)
         game_over_rect = game_over_text.get_rect(center=(self.screen_dims[0] // 2, self.screen_dims[1] // 2 - 100))
         screen.blit(game_over_text, game_over_rect)
 
         # Final score
-        score_text = self.menu_font.render(
+        score_text = text_cache.render(
+            self.menu_font,
             f"Final Score: Player 1 {scores[0]} - {scores[1]} Player 2",
             True,
             settings.colors.WHITE
@@ -43,7 +67,7 @@ class GameOverScreen:
         screen.blit(score_text, start_rect)
 
         # Restart instructions
-        restart_text = self.menu_font.render("Press SPACE to restart", True, settings.colors.WHITE)
+        restart_text = text_cache.render(self.menu_font, "Press SPACE to restart", True, settings.colors.WHITE)
         restart_rect = restart_text.get_rect(center=(self.screen_dims[0] // 2, self.screen_dims[1] // 2 + 100))
         screen.blit(restart_text, restart_rect)
 
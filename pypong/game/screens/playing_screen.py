@@ -7,31 +7,163 @@ class PlayingScreen:
         Initialise the playing screen.
 
         Args:
-             screen_dims (tuple): Screen dimensions
+             screen_dims (tuple): Logical screen dimensions, which object positions are in
         """
         self.screen_dims = screen_dims
 
-    def render(self, screen, ball, l_paddle, r_paddle):
+        # Screen pixels per logical unit, set for the screen being drawn on (see `_get_background()`)
+        self._scale = (1.0, 1.0)
+
+        # Pre-rendered background (with net) and object rects drawn in the last dirty-rect render
+        self.background = None
+        self._background_size = None
+        self._drawn_rects = None
+
+        # Pre-rendered ball, blitted once per extra ball in multiball mode
+        self._ball_sprite = None
+        self._ball_sprite_size = None
+
+    def render(self, screen, ball, l_paddle, r_paddle, previous_state=None, alpha=1.0, extra_balls=(),
+               previous_extra_balls=()):
         """
         Render the playing screen.
 
+        If the state of the previous physics tick is given, objects are drawn interpolated between their
+        previous and current positions, so movement stays smooth when the tick rate and frame rate differ.
+        Objects are positioned in logical units, and scaled if the screen's size differs from `screen_dims`.
+
         Args:
-             screen (pygame.Surface): Pygame screen surface
+             screen (RenderBackend): Render backend to draw with
              ball (Ball): Ball object
              l_paddle (Paddle): Paddle object
              r_paddle (Paddle): Paddle object
+             previous_state (SimulationState, optional): Simulation state before the latest tick
+             alpha (float, optional): Interpolation factor between previous (0) and current (1) positions
+             extra_balls (sequence, optional): Further balls (multiball mode)
+             previous_extra_balls (sequence, optional): (x, y) of the further balls before the latest tick
         """
-        # Clear screen
-        screen.fill(settings.colors.BLACK)
+        # Clear screen and draw net
+        screen.blit(self._get_background(screen), (0, 0))
 
         # Draw objects
-        self.draw_net(screen)
-        l_paddle.draw(screen)
-        r_paddle.draw(screen)
-        ball.draw(screen)
+        self._draw_objects(screen, ball, l_paddle, r_paddle,
+                           self._object_rects(ball, l_paddle, r_paddle, previous_state, alpha, extra_balls,
+                                              previous_extra_balls))
+        self._drawn_rects = None
+
+    def render_dirty(self, screen, ball, l_paddle, r_paddle, previous_state=None, alpha=1.0, extra_balls=(),
+                     previous_extra_balls=()):
+        """
+        Render the playing screen, redrawing only the areas where objects have moved.
+
+        The previous object positions are erased with the pre-rendered background before objects are
+        drawn in their new positions. The whole screen is redrawn on the first call, or after `invalidate()`.
+
+        Args:
+             screen (RenderBackend): Render backend to draw with
+             ball (Ball): Ball object
+             l_paddle (Paddle): Paddle object
+             r_paddle (Paddle): Paddle object
+             previous_state (SimulationState, optional): Simulation state before the latest tick
+             alpha (float, optional): Interpolation factor between previous (0) and current (1) positions
+             extra_balls (sequence, optional): Further balls (multiball mode)
+             previous_extra_balls (sequence, optional): (x, y) of the further balls before the latest tick
+
+        Returns:
+            list: Rects of the screen that changed, to pass to the backend's `present()`
+        """
+        background = self._get_background(screen)
+        rects = self._object_rects(ball, l_paddle, r_paddle, previous_state, alpha, extra_balls,
+                                   previous_extra_balls)
+
+        if self._drawn_rects is None or len(self._drawn_rects) != len(rects):
+            screen.blit(background, (0, 0))
+            dirty_rects = [pygame.Rect((0, 0), screen.get_size())]
+        else:
+            # Erase objects from their previous positions
+            screen.blits([(background, rect, rect) for rect in self._drawn_rects])
+            dirty_rects = [old.union(new) for old, new in zip(self._drawn_rects, rects)]
+
+        self._draw_objects(screen, ball, l_paddle, r_paddle, rects)
+        self._drawn_rects = rects
+        return dirty_rects
+
+    def invalidate(self):
+        """Force the next `render_dirty()` to redraw the whole screen (e.g. after another screen was shown)."""
+        self._drawn_rects = None
+
+    def _get_background(self, screen):
+        """Return the background with net as an image of the render backend, rendering it once for the screen's size."""
+        size = screen.get_size()
+        if self.background is None or self._background_size != size:
+            self._scale = (size[0] / self.screen_dims[0], size[1] / self.screen_dims[1])
+            self._ball_sprite = None
+            surface = screen.create_surface(size)
+            surface.fill(settings.colors.BLACK)
+            self.draw_net(surface)
+            self.background = screen.create_image(surface)
+            self._background_size = size
+        return self.background
+
+    def _object_rects(self, ball, l_paddle, r_paddle, previous_state, alpha, extra_balls=(), previous_extra_balls=()):
+        """
+        Return the screen rects to draw the left paddle, right paddle and ball at (interpolated if possible),
+        followed by those of any extra balls.
+        """
+        extra_rects = [extra.rect.copy() for extra in extra_balls]
+        if previous_state is not None and len(previous_extra_balls) == len(extra_balls):
+            for rect, (x, y) in zip(extra_rects, previous_extra_balls):
+                # A ball that jumped a quarter of the field in one tick was served again, so is not interpolated
+                if abs(rect.x - x) < self.screen_dims[0] / 4:
+                    rect.topleft = self._lerp(x, rect.x, alpha), self._lerp(y, rect.y, alpha)
+        if previous_state is None:
+            rects = [l_paddle.rect.copy(), r_paddle.rect.copy(), ball.rect.copy()] + extra_rects
+        else:
+            rects = [
+            pygame.Rect((l_paddle.rect.x, self._lerp(previous_state.l_paddle_y, l_paddle.rect.y, alpha)),
+                        l_paddle.rect.size),
+            pygame.Rect((r_paddle.rect.x, self._lerp(previous_state.r_paddle_y, r_paddle.rect.y, alpha)),
+                        r_paddle.rect.size),
+            pygame.Rect((self._lerp(previous_state.ball_x, ball.rect.x, alpha),
+                         self._lerp(previous_state.ball_y, ball.rect.y, alpha)),
+                        ball.rect.size),
+            ] + extra_rects
+
+        if self._scale != (1.0, 1.0):
+            rects = [self._to_screen(rect) for rect in rects]
+        return rects
+
+    def _to_screen(self, rect):
+        """Scale a rect from logical units to screen pixels (at least 1 pixel in each direction)."""
+        scale_x, scale_y = self._scale
+        return pygame.Rect(round(rect.x * scale_x), round(rect.y * scale_y),
+                           max(1, round(rect.width * scale_x)), max(1, round(rect.height * scale_y)))
+
+    def _draw_objects(self, screen, ball, l_paddle, r_paddle, rects):
+        """Draw paddles and ball as filled rects at the given rects, and any extra balls in one batched blit."""
+        screen.fill(l_paddle.color, rects[0])
+        screen.fill(r_paddle.color, rects[1])
+        screen.fill(ball.color, rects[2])
+        if len(rects) > 3:
+            sprite = self._get_ball_sprite(screen, ball, rects[2].size)
+            screen.blits([(sprite, rect) for rect in rects[3:]])
+
+    def _get_ball_sprite(self, screen, ball, size):
+        """Return a surface of the ball at its screen size (all balls share it and its color), rendering it once."""
+        if self._ball_sprite is None or self._ball_sprite_size != size:
+            surface = screen.create_surface(size)
+            surface.fill(ball.color)
+            self._ball_sprite = screen.create_image(surface)
+            self._ball_sprite_size = size
+        return self._ball_sprite
+
+    @staticmethod
+    def _lerp(previous, current, alpha):
+        """Linearly interpolate between previous and current positions, rounded to the nearest pixel."""
+        return round(previous + (current - previous) * alpha)
 
     def draw_net(self, screen):
-        """Draw a dashed net in the middle of the screen."""
+        """Draw a dashed net in the middle of the screen (scaled from logical units to the screen's size)."""
         net_x = self.screen_dims[0] // 2
         num_segments = 20
         segment_height = self.screen_dims[1] // (num_segments * 2)
@@ -44,6 +176,6 @@ class PlayingScreen:
             pygame.draw.rect(
                 screen,
                 settings.colors.WHITE,
-                (net_x - net_width // 2, segment_y, net_width, segment_height)
+                self._to_screen(pygame.Rect(net_x - net_width // 2, segment_y, net_width, segment_height))
             )
 
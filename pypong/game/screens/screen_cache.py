@@ -0,0 +1,78 @@
+import pygame
+from typing import Optional, Tuple
+
+class ScreenCache:
+    def __init__(self, size: Optional[Tuple[int, int]] = None):
+        """
+        Initialise a cache holding one pre-rendered screen surface.
+
+        The surface is tagged with a key describing everything it depends on (e.g. scores or key
+        bindings), so a screen only needs redrawing when that key changes.
+
+        If a size is given, content is always drawn at that (logical) size, and scaled once to the size of
+        the screen it is drawn on, rather than redrawn for each screen size.
+
+        Args:
+            size (tuple, optional): Logical size content is drawn at. Defaults to the screen's size.
+        """
+        self.size = size
+        self.surface: Optional[pygame.Surface] = None
+        self.key = None
+
+        # Surface converted to an image of the render backend, at the screen's size
+        self._image = None
+        self._image_size: Optional[Tuple[int, int]] = None
+
+    def get(self, screen, key):
+        """
+        Get the cached content as an image of the render backend if it was rendered with the same key,
+        scaled to the screen's size.
+
+        Args:
+            screen (RenderBackend): Render backend the image will be drawn with
+            key (hashable): Inputs the screen content depends on
+
+        Returns:
+            pygame.Surface or Texture or None: Cached image, or None if it must be redrawn
+        """
+        if self.surface is None or self.key != key:
+            return None
+        size = screen.get_size()
+        if self._image is not None and self._image_size == size:
+            return self._image
+
+        if self.surface.get_size() == size:
+            surface = self.surface
+        elif self.size is None:
+            return None
+        else:
+            try:
+                surface = pygame.transform.smoothscale(self.surface, size)
+            except ValueError:
+                # Smooth scaling needs 24 or 32-bit surfaces
+                surface = pygame.transform.scale(self.surface, size)
+        self._image = screen.create_image(surface)
+        self._image_size = size
+        return self._image
+
+    def new_surface(self, screen, key) -> pygame.Surface:
+        """
+        Get a surface to draw the screen content on, which is then cached under the given key.
+
+        Args:
+            screen (RenderBackend): Render backend the content will be drawn with
+            key (hashable): Inputs the screen content depends on
+
+        Returns:
+            pygame.Surface: Surface of the logical size (or the screen's size), in the backend's pixel format
+        """
+        size = self.size if self.size is not None else screen.get_size()
+        if self.surface is None or self.surface.get_size() != size:
+            self.surface = screen.create_surface(size)
+        self.key = key
+        self._image = None
+        return self.surface
+
+    def invalidate(self):
+        """Force the screen to be redrawn next time it is rendered."""
+        self.key = None
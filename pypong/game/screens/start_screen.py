@@ -1,5 +1,7 @@
 import pygame
 from ...config import settings
+from .screen_cache import ScreenCache
+from .text_cache import text_cache
 
 class StartScreen:
     def __init__(self, screen_dims):
@@ -7,7 +9,7 @@ class StartScreen:
         Initialise the start screen.
 
         Args:
-            screen_dims (tuple): Screen dimensions
+            screen_dims (tuple): Logical screen dimensions, which the layout is in
         """
         self.screen_dims = screen_dims
 
@@ -16,13 +18,33 @@ class StartScreen:
         self.menu_font = pygame.font.Font(settings.fonts.DEFAULT_FONT, settings.fonts.MENU_SIZE)
         self.controls_font = pygame.font.SysFont(settings.fonts.CONTROLS_FONT, settings.fonts.CONTROLS_SIZE, bold=True)
 
+        # Pre-rendered screen content
+        self.cache = ScreenCache(screen_dims)
+
 
     def render(self, screen, key_bindings):
         """
         Render the start screen.
 
+        The content is drawn once into a cached surface, and only redrawn when the key bindings change.
+
         Args:
-            screen (pygame.Surface): Pygame screen surface
+            screen (RenderBackend): Render backend to draw with
+            key_bindings (KeyBindings): Current key bindings for players
+        """
+        key = (key_bindings.left_up, key_bindings.left_down, key_bindings.right_up, key_bindings.right_down)
+        image = self.cache.get(screen, key)
+        if image is None:
+            self._draw(self.cache.new_surface(screen, key), key_bindings)
+            image = self.cache.get(screen, key)
+        screen.blit(image, (0, 0))
+
+    def _draw(self, screen, key_bindings):
+        """
+        Draw the start screen content.
+
+        Args:
+            screen (pygame.Surface): Surface to draw on
             key_bindings (KeyBindings): Current key bindings for players
         """
 
@@ -30,12 +52,12 @@ class StartScreen:
         screen.fill(settings.colors.BLACK)
 
         # Title
-        title_text = self.title_font.render("Welcome to PyPong!", True, settings.colors.WHITE)
+        title_text = text_cache.render(self.title_font, "Welcome to PyPong!", True, settings.colors.WHITE)
         title_rect = title_text.get_rect(center=(self.screen_dims[0] // 2, self.screen_dims[1] // 2 - 100))
         screen.blit(title_text, title_rect)
 
         # 'Start' instructions
-        start_text = self.menu_font.render("Press SPACE to start", True, settings.colors.WHITE)
+        start_text = text_cache.render(self.menu_font, "Press SPACE to start", True, settings.colors.WHITE)
         start_rect = start_text.get_rect(center=(self.screen_dims[0] // 2, self.screen_dims[1] // 2 + 50))
         screen.blit(start_text, start_rect)
 
@@ -51,23 +73,23 @@ class StartScreen:
             key_bindings (KeyBindings): Current key bindings for players
         """
         p1_controls_text = [
-            self.controls_font.render("Player 1 controls: ", True, settings.colors.WHITE),
-            self.controls_font.render(f"{pygame.key.name(key_bindings.left_up).upper()} - Move up",
-                                      True,
-                                      settings.colors.WHITE),
-            self.controls_font.render(f"{pygame.key.name(key_bindings.left_down).upper()} - Move down",
-                                      True,
-                                      settings.colors.WHITE)
+            text_cache.render(self.controls_font, "Player 1 controls: ", True, settings.colors.WHITE),
+            text_cache.render(self.controls_font, f"{pygame.key.name(key_bindings.left_up).upper()} - Move up",
+                              True,
+                              settings.colors.WHITE),
+            text_cache.render(self.controls_font, f"{pygame.key.name(key_bindings.left_down).upper()} - Move down",
+                              True,
+                              settings.colors.WHITE)
         ]
 
         p2_controls_text = [
-            self.controls_font.render("Player 2 controls: ", True, settings.colors.WHITE),
-            self.controls_font.render(f"{pygame.key.name(key_bindings.right_up).upper()} - Move up",
-                                      True,
-                                      settings.colors.WHITE),
-            self.controls_font.render(f"{pygame.key.name(key_bindings.right_down).upper()} - Move down",
-                                      True,
-                                      settings.colors.WHITE)
+            text_cache.render(self.controls_font, "Player 2 controls: ", True, settings.colors.WHITE),
+            text_cache.render(self.controls_font, f"{pygame.key.name(key_bindings.right_up).upper()} - Move up",
+                              True,
+                              settings.colors.WHITE),
+            text_cache.render(self.controls_font, f"{pygame.key.name(key_bindings.right_down).upper()} - Move down",
+                              True,
+                              settings.colors.WHITE)
         ]
 
         start_x = self.screen_dims[0] // 6
@@ -0,0 +1,68 @@
+import pygame
+from collections import OrderedDict
+from ...config import settings
+
+class TextCache:
+    def __init__(self, max_size: int = 128):
+        """
+        Initialise a least-recently-used cache of rendered text surfaces.
+
+        Args:
+            max_size (int, optional): Maximum number of surfaces kept before the least recently used
+                is evicted. Defaults to 128.
+
+        Raises:
+            ValueError: If max size is not a positive integer.
+        """
+        if max_size <= 0 or not isinstance(max_size, int):
+            raise ValueError("Max size must be a positive integer.")
+
+        self.max_size = max_size
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, antialias, color):
+        """
+        Return a rendered text surface, rasterising it with `font.render()` only if not already cached.
+
+        The returned surface is shared between callers, so it must not be drawn on.
+
+        Args:
+            font (pygame.font.Font): Font to render with
+            text (str): Text to render
+            antialias (bool): Whether to use antialiasing
+            color (str or tuple): Text colour
+
+        Returns:
+            pygame.Surface: Rendered text
+        """
+        if isinstance(color, pygame.Color):
+            color = tuple(color)
+        key = (font, text, antialias, color)
+
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_size:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """Remove all cached surfaces and reset hit/miss counts."""
+        self._surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._surfaces)
+
+
+# Create shared instance used by all screens
+text_cache = TextCache(settings.fonts.TEXT_CACHE_SIZE)
@@ -0,0 +1,56 @@
+import time
+import pygame
+from ...config import settings
+
+class TimingOverlay:
+    def __init__(self, update_interval: float = 0.5):
+        """
+        Initialise the frame timing overlay.
+
+        Args:
+            update_interval (float, optional): Seconds between refreshes of the displayed figures. Defaults to 0.5.
+        """
+        self.update_interval = update_interval
+        self.font = pygame.font.SysFont(settings.fonts.CONTROLS_FONT, settings.fonts.CONTROLS_SIZE)
+        self.surface = None
+        self.image = None
+        self.last_update = 0.0
+
+    def render(self, screen, profiler):
+        """
+        Render p50/p95/p99 durations of each frame phase in the top-left corner of the screen.
+
+        The overlay is opaque, so it can be drawn repeatedly over the dirty-rect playing screen.
+
+        Args:
+            screen (RenderBackend): Render backend to draw with
+            profiler (FrameProfiler): Profiler holding the frame timings
+
+        Returns:
+            pygame.Rect: Area of the screen covered by the overlay
+        """
+        now = time.perf_counter()
+        if self.surface is None or now - self.last_update >= self.update_interval:
+            self.surface = self._draw(profiler)
+            self.image = screen.create_image(self.surface)
+            self.last_update = now
+
+        rect = self.surface.get_rect(topleft=(20, 10))
+        screen.blit(self.image, rect)
+        return rect
+
+    def _draw(self, profiler):
+        """Draw the timing table onto a new surface."""
+        lines = [f"{'phase (ms)':<28}{'p50':>7}{'p95':>7}{'p99':>7}"]
+        for phase, values in profiler.summary().items():
+            lines.append(f"{phase:<28}{values['p50']:>7.2f}{values['p95']:>7.2f}{values['p99']:>7.2f}")
+
+        text = [self.font.render(line, True, settings.colors.WHITE) for line in lines]
+        padding = 5
+        line_height = self.font.get_linesize()
+        surface = pygame.Surface((max(t.get_width() for t in text) + padding * 2,
+                                  line_height * len(text) + padding * 2))
+        surface.fill((40, 40, 40))
+        for i, line_text in enumerate(text):
+            surface.blit(line_text, (padding, padding + i * line_height))
+        return surface
@@ -0,0 +1,88 @@
+from typing import List, Optional, Tuple
+import pygame
+from pygame._sdl2.video import Renderer, Texture, Window, error, get_drivers
+from .display import RenderBackend, render_dimensions
+
+def renderer_drivers() -> List[str]:
+    """Return the names of the SDL render drivers available on this machine (e.g. 'opengl', 'software')."""
+    return [driver.name for driver in get_drivers()]
+
+
+class TextureBackend(RenderBackend):
+    # The renderer's back buffer is undefined after presenting, so every frame is drawn in full
+    partial_updates = False
+
+    def __init__(self, window_dims: Tuple[int, int], logical_dims: Tuple[int, int], render_scale: float = 1.0,
+                 driver: Optional[str] = None, vsync: bool = False, title: str = "PyPong"):
+        """
+        Open the window with an SDL renderer, drawing filled rects and textures instead of software blits.
+
+        Content drawn as surfaces (the pre-rendered net background, text and cached screens) is uploaded
+        once as textures with `create_image()`, so each frame only submits draw calls to the renderer. The
+        renderer's logical size is the render resolution (`render_scale` times `logical_dims`), and SDL
+        scales it to fit the window, letterboxed if the aspect ratios differ.
+
+        Args:
+            window_dims (tuple): Window dimensions (width, height)
+            logical_dims (tuple): Logical playing field dimensions (width, height)
+            render_scale (float, optional): Render resolution relative to the logical resolution. Defaults to 1.
+            driver (str, optional): SDL render driver, one of `renderer_drivers()`. Defaults to SDL's choice.
+            vsync (bool, optional): Synchronise presenting with the display's refresh. Defaults to False.
+            title (str, optional): Window title. Defaults to "PyPong".
+
+        Raises:
+            ValueError: If the render scale is not positive or the driver is not available.
+            pygame.error: If the renderer cannot be created (e.g. OpenGL with no GPU).
+        """
+        if render_scale <= 0:
+            raise ValueError("Render scale must be positive.")
+        drivers = renderer_drivers()
+        if driver is not None and driver not in drivers:
+            raise ValueError(f"Render driver must be one of {', '.join(drivers)}.")
+
+        self.logical_dims = logical_dims
+        self.render_scale = render_scale
+        self.render_dims = render_dimensions(logical_dims, render_scale)
+        self.driver = driver
+
+        self.window = Window(title, size=window_dims)
+        index = drivers.index(driver) if driver is not None else -1
+        try:
+            self.renderer = Renderer(self.window, index=index, vsync=vsync)
+        except error as e:
+            self.window.destroy()
+            raise pygame.error(f"Could not create the {driver or 'default'} renderer: {e}") from e
+        self.renderer.logical_size = self.render_dims
+        self._color = None
+
+    def get_size(self) -> Tuple[int, int]:
+        return self.render_dims
+
+    def create_surface(self, size: Tuple[int, int]) -> pygame.Surface:
+        return pygame.Surface(size, 0, 32)
+
+    def create_image(self, surface: pygame.Surface) -> Texture:
+        return Texture.from_surface(self.renderer, surface)
+
+    def _set_color(self, color):
+        """Set the renderer's draw color, if it changed since the last fill."""
+        if color != self._color:
+            self.renderer.draw_color = pygame.Color(color)
+            self._color = color
+
+    def fill(self, color, rect=None):
+        self._set_color(color)
+        if rect is None:
+            self.renderer.clear()
+        else:
+            self.renderer.fill_rect(rect)
+
+    def blit(self, image: Texture, dest, area=None):
+        if area is None:
+            image.draw(dstrect=(dest[0], dest[1], image.width, image.height))
+        else:
+            area = pygame.Rect(area)
+            image.draw(srcrect=area, dstrect=(dest[0], dest[1], area.width, area.height))
+
+    def present(self, dirty_rects: Optional[List[pygame.Rect]] = None):
+        self.renderer.present()
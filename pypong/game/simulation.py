@@ -0,0 +1,390 @@
+import random
+from enum import Enum, auto
+from typing import NamedTuple, Optional, Tuple
+from ..config import GameState, settings
+from .objects import Ball
+from .objects import Paddle
+
+# Tick rate that ball and paddle speeds are defined at (pixels per 1/60th of a second)
+BASE_TICK_RATE = 60
+
+# Integer fields written by `Simulation.snapshot_into()`: tick, state, scores, winner, ball (x, y, h/v speed),
+# left and right paddles (y, v speed), and rally statistics (game start tick, hits, rally hits, longest rally)
+SNAPSHOT_SIZE = 17
+WINNERS = (None, "Player 1", "Player 2")
+
+class PaddleAction(Enum):
+    """Enumeration of paddle inputs, each equivalent to a single press of a player's up/down key."""
+    NONE = auto()
+    UP = auto()
+    DOWN = auto()
+
+class SimulationInputs(NamedTuple):
+    """
+    Inputs applied to the simulation for a single step.
+
+    Attributes:
+        left (PaddleAction): Action for the left paddle (Player 1).
+        right (PaddleAction): Action for the right paddle (Player 2).
+        advance (bool): Equivalent of pressing SPACE - starts, continues or restarts the game.
+    """
+    left: PaddleAction = PaddleAction.NONE
+    right: PaddleAction = PaddleAction.NONE
+    advance: bool = False
+
+class SimulationState(NamedTuple):
+    """Immutable snapshot of the simulation after a step."""
+    tick: int
+    current_state: GameState
+    score_p1: int
+    score_p2: int
+    winner: Optional[str]
+    ball_x: int
+    ball_y: int
+    ball_h_speed: int
+    ball_v_speed: int
+    l_paddle_y: int
+    l_paddle_v_speed: int
+    r_paddle_y: int
+    r_paddle_v_speed: int
+
+class Simulation:
+    def __init__(self, screen_dims: Optional[Tuple[int, int]] = None, winning_score: Optional[int] = None,
+                 win_by_two: Optional[bool] = None, seed: Optional[int] = None, dt: float = 1.0,
+                 swept_collisions: Optional[bool] = None):
+        """
+        Initialise the headless PyPong simulation.
+
+        Holds the ball, paddles, scores and game state, and advances them with `step()`. No display,
+        font or clock is required, so the simulation can be stepped as fast as the CPU allows.
+
+        Args:
+            screen_dims (tuple, optional): Playing field dimensions. Defaults to settings.screen.LOGICAL_DIMENSIONS.
+            winning_score (int, optional): Score required to win. Defaults to settings.game.WINNING_SCORE.
+            win_by_two (bool, optional): Whether a winning margin of 2 is required. Defaults to settings.game.WIN_BY_TWO.
+            seed (int, optional): Seed for the random ball starting position and direction. Defaults to a random seed.
+            dt (float, optional): Length of each step in base ticks (1/BASE_TICK_RATE seconds). Defaults to 1.
+            swept_collisions (bool, optional): Use swept (continuous) collision detection for the ball.
+                Defaults to settings.physics.SWEPT_COLLISIONS.
+        """
+        self.screen_dims = screen_dims if screen_dims is not None else settings.screen.LOGICAL_DIMENSIONS
+        self.seed = seed if seed is not None else random.randrange(2 ** 63)
+        self.rng = random.Random(self.seed)
+        self.tick = 0
+        self.dt = dt
+        self.swept_collisions = (swept_collisions if swept_collisions is not None
+                                 else settings.physics.SWEPT_COLLISIONS)
+
+        # Game state management
+        self.current_state = GameState.START_SCREEN
+        self.winning_score = winning_score if winning_score is not None else settings.game.WINNING_SCORE
+        self.win_by_two = win_by_two if win_by_two is not None else settings.game.WIN_BY_TWO
+        self.winner: Optional[str] = None
+
+        # Scoring
+        self.score_p1 = 0  # p1 is left paddle
+        self.score_p2 = 0
+
+        # Rally statistics for the current game
+        self.game_start_tick = 0  # Tick the current game started at
+        self.hits = 0  # Paddle hits
+        self.rally_hits = 0  # Paddle hits in the current rally
+        self.longest_rally = 0
+
+        # Game objects
+        self.ball = Ball(screen_size=self.screen_dims)
+        self.l_paddle = Paddle(left=True, screen_size=self.screen_dims) #p1
+        self.r_paddle = Paddle(left=False, screen_size=self.screen_dims)
+
+        # Optional MatchRecorder, notified of every input applied
+        self.recorder = None
+
+        # Optional MatchTelemetry, notified of paddle hits and points
+        self.telemetry = None
+
+        # Random generator state at the last snapshot, reused until the generator is next drawn from
+        self._rng_state = None
+
+    def reset_game(self):
+        """Reset the game to its initial state."""
+        # Reset scores
+        self.score_p1 = 0
+        self.score_p2 = 0
+        self.winner = None
+        self.current_state = GameState.START_SCREEN
+        self.game_start_tick = self.tick
+        self.hits = self.rally_hits = self.longest_rally = 0
+
+        # Reset game objects
+        self.reset_objects()
+
+    def reset_objects(self):
+        """Reset ball and paddles. Randomised starting direction for Ball."""
+        # Paddle speeds reset to 0
+        self.l_paddle.v_speed = self.r_paddle.v_speed = 0
+
+        # Paddles moved back to centre
+        self.l_paddle.rect.top = self.r_paddle.rect.top = (self.screen_dims[1] // 2 - self.r_paddle.rect.height // 2)
+
+        self.serve_ball(self.ball)
+
+    def serve_ball(self, ball: Ball):
+        """Move a ball to a random starting position (on net line) and give it a random direction."""
+        ball.rect.left = ball.screen_width // 2 - ball.side_length // 2
+        ball.rect.top = self.rng.randint(0, ball.screen_height)
+        ball.h_speed = self.rng.choice([-1, 1]) * 3
+        ball.v_speed = self.rng.choice([-1, 1]) * 5
+        self._rng_state = None
+
+    def update_game_objects(self):
+        """
+        Update ball position and check if edges or paddles have been hit.
+        Update paddle positions.
+        """
+        if self.swept_collisions:
+            # Move ball, bouncing off sides (top/bottom) and paddles at the exact time of impact
+            hits = self.ball.sweep(self.l_paddle, self.r_paddle, self.dt, tick=self.tick)
+        else:
+            # Update ball and paddle positions
+            self.ball.move(self.dt, self.tick)
+
+            # Change direction if ball hits either side (top/bottom)
+            self.ball.check_sides_hit()
+
+            # Change direction and speed if ball hits either paddle
+            if self.ball.h_speed < 0:
+                hits = self.ball.check_paddle_hit(self.l_paddle)
+            else:
+                hits = self.ball.check_paddle_hit(self.r_paddle)
+
+        if hits:
+            self.hits += hits
+            self.rally_hits += hits
+            if self.telemetry is not None:
+                for _ in range(hits):
+                    self.telemetry.paddle_hit(self.ball)
+
+        # End point if ball hits either end
+        if self.ball.check_ends_hit() == "left":
+            self.end_point("left")
+        if self.ball.check_ends_hit() == "right":
+            self.end_point("right")
+
+        self.l_paddle.move(self.dt, self.tick)
+        self.r_paddle.move(self.dt, self.tick)
+
+    def end_point(self, side: str = None):
+        """
+        Update score and transition to GAME_OVER state if game has been won. Reset ball and paddle positions.
+
+        Args:
+            side (str, optional): Side which lost the point ("left" or "right").
+        """
+        # Update scores and check if game won
+        if side == "left":
+            self.score_p2 += 1
+            if self.game_over_condition():
+                self.winner = "Player 2"
+                self.current_state = GameState.GAME_OVER
+            else:
+                self.current_state = GameState.BETWEEN_POINTS
+        elif side == "right":
+            self.score_p1 += 1
+            if self.game_over_condition():
+                self.winner = "Player 1"
+                self.current_state = GameState.GAME_OVER
+            else:
+                self.current_state = GameState.BETWEEN_POINTS
+        else:
+            raise ValueError(f"`end_point()` expected a string of either 'left' or 'right'")
+
+        self.end_rally()
+        if self.telemetry is not None:
+            self.telemetry.point_ended(side)
+        self.reset_objects()
+
+    def end_rally(self):
+        """Update the longest rally with the one that just ended, and start counting a new one."""
+        self.longest_rally = max(self.longest_rally, self.rally_hits)
+        self.rally_hits = 0
+
+    def game_over_condition(self) -> bool:
+        """Check if winning conditions have been fulfilled - return a boolean."""
+        if self.score_p1 >= self.winning_score or self.score_p2 >= self.winning_score:
+            if abs(self.score_p1 - self.score_p2) >= 2:
+                return True
+        return False
+
+    @staticmethod
+    def apply_paddle_action(paddle: Paddle, action: PaddleAction):
+        """
+        Apply a single up/down press to a paddle's vertical speed.
+
+        Pressing in the direction of travel (or from rest) increases speed by 2, up to the paddle's
+        limit of 10; pressing against the direction of travel stops the paddle.
+
+        Args:
+            paddle (Paddle): Paddle to update
+            action (PaddleAction): Action to apply
+        """
+        if action == PaddleAction.UP:
+            if paddle.v_speed >= 0:
+                paddle.v_speed = min(paddle.v_speed + 2, 10)
+            else:
+                paddle.v_speed = 0
+        elif action == PaddleAction.DOWN:
+            if paddle.v_speed <= 0:
+                paddle.v_speed = max(paddle.v_speed - 2, -10)
+            else:
+                paddle.v_speed = 0
+
+    def apply_inputs(self, inputs: SimulationInputs):
+        """
+        Apply inputs (state transitions and paddle actions) without advancing the simulation.
+
+        Args:
+            inputs (SimulationInputs): Inputs to apply
+        """
+        if self.recorder is not None:
+            self.recorder.record(self.tick, inputs)
+
+        if inputs.advance:
+            if self.current_state in (GameState.START_SCREEN, GameState.BETWEEN_POINTS):
+                self.current_state = GameState.PLAYING
+            elif self.current_state == GameState.GAME_OVER:
+                self.reset_game()
+
+        if self.current_state == GameState.PLAYING:
+            self.apply_paddle_action(self.l_paddle, inputs.left)
+            self.apply_paddle_action(self.r_paddle, inputs.right)
+
+    def step(self, inputs: Optional[SimulationInputs] = None) -> SimulationState:
+        """
+        Apply inputs and advance the simulation by one tick.
+
+        Game objects are only updated while in the PLAYING state.
+
+        Args:
+            inputs (SimulationInputs, optional): Inputs for this tick. Defaults to no input.
+
+        Returns:
+            SimulationState: State of the simulation after the tick
+        """
+        if inputs is not None:
+            self.apply_inputs(inputs)
+
+        if self.current_state == GameState.PLAYING:
+            self.update_game_objects()
+
+        self.tick += 1
+        return self.get_state()
+
+    def get_state(self) -> SimulationState:
+        """Return an immutable snapshot of the current simulation state."""
+        return SimulationState(
+            tick=self.tick,
+            current_state=self.current_state,
+            score_p1=self.score_p1,
+            score_p2=self.score_p2,
+            winner=self.winner,
+            ball_x=self.ball.rect.x,
+            ball_y=self.ball.rect.y,
+            ball_h_speed=self.ball.h_speed,
+            ball_v_speed=self.ball.v_speed,
+            l_paddle_y=self.l_paddle.rect.y,
+            l_paddle_v_speed=self.l_paddle.v_speed,
+            r_paddle_y=self.r_paddle.rect.y,
+            r_paddle_v_speed=self.r_paddle.v_speed,
+        )
+
+    def set_state(self, state: SimulationState):
+        """
+        Overwrite the simulation's tick, scores, game state and object positions and speeds with a snapshot.
+
+        The random number generator and rally statistics are not part of the snapshot, so are left unchanged
+        (use `restore_from()` to put those back too).
+
+        Args:
+            state (SimulationState): State to restore
+        """
+        self.tick = state.tick
+        self.current_state = state.current_state
+        self.score_p1 = state.score_p1
+        self.score_p2 = state.score_p2
+        self.winner = state.winner
+        self.ball.rect.topleft = (state.ball_x, state.ball_y)
+        self.ball.h_speed = state.ball_h_speed
+        self.ball.v_speed = state.ball_v_speed
+        self.l_paddle.rect.y = state.l_paddle_y
+        self.l_paddle.v_speed = state.l_paddle_v_speed
+        self.r_paddle.rect.y = state.r_paddle_y
+        self.r_paddle.v_speed = state.r_paddle_v_speed
+
+    def snapshot_into(self, buffer, offset: int = 0):
+        """
+        Write the complete simulation state as SNAPSHOT_SIZE integers into a preallocated buffer.
+
+        Together with the returned random generator state, this is enough for `restore_from()` to put the
+        simulation back exactly, including future ball serves. The generator state is only copied after
+        it has been drawn from (once per point), so snapshots are cheap enough to take every tick.
+
+        Args:
+            buffer (array or list): Integer buffer to write to (e.g. an `array.array('q')`)
+            offset (int, optional): Index to start writing at. Defaults to 0.
+
+        Returns:
+            object: Random generator state, to pass back to `restore_from()`
+        """
+        ball, l_paddle, r_paddle = self.ball, self.l_paddle, self.r_paddle
+        buffer[offset] = self.tick
+        buffer[offset + 1] = self.current_state.value
+        buffer[offset + 2] = self.score_p1
+        buffer[offset + 3] = self.score_p2
+        buffer[offset + 4] = WINNERS.index(self.winner)
+        buffer[offset + 5] = ball.rect.x
+        buffer[offset + 6] = ball.rect.y
+        buffer[offset + 7] = ball.h_speed
+        buffer[offset + 8] = ball.v_speed
+        buffer[offset + 9] = l_paddle.rect.y
+        buffer[offset + 10] = l_paddle.v_speed
+        buffer[offset + 11] = r_paddle.rect.y
+        buffer[offset + 12] = r_paddle.v_speed
+        buffer[offset + 13] = self.game_start_tick
+        buffer[offset + 14] = self.hits
+        buffer[offset + 15] = self.rally_hits
+        buffer[offset + 16] = self.longest_rally
+
+        if self._rng_state is None:
+            self._rng_state = self.rng.getstate()
+        return self._rng_state
+
+    def restore_from(self, buffer, offset: int, rng_state):
+        """
+        Restore the simulation from a snapshot written by `snapshot_into()`.
+
+        Args:
+            buffer (array or list): Buffer holding the snapshot
+            offset (int): Index the snapshot starts at
+            rng_state (object): Random generator state returned when the snapshot was taken
+        """
+        self.tick = buffer[offset]
+        self.current_state = GameState(buffer[offset + 1])
+        self.score_p1 = buffer[offset + 2]
+        self.score_p2 = buffer[offset + 3]
+        self.winner = WINNERS[buffer[offset + 4]]
+        self.ball.rect.x = buffer[offset + 5]
+        self.ball.rect.y = buffer[offset + 6]
+        self.ball.h_speed = buffer[offset + 7]
+        self.ball.v_speed = buffer[offset + 8]
+        self.l_paddle.rect.y = buffer[offset + 9]
+        self.l_paddle.v_speed = buffer[offset + 10]
+        self.r_paddle.rect.y = buffer[offset + 11]
+        self.r_paddle.v_speed = buffer[offset + 12]
+        self.game_start_tick = buffer[offset + 13]
+        self.hits = buffer[offset + 14]
+        self.rally_hits = buffer[offset + 15]
+        self.longest_rally = buffer[offset + 16]
+
+        if rng_state is not self._rng_state:
+            self.rng.setstate(rng_state)
+            self._rng_state = rng_state
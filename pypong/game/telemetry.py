@@ -0,0 +1,295 @@
+import json
+import logging
+import math
+import os
+import queue
+import threading
+import time
+from typing import List
+from ..config import GameState
+from .objects import Ball
+from .simulation import BASE_TICK_RATE, Simulation
+
+_STOP = object()  # Queued by `TelemetryWriter.close()` to stop the writer thread
+
+class TelemetryWriter:
+    def __init__(self, path: str, max_bytes: int = 10_000_000, backup_count: int = 5, batch_size: int = 64,
+                 flush_interval: float = 1.0):
+        """
+        Write telemetry events as JSON lines from a background thread.
+
+        `emit()` only puts the event on a queue, so the caller (the frame loop) never waits on
+        serialisation or disk I/O. The writer thread serialises events in batches, writing once
+        `batch_size` events are waiting or `flush_interval` seconds have passed. When the file would
+        grow past `max_bytes`, it is rotated: `name.jsonl` becomes `name.1.jsonl`, `name.1.jsonl`
+        becomes `name.2.jsonl`, and so on, keeping at most `backup_count` old files.
+
+        Args:
+            path (str): File to write (its directory is created if missing)
+            max_bytes (int, optional): Size at which the file is rotated. Defaults to 10,000,000.
+            backup_count (int, optional): Rotated files kept. Defaults to 5.
+            batch_size (int, optional): Events written together. Defaults to 64.
+            flush_interval (float, optional): Longest time (seconds) an event waits to be written. Defaults to 1.
+
+        Raises:
+            ValueError: If max_bytes, batch_size or flush_interval is not positive, or backup_count is negative.
+        """
+        if max_bytes <= 0 or batch_size <= 0 or flush_interval <= 0:
+            raise ValueError("Max bytes, batch size and flush interval must be positive.")
+        if backup_count < 0:
+            raise ValueError("Backup count must be a non-negative integer.")
+
+        self.logger = logging.getLogger(__name__)
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        # Writer statistics
+        self.events_written = 0
+        self.batches_written = 0
+        self.rotations = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "a", encoding="utf-8")
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="telemetry-writer", daemon=True)
+        self._thread.start()
+
+    def emit(self, event: dict):
+        """
+        Queue an event to be written (never blocks).
+
+        Args:
+            event (dict): JSON-serialisable event, which must not be modified afterwards
+        """
+        self._queue.put(event)
+
+    def close(self):
+        """Write every queued event, stop the writer thread and close the file."""
+        if not self._thread.is_alive():
+            return
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._file.close()
+
+    def _run(self):
+        """Writer thread: collect events into batches and write them."""
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            try:
+                event = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                event = None
+
+            stopping = event is _STOP
+            if event is not None and not stopping:
+                batch.append(event)
+                # Take whatever else is already waiting, up to a full batch
+                while len(batch) < self.batch_size:
+                    try:
+                        event = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if event is _STOP:
+                        stopping = True
+                        break
+                    batch.append(event)
+
+            if batch and (stopping or len(batch) >= self.batch_size or time.monotonic() >= deadline):
+                self._write(batch)
+                batch = []
+            if time.monotonic() >= deadline:
+                deadline = time.monotonic() + self.flush_interval
+            if stopping:
+                return
+
+    def _write(self, batch: List[dict]):
+        """Serialise and write a batch of events, rotating the file first if it would grow too large."""
+        data = "".join(json.dumps(event, separators=(",", ":")) + "\n" for event in batch)
+        try:
+            if self._file.tell() > 0 and self._file.tell() + len(data) > self.max_bytes:
+                self._rotate()
+            self._file.write(data)
+            self._file.flush()
+        except (OSError, ValueError) as e:
+            # Telemetry must never take the game down - drop the batch
+            self.logger.warning(f"Dropped {len(batch)} telemetry events: {e}")
+            return
+        self.events_written += len(batch)
+        self.batches_written += 1
+
+    def _rotated_path(self, index: int) -> str:
+        """Path of the index-th rotated file (e.g. telemetry.2.jsonl)."""
+        root, extension = os.path.splitext(self.path)
+        return f"{root}.{index}{extension}"
+
+    def _rotate(self):
+        """
+        Shift rotated files up by one, move the current file to index 1 and start a new file.
+
+        The file is reopened even if moving files fails, so later batches can still be written (to the
+        current file, if it could not be moved).
+        """
+        self._file.close()
+        try:
+            if self.backup_count > 0:
+                for index in range(self.backup_count - 1, 0, -1):
+                    source = self._rotated_path(index)
+                    if os.path.exists(source):
+                        os.replace(source, self._rotated_path(index + 1))
+                os.replace(self.path, self._rotated_path(1))
+            else:
+                os.remove(self.path)
+            self.rotations += 1
+        finally:
+            self._file = open(self.path, "a", encoding="utf-8")
+
+
+class MatchTelemetry:
+    def __init__(self, writer: TelemetryWriter, simulation: Simulation, tick_rate: int = BASE_TICK_RATE):
+        """
+        Collect per-point and per-rally statistics from a simulation, and emit them as telemetry events.
+
+        The telemetry attaches itself to the simulation, which notifies it of paddle hits and points;
+        the game notifies it of state changes made by player input, rewinds and each frame's duration. Events:
+
+        - "session_start": seed, playing field, winning score, tick rate and number of balls
+        - "state": a transition between game states, e.g. from START_SCREEN to PLAYING
+        - "point": which side scored, the score, rally length (paddle hits), ball speed after each hit,
+          time the point took (in simulated and wall-clock seconds) and frame time statistics
+        - "rewind": ticks and seconds rewound, and the score rewound to
+        - "game_over": winner, final score and number of points
+        - "session_end": totals for the session
+
+        With several balls in play (`MultiballSimulation`) rallies overlap, so "point" events only carry
+        the scorer and the score.
+
+        Args:
+            writer (TelemetryWriter): Writer to emit events through
+            simulation (Simulation): Simulation to collect statistics from
+            tick_rate (int, optional): Physics tick rate the simulation is stepped at. Defaults to BASE_TICK_RATE.
+        """
+        self.writer = writer
+        self.simulation = simulation
+        self.tick_rate = tick_rate
+        balls = len(getattr(simulation, "balls", (simulation.ball,)))
+        self.rally_stats = balls == 1
+
+        # Current rally
+        self._hit_speeds: List[float] = []
+        self._hit_ticks: List[int] = []
+        self._rally_start_tick = simulation.tick
+        self._rally_start_time = time.monotonic()
+        self._frame_times: List[float] = []
+
+        # Session totals
+        self.points = 0
+        self.hits = 0
+        self.frames = 0
+
+        simulation.telemetry = self
+        self._emit("session_start", seed=simulation.seed, screen=list(simulation.screen_dims),
+                   winning_score=simulation.winning_score, tick_rate=tick_rate, balls=balls)
+
+    def _emit(self, event: str, **fields):
+        """Emit an event, stamped with the wall-clock time and simulation tick."""
+        self.writer.emit({"event": event, "time": time.time(), "tick": self.simulation.tick, **fields})
+
+    def paddle_hit(self, ball: Ball):
+        """Record a paddle hit, with the ball's speed after it."""
+        self.hits += 1
+        if self.rally_stats:
+            self._hit_speeds.append(round(math.hypot(ball.h_speed, ball.v_speed), 2))
+            self._hit_ticks.append(self.simulation.tick)
+
+    def point_ended(self, side: str):
+        """
+        Emit the statistics of the rally that just ended (and the result, if the game is over).
+
+        Args:
+            side (str): Side which lost the point ("left" or "right")
+        """
+        simulation = self.simulation
+        self.points += 1
+        scorer = "Player 1" if side == "right" else "Player 2"
+        score = [simulation.score_p1, simulation.score_p2]
+        if self.rally_stats:
+            self._emit("point", scorer=scorer, score=score, rally_length=len(self._hit_speeds),
+                       hit_speeds=self._hit_speeds,
+                       duration=round((simulation.tick - self._rally_start_tick) / self.tick_rate, 3),
+                       wall_duration=round(time.monotonic() - self._rally_start_time, 3),
+                       frames=self._frame_stats())
+        else:
+            self._emit("point", scorer=scorer, score=score)
+        if simulation.current_state == GameState.GAME_OVER:
+            self._emit("game_over", winner=simulation.winner, score=[simulation.score_p1, simulation.score_p2],
+                       points=simulation.score_p1 + simulation.score_p2)
+        self._start_rally()
+
+    def state_changed(self, previous: GameState):
+        """
+        Emit a transition between game states, starting a new rally if play has (re)started.
+
+        Args:
+            previous (GameState): State before the transition
+        """
+        current = self.simulation.current_state
+        self._emit("state", previous=previous.name, current=current.name)
+        if current == GameState.PLAYING:
+            self._start_rally()
+
+    def rewound(self, ticks: int):
+        """
+        Emit a rewind, forgetting the current rally's paddle hits that were undone.
+
+        A rewind into an earlier point carries on the current rally's statistics from there; the "rewind"
+        event marks where, so readers can discard the point events it undid.
+
+        Args:
+            ticks (int): Number of physics ticks rewound
+        """
+        simulation = self.simulation
+        self._emit("rewind", ticks=ticks, seconds=round(ticks / self.tick_rate, 3),
+                   score=[simulation.score_p1, simulation.score_p2])
+        kept = sum(1 for tick in self._hit_ticks if tick < simulation.tick)
+        self._hit_speeds = self._hit_speeds[:kept]
+        del self._hit_ticks[kept:]
+        self._rally_start_tick = min(self._rally_start_tick, simulation.tick)
+
+    def frame(self, seconds: float):
+        """Record a frame's duration."""
+        self.frames += 1
+        if self.rally_stats:
+            self._frame_times.append(seconds)
+
+    def _start_rally(self):
+        """Reset the current rally's statistics."""
+        self._hit_speeds = []  # Not cleared in place, as the previous list was handed to the writer
+        self._hit_ticks.clear()
+        self._rally_start_tick = self.simulation.tick
+        self._rally_start_time = time.monotonic()
+        self._frame_times.clear()
+
+    def _frame_stats(self) -> dict:
+        """Frame count and mean, p95 and max frame times (milliseconds) for the current rally."""
+        times = sorted(self._frame_times)
+        if not times:
+            return {"count": 0}
+        return {
+            "count": len(times),
+            "mean_ms": round(1000 * sum(times) / len(times), 3),
+            "p95_ms": round(1000 * times[min(len(times) - 1, int(0.95 * len(times)))], 3),
+            "max_ms": round(1000 * times[-1], 3),
+        }
+
+    def close(self):
+        """Emit the session totals, detach from the simulation and close the writer."""
+        self._emit("session_end", points=self.points, hits=self.hits, frames=self.frames)
+        if self.simulation.telemetry is self:
+            self.simulation.telemetry = None
+        self.writer.close()
@@ -0,0 +1,270 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, List, NamedTuple, Optional, Tuple
+from ..config import GameState, settings
+from .game import Game
+from .multiball import MultiballSimulation
+from .recording import MatchRecording
+from .results import GameResult
+from .simulation import Simulation, SimulationInputs, SimulationState
+
+class SimulationSnapshot(NamedTuple):
+    """Immutable state handed from the simulation thread to the render thread after each tick."""
+    sequence: int  # Number of ticks run before this snapshot was published
+    time: float  # time.perf_counter() when it was published
+    current: SimulationState
+    previous: Optional[SimulationState]  # State before the tick, or None if there is nothing to interpolate from
+    extra_balls: Tuple[Tuple[int, int], ...] = ()  # (x, y) of any extra balls (multiball mode)
+    previous_extra_balls: Tuple[Tuple[int, int], ...] = ()  # (x, y) of any extra balls before the tick
+
+
+class SnapshotBuffer:
+    def __init__(self):
+        """
+        Initialise a double buffer of snapshots, written by one thread and read by another.
+
+        The writer fills the back slot and then flips which slot is the front, in a single assignment,
+        so the reader always finds a complete snapshot and neither side ever waits for the other.
+        """
+        self._slots: List[Optional[SimulationSnapshot]] = [None, None]
+        self._front = 0
+
+    def publish(self, snapshot: SimulationSnapshot):
+        """Write a snapshot into the back slot and make it the front (writer thread only)."""
+        back = 1 - self._front
+        self._slots[back] = snapshot
+        self._front = back
+
+    def latest(self) -> Optional[SimulationSnapshot]:
+        """Return the most recently published snapshot (None if nothing has been published yet)."""
+        return self._slots[self._front]
+
+
+class SimulationThread:
+    def __init__(self, simulation: Simulation, tick_rate: float, tick: Callable[[], None],
+                 max_frame_time: float = 0.25):
+        """
+        Initialise a thread running a simulation at a fixed tick rate, independently of rendering.
+
+        Each tick, commands queued by `submit()` are run in order, then `tick()`, then a snapshot of the
+        simulation is published to `snapshots`. The simulation must only be touched from this thread
+        while it runs, so other threads change it by submitting commands. If the thread falls more than
+        `max_frame_time` behind (e.g. the process was suspended), the time is dropped rather than caught up.
+
+        Args:
+            simulation (Simulation): Simulation owned by the thread
+            tick_rate (float): Ticks per second
+            tick (callable): Advances the simulation by one tick
+            max_frame_time (float, optional): Longest delay (seconds) caught up on. Defaults to 0.25.
+
+        Raises:
+            ValueError: If tick rate is not a positive number.
+        """
+        if tick_rate <= 0:
+            raise ValueError("Tick rate must be a positive number.")
+
+        self.simulation = simulation
+        self.dt = 1.0 / tick_rate
+        self.tick = tick
+        self.max_frame_time = max_frame_time
+        self.snapshots = SnapshotBuffer()
+
+        # Thread statistics
+        self.ticks = 0
+        self.dropped_time = 0.0
+
+        self._commands: queue.SimpleQueue = queue.SimpleQueue()
+        self._stopping = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="simulation", daemon=True)
+        self._publish(None)
+
+    def start(self):
+        """Start ticking."""
+        self._thread.start()
+
+    def stop(self):
+        """Stop ticking, after the current tick, and wait for the thread to finish."""
+        self._stopping.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def submit(self, command: Callable) -> Future:
+        """
+        Queue a command to run on the simulation thread before its next tick (or run it now, if the thread
+        is not running).
+
+        Args:
+            command (callable): Function taking no arguments
+
+        Returns:
+            Future: Resolved with the command's result (or exception) once it has run
+        """
+        future = Future()
+        self._commands.put((command, future))
+        if not self._thread.is_alive():
+            self._run_commands()
+        return future
+
+    def _run_commands(self):
+        """Run every queued command."""
+        while True:
+            try:
+                command, future = self._commands.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                future.set_result(command())
+            except Exception as e:
+                future.set_exception(e)
+
+    def _extra_balls(self) -> Tuple[Tuple[int, int], ...]:
+        """Return the (x, y) of the simulation's extra balls (multiball mode)."""
+        return tuple(ball.rect.topleft for ball in getattr(self.simulation, "extra_balls", ()))
+
+    def _publish(self, previous: Optional[SimulationState], previous_extra_balls: Tuple[Tuple[int, int], ...] = ()):
+        """Publish the simulation's current state, with the state before the tick for interpolation."""
+        current = self.simulation.get_state()
+        if previous is not None and (previous.current_state != GameState.PLAYING
+                                     or current.current_state != GameState.PLAYING):
+            # Nothing to interpolate across a point ending or starting
+            previous = None
+            previous_extra_balls = ()
+        self.snapshots.publish(SimulationSnapshot(self.ticks, time.perf_counter(), current, previous,
+                                                  self._extra_balls(), previous_extra_balls))
+
+    def _run(self):
+        """Simulation thread: run commands and a tick, publish, then sleep until the next tick is due."""
+        next_tick = time.perf_counter()
+        while not self._stopping.is_set():
+            self._run_commands()
+            previous, previous_extra_balls = self.simulation.get_state(), self._extra_balls()
+            self.tick()
+            self.ticks += 1
+            self._publish(previous, previous_extra_balls)
+
+            next_tick += self.dt
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                self._stopping.wait(delay)
+            elif -delay > self.max_frame_time:
+                self.dropped_time += -delay
+                next_tick = time.perf_counter()
+
+        # Commands submitted after the last tick still get an answer
+        self._run_commands()
+
+
+class ThreadedGame(Game):
+    def __init__(self, replay: Optional[MatchRecording] = None, replay_speed: float = 1.0):
+        """
+        Initialise a game whose simulation runs on its own thread, with events and rendering on the main thread.
+
+        The simulation thread ticks at the physics tick rate (`SimulationThread`), and hands each tick's
+        state to the main thread through a double-buffered immutable snapshot, so a slow frame (e.g.
+        waiting on `display.flip()`) no longer delays physics, and vice versa. The main thread copies the
+        latest snapshot into a view of the simulation before drawing, interpolating between its previous and
+        current states by the time since it was published. Player inputs and rewinds are submitted to the
+        simulation thread, and applied before its next tick.
+
+        Args:
+            replay (MatchRecording, optional): Recorded match to play back instead of taking keyboard input.
+            replay_speed (float, optional): Playback speed multiplier for a replay. Defaults to 1.
+        """
+        super().__init__(replay, replay_speed)
+        # The simulation belongs to the simulation thread, so the main thread draws a copy of its latest state
+        self.engine = self.simulation
+        self.simulation = self._create_view(self.engine)
+        self.sim_thread = SimulationThread(self.engine, self.timestep.tick_rate, self._tick,
+                                           settings.physics.MAX_FRAME_TIME)
+        self.snapshot = self.sim_thread.snapshots.latest()
+        # Static screens change when the simulation thread applies SPACE, so check for snapshots every tick
+        self.idle_fps = max(1, round(self.timestep.tick_rate))
+
+    @staticmethod
+    def _create_view(engine: Simulation) -> Simulation:
+        """Create a simulation of the same kind as the engine, holding its drawn state."""
+        if isinstance(engine, MultiballSimulation):
+            return MultiballSimulation(len(engine.balls), engine.screen_dims, engine.winning_score, engine.win_by_two)
+        return Simulation(engine.screen_dims, engine.winning_score, engine.win_by_two)
+
+    def _tick(self):
+        """Run one physics tick on the engine (simulation thread), as `Game.update_physics()` does for each tick due."""
+        self.run_tick(self.engine)
+
+    def _apply_inputs_now(self, inputs: SimulationInputs):
+        """Apply inputs to the engine (simulation thread), emitting telemetry for any state change."""
+        previous_state = self.engine.current_state
+        self.engine.apply_inputs(inputs)
+        if self.telemetry is not None and self.engine.current_state != previous_state:
+            self.telemetry.state_changed(previous_state)
+
+    def apply_inputs(self, inputs: SimulationInputs):
+        """
+        Submit inputs from the local players to the simulation thread, to apply before its next tick.
+
+        Args:
+            inputs (SimulationInputs): Inputs to apply
+        """
+        self.sim_thread.submit(lambda: self._apply_inputs_now(inputs))
+
+    def _rewind_now(self, ticks: int) -> int:
+        """Rewind the engine (simulation thread), emitting telemetry if anything was rewound."""
+        rewound = self.rewind_buffer.rewind(self.engine, ticks)
+        if rewound and self.telemetry is not None:
+            self.telemetry.rewound(rewound)
+        return rewound
+
+    def rewind(self, seconds: Optional[float] = None) -> int:
+        """
+        Rewind the game on the simulation thread, waiting for it to be done (see `Game.rewind()`).
+
+        Args:
+            seconds (float, optional): How far to go back. Defaults to settings.game.REWIND_SECONDS.
+
+        Returns:
+            int: Number of physics ticks rewound
+        """
+        if self.rewind_buffer is None:
+            return 0
+        if seconds is None:
+            seconds = settings.game.REWIND_SECONDS
+        ticks = round(seconds * self.timestep.tick_rate)
+        rewound = self.sim_thread.submit(lambda: self._rewind_now(ticks)).result()
+        if rewound:
+            self.logger.info(f"Rewound {rewound / self.timestep.tick_rate:.1f} seconds")
+        return rewound
+
+    def update_physics(self):
+        """Copy the latest snapshot from the simulation thread into the drawn view of the simulation."""
+        snapshot = self.sim_thread.snapshots.latest()
+        if snapshot is self.snapshot:
+            return
+        self.snapshot = snapshot
+        self.simulation.set_state(snapshot.current)
+        for ball, position in zip(getattr(self.simulation, "extra_balls", ()), snapshot.extra_balls):
+            ball.rect.topleft = position
+        self.previous_state = snapshot.previous
+        self.previous_extra_balls = snapshot.previous_extra_balls
+
+    @property
+    def alpha(self) -> float:
+        """Fraction of a tick since the latest snapshot was published, for interpolating towards it."""
+        return min(1.0, (time.perf_counter() - self.snapshot.time) / self.sim_thread.dt)
+
+    def game_result(self) -> GameResult:
+        """Return the result of the current game, read from the engine (which holds the seed and rally statistics)."""
+        # The engine belongs to the simulation thread, which may be applying a queued restart or rewind
+        names = self.player_names()
+        return self.sim_thread.submit(lambda: GameResult.from_simulation(self.engine, *names)).result()
+
+    def run(self):
+        """Start the simulation thread, then run the main loop."""
+        self.sim_thread.start()
+        super().run()
+
+    def close(self):
+        """Stop the simulation thread before closing everything it writes to."""
+        self.sim_thread.stop()
+        super().close()
@@ -0,0 +1,64 @@
+import time
+from typing import Callable
+
+class FixedTimestep:
+    def __init__(self, tick_rate: int, max_frame_time: float = 0.25,
+                 time_source: Callable[[], float] = time.perf_counter):
+        """
+        Initialise a fixed-timestep scheduler.
+
+        Accumulates real elapsed time between frames and converts it into a whole number of fixed
+        physics ticks, so the simulation runs at `tick_rate` regardless of the render frame rate.
+        Leftover time is exposed as `alpha` for interpolating positions when drawing.
+
+        Args:
+            tick_rate (int): Physics ticks per second.
+            max_frame_time (float, optional): Longest frame (in seconds) to catch up on. Longer hitches
+                are clamped so the simulation never spirals trying to catch up. Defaults to 0.25.
+            time_source (callable, optional): Monotonic clock returning seconds. Defaults to time.perf_counter.
+
+        Raises:
+            ValueError: If tick rate is not a positive number.
+        """
+        if tick_rate <= 0:
+            raise ValueError("Tick rate must be a positive number.")
+
+        self.tick_rate = tick_rate
+        self.dt = 1.0 / tick_rate
+        self.max_frame_time = max_frame_time
+        self.time_source = time_source
+        self.accumulator = 0.0
+        self.last_time = None
+
+    def reset(self):
+        """Discard accumulated time and restart timing from the next call to `advance()`."""
+        self.accumulator = 0.0
+        self.last_time = None
+
+    def advance(self) -> int:
+        """
+        Add the time elapsed since the last call to the accumulator.
+
+        Returns:
+            int: Number of fixed ticks due to be simulated this frame
+        """
+        now = self.time_source()
+        if self.last_time is None:
+            self.last_time = now
+        frame_time = min(now - self.last_time, self.max_frame_time)
+        self.last_time = now
+
+        self.accumulator += frame_time
+        ticks = int(self.accumulator // self.dt)
+        self.accumulator -= ticks * self.dt
+        return ticks
+
+    @property
+    def alpha(self) -> float:
+        """
+        Get fraction of a tick left in the accumulator, for interpolating between the previous and current tick.
+
+        Returns:
+            float: Interpolation factor between 0 and 1
+        """
+        return self.accumulator / self.dt
@@ -0,0 +1,187 @@
+import copy
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import permutations
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+from ..config import GameState
+from .controllers import Controller
+from .simulation import Simulation, SimulationInputs, SimulationState
+
+class Fixture(NamedTuple):
+    """A match to be played between two named controllers."""
+    match_id: int
+    left: str
+    right: str
+    seed: int
+
+class MatchResult(NamedTuple):
+    """Result of a tournament match."""
+    match_id: int
+    left: str
+    right: str
+    seed: int
+    winner: Optional[str]  # Controller name, or None if the match reached max ticks unfinished
+    score_left: int
+    score_right: int
+    ticks: int
+    hits: int = 0  # Paddle hits in the match
+    longest_rally: int = 0  # Most paddle hits in one point
+
+def play_match(left: Controller, right: Controller, seed: Optional[int] = None, max_ticks: int = 100_000,
+               screen_dims: Optional[Tuple[int, int]] = None, winning_score: Optional[int] = None) -> SimulationState:
+    """
+    Play a headless match between two controllers, continuing automatically after each point.
+
+    Args:
+        left (Controller): Controller for the left paddle (Player 1)
+        right (Controller): Controller for the right paddle (Player 2)
+        seed (int, optional): Simulation seed
+        max_ticks (int, optional): Ticks after which an unfinished match is abandoned. Defaults to 100,000.
+        screen_dims (tuple, optional): Playing field dimensions. Defaults to settings.screen.LOGICAL_DIMENSIONS.
+        winning_score (int, optional): Score required to win. Defaults to settings.game.WINNING_SCORE.
+
+    Returns:
+        SimulationState: Final state of the match
+    """
+    return _play(Simulation(screen_dims, winning_score=winning_score, seed=seed), left, right, max_ticks)
+
+def _play(sim: Simulation, left: Controller, right: Controller, max_ticks: int) -> SimulationState:
+    """Play a match to the end (or max ticks) on a fresh simulation, returning its final state."""
+    state = sim.get_state()
+    while state.current_state != GameState.GAME_OVER and state.tick < max_ticks:
+        if state.current_state != GameState.PLAYING:
+            inputs = SimulationInputs(advance=True)
+        else:
+            inputs = SimulationInputs(left=left(state, True), right=right(state, False))
+        state = sim.step(inputs)
+    return state
+
+
+# Controllers and match settings for the current worker process (set by `_init_worker`)
+_worker_controllers: Dict[str, Controller] = {}
+_worker_options: dict = {}
+
+def _init_worker(controllers: Dict[str, Controller], options: dict):
+    """Store the controllers and match settings in a worker process, so they are only pickled once per worker."""
+    global _worker_controllers, _worker_options
+    _worker_controllers = controllers
+    _worker_options = options
+
+def _match_controller(controller: Controller, seed: int) -> Controller:
+    """Return a fresh copy of a controller for one match, reseeded from the match if it has random choices."""
+    controller = copy.deepcopy(controller)
+    if hasattr(controller, "reseed"):
+        controller.reseed(seed)
+    return controller
+
+def _play_fixtures(fixtures: List[Fixture]) -> List[MatchResult]:
+    """Play a chunk of fixtures in a worker process."""
+    results = []
+    options = _worker_options
+    for fixture in fixtures:
+        # Controllers start every match afresh, so results don't depend on which worker played which matches
+        seeds = random.Random(fixture.seed)
+        left = _match_controller(_worker_controllers[fixture.left], seeds.randrange(2 ** 63))
+        right = _match_controller(_worker_controllers[fixture.right], seeds.randrange(2 ** 63))
+        sim = Simulation(options["screen_dims"], winning_score=options["winning_score"], seed=fixture.seed)
+        state = _play(sim, left, right, options["max_ticks"])
+        winner = None
+        if state.winner == "Player 1":
+            winner = fixture.left
+        elif state.winner == "Player 2":
+            winner = fixture.right
+        results.append(MatchResult(fixture.match_id, fixture.left, fixture.right, fixture.seed, winner,
+                                   state.score_p1, state.score_p2, state.tick, sim.hits,
+                                   max(sim.longest_rally, sim.rally_hits)))
+    return results
+
+
+class Tournament:
+    def __init__(self, controllers: Dict[str, Controller], matches_per_pairing: int = 10,
+                 max_workers: Optional[int] = None, chunk_size: int = 1, seed: Optional[int] = None,
+                 max_ticks: int = 100_000, screen_dims: Optional[Tuple[int, int]] = None,
+                 winning_score: Optional[int] = None):
+        """
+        Initialise a round-robin tournament between controllers, played headlessly across a process pool.
+
+        Every controller plays every other controller `matches_per_pairing` times on each side. Each match
+        is played by fresh copies of its controllers, and controllers with a `reseed(seed)` method (e.g.
+        `RandomController`) are reseeded from the match's seed, so a seeded tournament gives the same
+        results however its matches are spread across workers.
+
+        Args:
+            controllers (dict): Controller name to controller (must be picklable)
+            matches_per_pairing (int, optional): Matches per ordered pair of controllers. Defaults to 10.
+            max_workers (int, optional): Worker processes. Defaults to the number of CPUs.
+            chunk_size (int, optional): Matches sent to a worker at a time. Defaults to 1.
+            seed (int, optional): Seed used to generate each match's simulation seed.
+            max_ticks (int, optional): Ticks after which an unfinished match is abandoned. Defaults to 100,000.
+            screen_dims (tuple, optional): Playing field dimensions. Defaults to settings.screen.LOGICAL_DIMENSIONS.
+            winning_score (int, optional): Score required to win. Defaults to settings.game.WINNING_SCORE.
+
+        Raises:
+            ValueError: If fewer than two controllers are given.
+        """
+        if len(controllers) < 2:
+            raise ValueError("A tournament requires at least two controllers.")
+
+        self.controllers = controllers
+        self.matches_per_pairing = matches_per_pairing
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self.rng = random.Random(seed)
+        self.options = {"max_ticks": max_ticks, "screen_dims": screen_dims, "winning_score": winning_score}
+
+    def fixtures(self) -> List[Fixture]:
+        """Generate the round-robin fixtures, each with its own simulation seed."""
+        fixtures = []
+        for left, right in permutations(self.controllers, 2):
+            for _ in range(self.matches_per_pairing):
+                fixtures.append(Fixture(len(fixtures), left, right, self.rng.randrange(2 ** 63)))
+        return fixtures
+
+    def run(self) -> Iterator[MatchResult]:
+        """
+        Play all fixtures, yielding each result as soon as its match finishes (not in fixture order).
+
+        Yields:
+            MatchResult: Result of a finished match
+        """
+        fixtures = self.fixtures()
+        chunks = [fixtures[i:i + self.chunk_size] for i in range(0, len(fixtures), self.chunk_size)]
+
+        with ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_worker,
+                                 initargs=(self.controllers, self.options)) as executor:
+            futures = [executor.submit(_play_fixtures, chunk) for chunk in chunks]
+            for future in as_completed(futures):
+                yield from future.result()
+
+
+def standings(results) -> Dict[str, dict]:
+    """
+    Summarise match results per controller.
+
+    Args:
+        results (iterable): MatchResult objects
+
+    Returns:
+        dict: Controller name to counts of 'played', 'wins', 'losses', 'unfinished', 'points_for' and
+            'points_against', sorted by wins (descending)
+    """
+    table: Dict[str, dict] = {}
+    for result in results:
+        for name, scored, conceded in ((result.left, result.score_left, result.score_right),
+                                       (result.right, result.score_right, result.score_left)):
+            row = table.setdefault(name, {"played": 0, "wins": 0, "losses": 0, "unfinished": 0,
+                                          "points_for": 0, "points_against": 0})
+            row["played"] += 1
+            row["points_for"] += scored
+            row["points_against"] += conceded
+            if result.winner is None:
+                row["unfinished"] += 1
+            elif result.winner == name:
+                row["wins"] += 1
+            else:
+                row["losses"] += 1
+
+    return dict(sorted(table.items(), key=lambda item: item[1]["wins"], reverse=True))
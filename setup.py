@@ -8,6 +8,9 @@ setup(
         "pygame",
         "PyYaml"
     ],
+    extras_require={
+        "batch": ["numpy"],
+    },
     entry_points={
         "console_scripts": [
             "pypong=pypong.__main__:main",
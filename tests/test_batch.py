@@ -0,0 +1,35 @@
+import numpy as np
+from pypong.game.batch import ACTION_CODES, BatchSimulation
+from pypong.game.simulation import Simulation, SimulationInputs
+
+ACTIONS = {code: action for action, code in ACTION_CODES.items()}
+
+def without_ball(state) -> tuple:
+    return state.score_p1, state.score_p2, state.l_paddle_y, state.l_paddle_v_speed, state.r_paddle_y, state.r_paddle_v_speed
+
+def test_batch_matches_simulation_tick_for_tick():
+    num_matches = 200
+    batch = BatchSimulation(num_matches, (800, 600), seed=3)
+    sims = []
+    for index in range(num_matches):
+        sim = Simulation((800, 600), seed=index, swept_collisions=False, dt=1)
+        sim.set_state(batch.get_match_state(index))
+        sims.append(sim)
+
+    rng = np.random.default_rng(5)
+    in_play = np.ones(num_matches, dtype=bool)
+    for _ in range(2000):
+        left, right = rng.integers(-1, 2, size=(2, num_matches))
+        batch.step(left, right)
+        for index in np.flatnonzero(in_play):
+            state = sims[index].step(SimulationInputs(left=ACTIONS[left[index]], right=ACTIONS[right[index]]))
+            expected = batch.get_match_state(index)
+            if state.score_p1 + state.score_p2:
+                # Both serve the next point from their own random generators
+                assert without_ball(state) == without_ball(expected)
+                in_play[index] = False
+            else:
+                assert state == expected
+        if not in_play.any():
+            break
+    assert not in_play.any()
@@ -0,0 +1,30 @@
+import numpy as np
+from pypong.game.capture import SharedFrameRing
+
+def frame(index: int) -> np.ndarray:
+    return np.full((6, 8, 3), index, dtype=np.uint8)
+
+def test_read_returns_held_frames_only():
+    with SharedFrameRing.create((6, 8, 3), slots=4) as ring:
+        for index in range(10):
+            ring.write(frame(index))
+
+        latest, latest_frame = ring.latest()
+        assert latest == 9
+        assert np.array_equal(latest_frame, frame(9))
+        # The writer fills the slot of the frame `slots` behind the next one
+        assert ring.read(ring.frames_written - ring.slots) is None
+        assert np.array_equal(ring.read(ring.frames_written - ring.slots + 1), frame(7))
+        assert ring.read(ring.frames_written) is None
+
+def test_reader_attaches_by_name():
+    with SharedFrameRing.create((6, 8), slots=2) as ring:
+        assert ring.latest() == (-1, None)
+        ring.write(frame(3)[..., 0])
+        reader = SharedFrameRing.attach(ring.name)
+        try:
+            assert reader.frame_shape == (6, 8)
+            index, latest = reader.latest()
+            assert index == 0 and np.array_equal(latest, frame(3)[..., 0])
+        finally:
+            reader.close()
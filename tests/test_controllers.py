@@ -0,0 +1,49 @@
+import pytest
+from pypong.config import GameState
+from pypong.game.controllers import (DIFFICULTY_LEVELS, PADDLE_MARGIN, PADDLE_WIDTH, TrajectoryController,
+                                     predict_intercept)
+from pypong.game.simulation import Simulation, SimulationInputs
+
+def test_predict_intercept_matches_stepped_ball():
+    sim = Simulation((800, 600), seed=0)
+    target_x = 800 - PADDLE_MARGIN - PADDLE_WIDTH - 10
+    for ball_y, v_speed in [(10, 5), (300, -5), (590, 7), (123, -9)]:
+        ball = sim.ball
+        ball.rect.topleft, ball.h_speed, ball.v_speed = (100, ball_y), 3, v_speed
+        bounces = 0
+        while ball.rect.x < target_x:
+            ball.move()
+            speed = ball.v_speed
+            ball.check_sides_hit()
+            bounces += ball.v_speed != speed
+        # Predicted for where the stepped ball ended up (steps may overshoot the target)
+        predicted = predict_intercept(100, ball_y, 3, v_speed, ball.rect.x, 600)
+        # Stepped bounces are clamped to the edge, which can lose up to one step's travel each
+        assert abs(predicted - ball.rect.centery) <= 1 + abs(v_speed) * bounces
+
+def test_predict_intercept_ignores_ball_moving_away():
+    assert predict_intercept(400, 300, -3, 5, 790, 600) is None
+    assert predict_intercept(400, 300, 0, 5, 790, 600) is None
+
+def test_new_serve_with_same_speed_is_predicted_again():
+    controller = TrajectoryController("expert")
+    sim = Simulation((800, 600), seed=3)
+    sim.step(SimulationInputs(advance=True))
+    serves = predictions = 0
+    for _ in range(300):
+        # Called only while playing, as `Game` does
+        predictions_before = controller.predictions
+        controller(sim.get_state(), False)
+        serves += 1
+        predictions += controller.predictions > predictions_before
+        sim.end_point("right")
+        sim.current_state = GameState.PLAYING
+        sim.ball.h_speed = 3
+        if sim.score_p1 > 50:
+            sim.score_p1 = sim.score_p2 = 0
+    assert predictions == serves
+
+def test_unknown_difficulty_is_rejected():
+    with pytest.raises(ValueError):
+        TrajectoryController("impossible")
+    assert set(DIFFICULTY_LEVELS) == {"easy", "medium", "hard", "expert"}
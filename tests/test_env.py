@@ -0,0 +1,33 @@
+import numpy as np
+from pypong.game.env import VectorPongEnv
+
+def test_vector_env_terminates_truncates_and_resets():
+    envs = VectorPongEnv(32, frame_skip=4, max_steps=150, screen_dims=(200, 150), winning_score=2, seed=0)
+    envs.reset()
+    rng = np.random.default_rng(1)
+    returns = np.zeros(envs.num_envs)
+    lengths = np.zeros(envs.num_envs, dtype=int)
+    games_won = envs.batch.games_won_p1 - envs.batch.games_won_p2
+    terminations = truncations = 0
+    for _ in range(600):
+        obs, rewards, terminated, truncated, _ = envs.step(rng.integers(0, 3, size=envs.num_envs))
+        returns += rewards
+        lengths += 1
+        assert obs.shape == (envs.num_envs, 8)
+        assert not (terminated & truncated).any()
+
+        # A won game is over as soon as one side leads by two, and later points in the step are not rewarded
+        won = envs.batch.games_won_p1 - envs.batch.games_won_p2 - games_won
+        assert np.array_equal(np.abs(won), terminated)
+        assert np.array_equal(returns[terminated], 2 * won[terminated])
+        assert (lengths[truncated] == envs.max_steps).all()
+
+        # Finished episodes start again from 0-0
+        ended = terminated | truncated
+        assert (envs.batch.score_p1[ended] == 0).all() and (envs.batch.score_p2[ended] == 0).all()
+        assert np.array_equal(envs.steps, np.where(ended, 0, lengths))
+        returns[ended] = lengths[ended] = 0
+        games_won += won
+        terminations += terminated.sum()
+        truncations += truncated.sum()
+    assert terminations > 0 and truncations > 0
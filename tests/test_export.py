@@ -0,0 +1,42 @@
+import os
+import numpy as np
+import pytest
+from pypong.config import GameState
+from pypong.game.controllers import RandomController, tracking_controller
+from pypong.game.export import FrameExporter
+from pypong.game.recording import MatchRecorder, MatchRecording
+from pypong.game.simulation import Simulation, SimulationInputs
+
+@pytest.fixture(scope="module")
+def recording(tmp_path_factory) -> MatchRecording:
+    """Record a short match between a random and a tracking controller."""
+    path = str(tmp_path_factory.mktemp("export") / "match.pprc")
+    sim = Simulation((200, 150), winning_score=2, seed=3, swept_collisions=False)
+    left = RandomController(0.2, seed=1)
+    with MatchRecorder(path, sim):
+        while sim.current_state != GameState.GAME_OVER and sim.tick < 50_000:
+            if sim.current_state != GameState.PLAYING:
+                sim.apply_inputs(SimulationInputs(advance=True))
+                continue
+            state = sim.get_state()
+            sim.step(SimulationInputs(left(state, True), tracking_controller(state, False)))
+    assert sim.current_state == GameState.GAME_OVER
+    return MatchRecording.load(path)
+
+def test_chunked_export_matches_single_chunk(tmp_path, recording):
+    single, chunked = str(tmp_path / "single.npy"), str(tmp_path / "chunked.npy")
+    chunks = FrameExporter(recording, hold_frames=3, chunk_ticks=37, max_workers=3).plan()
+    assert len(chunks) > 3
+
+    count = FrameExporter(recording, hold_frames=3, chunk_ticks=10 ** 9, max_workers=1).export(single)
+    assert FrameExporter(recording, hold_frames=3, chunk_ticks=37, max_workers=3).export(chunked) == count
+    expected, frames = np.load(single), np.load(chunked)
+    assert frames.shape == expected.shape == (count, 150, 200, 3)
+    assert expected.any() and np.array_equal(frames, expected)
+
+def test_png_and_npy_frame_counts_agree(tmp_path, recording):
+    exporter = FrameExporter(recording, hold_frames=3, chunk_ticks=50, max_workers=2)
+    count = exporter.export(str(tmp_path / "frames.npy"))
+    assert exporter.export(str(tmp_path / "frames")) == count
+    assert len(np.load(str(tmp_path / "frames.npy"), mmap_mode="r")) == count
+    assert sorted(os.listdir(tmp_path / "frames")) == [f"frame_{i:06d}.png" for i in range(count)]
@@ -0,0 +1,38 @@
+import random
+import pygame
+import pytest
+from pypong.game.multiball import MultiballSimulation, find_overlapping_pairs
+from pypong.game.screens import PlayingScreen
+
+def brute_force_pairs(rects) -> set:
+    return {(i, j) for i in range(len(rects)) for j in range(i + 1, len(rects)) if rects[i].colliderect(rects[j])}
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("max_size", [10, 60])
+def test_find_overlapping_pairs_matches_brute_force(seed, max_size):
+    rng = random.Random(seed)
+    rects = [pygame.Rect(rng.randrange(0, 300), rng.randrange(0, 300), rng.randint(1, max_size),
+                         rng.randint(1, max_size)) for _ in range(150)]
+    pairs = find_overlapping_pairs(rects)
+    assert len(pairs) == len(set(pairs))
+    assert all(i < j for i, j in pairs)
+    assert set(pairs) == brute_force_pairs(rects)
+
+def test_rects_sharing_a_column_are_all_tested():
+    # Balls served from the net all start at the same x
+    rects = [pygame.Rect(395, y, 10, 10) for y in range(0, 200, 7)]
+    assert set(find_overlapping_pairs(rects)) == brute_force_pairs(rects)
+
+def test_touching_rects_do_not_overlap():
+    assert find_overlapping_pairs([pygame.Rect(0, 0, 24, 24), pygame.Rect(24, 0, 24, 24)]) == []
+
+def test_extra_balls_are_drawn_interpolated():
+    sim = MultiballSimulation(3, (800, 600), seed=4)
+    previous_state = sim.get_state()
+    previous = tuple(ball.rect.topleft for ball in sim.extra_balls)
+    sim.extra_balls[0].rect.x += 6
+    sim.extra_balls[1].rect.x = 5  # Served again from the other end
+    rects = PlayingScreen((800, 600))._object_rects(sim.ball, sim.l_paddle, sim.r_paddle, previous_state, 0.5,
+                                                    sim.extra_balls, previous)
+    assert rects[3].x == previous[0][0] + 3
+    assert rects[4].topleft == sim.extra_balls[1].rect.topleft
@@ -0,0 +1,52 @@
+from pypong.config import GameState
+from pypong.game.network.client import NetworkClient
+from pypong.game.network.protocol import WELCOME, MessageType, NetInput, encode_snapshot, state_to_values
+from pypong.game.simulation import Simulation, SimulationInputs
+
+TICK_RATE = 60
+
+def connected_client() -> NetworkClient:
+    client = NetworkClient(("127.0.0.1", 9))
+    client._handle_datagram(WELCOME.pack(MessageType.WELCOME, 0, 800, 600, 11, TICK_RATE))
+    return client
+
+def test_prediction_stays_close_to_a_paused_server():
+    server = Simulation((800, 600), seed=5)
+    server.step(SimulationInputs(advance=True))
+    client = connected_client()
+    try:
+        client._handle_datagram(encode_snapshot(1, state_to_values(server.get_state()), 0))
+        # The server pauses mid-point (e.g. the other player dropped) while the client keeps ticking
+        client.press(NetInput.UP)
+        for _ in range(10 * TICK_RATE):
+            client.tick()
+        client._handle_datagram(encode_snapshot(2, state_to_values(server.get_state()), 0))
+
+        assert client.simulation.current_state == GameState.PLAYING
+        assert client.simulation.tick - server.tick <= client.max_prediction_ticks < TICK_RATE
+        # The unacknowledged press is still predicted, but only over the capped window (not pinned to the top)
+        assert 0 < server.l_paddle.rect.y - client.paddle.rect.y <= 2 * client.max_prediction_ticks
+    finally:
+        client.close()
+
+def test_reconcile_replays_unacknowledged_inputs():
+    server = Simulation((800, 600), seed=5)
+    server.step(SimulationInputs(advance=True))
+    client = connected_client()
+    try:
+        client._handle_datagram(encode_snapshot(1, state_to_values(server.get_state()), 0))
+        client.press(NetInput.DOWN)
+        for _ in range(5):
+            client.tick()
+        predicted = client.paddle.rect.y
+
+        # A snapshot from before the press arrives: the press is replayed on top of it
+        client._handle_datagram(encode_snapshot(2, state_to_values(server.get_state()), 0))
+        assert client.paddle.rect.y == predicted
+        assert len(client.pending) == 1
+
+        # Once the server has applied it, it is no longer resent
+        client._handle_datagram(encode_snapshot(3, state_to_values(server.get_state()), 1))
+        assert client.pending == []
+    finally:
+        client.close()
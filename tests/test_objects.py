@@ -0,0 +1,62 @@
+import pytest
+from pypong.config import GameState
+from pypong.game.objects import Ball, Paddle
+from pypong.game.objects.ball import tick_displacement
+from pypong.game.simulation import BASE_TICK_RATE, Simulation
+
+TICK_RATES = [30, 60, 100, 120, 240, 600]
+
+def play_for(tick_rate: int, swept: bool, seconds: float = 1 / 6) -> Simulation:
+    """Play a simulation with the ball and paddles at known positions and speeds for some game time."""
+    sim = Simulation((800, 600), seed=1, dt=BASE_TICK_RATE / tick_rate, swept_collisions=swept)
+    sim.current_state = GameState.PLAYING
+    sim.ball.rect.topleft = (400, 300)
+    sim.ball.h_speed, sim.ball.v_speed = 3, 5
+    sim.l_paddle.v_speed = 2
+    sim.r_paddle.v_speed = -4
+    for _ in range(round(seconds * tick_rate)):
+        sim.step()
+    return sim
+
+@pytest.mark.parametrize("swept", [False, True])
+@pytest.mark.parametrize("tick_rate", [30, 60, 120, 240, 600])
+def test_distance_travelled_does_not_depend_on_tick_rate(tick_rate, swept):
+    sim = play_for(tick_rate, swept)
+    # 10 base ticks: the ball moves (30, 50) and the paddles 20 up and 40 down
+    assert sim.ball.rect.topleft == (430, 350)
+    start = Paddle(screen_size=(800, 600)).rect.top
+    assert sim.l_paddle.rect.top == start - 20
+    assert sim.r_paddle.rect.top == start + 40
+
+@pytest.mark.parametrize("tick_rate", TICK_RATES)
+def test_tick_rate_changes_resolution_not_path(tick_rate):
+    base = play_for(60, False, seconds=1.0)
+    sim = play_for(tick_rate, False, seconds=1.0)
+    assert abs(sim.ball.rect.x - base.ball.rect.x) <= 1
+    assert abs(sim.ball.rect.y - base.ball.rect.y) <= 1
+
+def test_tick_displacement_never_drifts():
+    moved = sum(tick_displacement(3, 0.1, tick) for tick in range(1000))
+    assert moved == 300
+    assert all(tick_displacement(5, 1.0, tick) == 5 for tick in range(100))
+
+def test_ball_bounces_off_top_edge():
+    ball = Ball(x_pos=100, y_pos=2, h_speed=3, v_speed=-5)
+    ball.move()
+    ball.check_sides_hit()
+    assert ball.rect.top == 0 and ball.v_speed == 5
+
+def test_paddle_stops_at_edge():
+    paddle = Paddle(y_pos=4, v_speed=10)
+    paddle.move()
+    assert paddle.rect.top == 0 and paddle.v_speed == 0
+
+def test_paddle_speed_is_validated():
+    with pytest.raises(ValueError):
+        Paddle().v_speed = 12
+
+def test_swept_ball_cannot_pass_through_paddle():
+    l_paddle, r_paddle = Paddle(left=True), Paddle(left=False)
+    ball = Ball(x_pos=750, y_pos=r_paddle.rect.centery, h_speed=60, v_speed=0)
+    assert ball.sweep(l_paddle, r_paddle) == 1
+    assert ball.h_speed < 0 and ball.rect.right <= r_paddle.rect.left
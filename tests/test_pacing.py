@@ -0,0 +1,37 @@
+import pytest
+from pypong.game.pacing import VSYNC_FALLBACK_FRAMES, FramePacer
+
+class FakeClock:
+    """Clock that only moves when a frame takes time (the display never waits for a refresh)."""
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+def run_frames(pacer: FramePacer, clock: FakeClock, intervals):
+    for interval in intervals:
+        clock.now += interval
+        pacer.wait(60)
+
+def test_one_short_frame_keeps_vsync_pacing():
+    clock = FakeClock()
+    pacer = FramePacer("vsync", time_source=clock)
+    # A late frame followed by one that catches up, then steady refreshes
+    run_frames(pacer, clock, [1 / 60] * 5 + [1 / 30, 1 / 200] + [1 / 60] * 20)
+    assert not pacer.vsync_fallback
+
+def test_consecutive_short_frames_fall_back_to_hybrid(monkeypatch):
+    clock = FakeClock()
+    pacer = FramePacer("vsync", time_source=clock)
+    # Waiting for the deadline would spin forever on the fake clock, so jump straight to it
+    monkeypatch.setattr(pacer, "_wait_for_deadline", lambda period: setattr(clock, "now", clock.now + period))
+    # The first frame has no interval, and each wait checks the interval that ended at the previous one
+    run_frames(pacer, clock, [0.001] * (VSYNC_FALLBACK_FRAMES + 1))
+    assert not pacer.vsync_fallback
+    run_frames(pacer, clock, [0.001])
+    assert pacer.vsync_fallback
+
+def test_invalid_strategy_is_rejected():
+    with pytest.raises(ValueError):
+        FramePacer("adaptive")
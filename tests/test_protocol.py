@@ -0,0 +1,41 @@
+from pypong.config import GameState
+from pypong.game.network.protocol import (MAX_INPUTS_PER_PACKET, InputPacketRecord, NetInput, decode_inputs,
+                                          decode_snapshot, encode_inputs, encode_snapshot, state_to_values,
+                                          values_to_state)
+from pypong.game.simulation import Simulation, SimulationInputs
+
+def test_state_values_round_trip():
+    sim = Simulation((800, 600), seed=3)
+    sim.step(SimulationInputs(advance=True))
+    for _ in range(40):
+        sim.step()
+    sim.ball.v_speed = -7
+    state = sim.get_state()
+    assert values_to_state(state_to_values(state)) == state
+
+def test_full_snapshot_round_trip():
+    values = (120, GameState.PLAYING.value, 2, 5, 0, 400, -3, -6, 7, 270, -10, 300, 4)
+    data = encode_snapshot(9, values, input_ack=4)
+    assert decode_snapshot(data, {}) == (9, 4, values)
+
+def test_delta_snapshot_sends_only_changed_fields():
+    baseline = (120, GameState.PLAYING.value, 2, 5, 0, 400, 300, 6, 3, 270, 0, 300, 4)
+    values = (121, GameState.PLAYING.value, 2, 5, 0, 406, 303, 6, 3, 270, 0, 300, 4)
+    full = encode_snapshot(10, values, 4)
+    delta = encode_snapshot(10, values, 4, baseline_sequence=9, baseline=baseline)
+    assert len(delta) == len(full) - 4 * (len(values) - 3)
+    assert decode_snapshot(delta, {9: baseline}) == (10, 4, values)
+
+def test_delta_snapshot_without_baseline_is_dropped():
+    baseline = (0,) * 13
+    data = encode_snapshot(10, (1,) * 13, 0, baseline_sequence=9, baseline=baseline)
+    assert decode_snapshot(data, {8: baseline}) is None
+
+def test_inputs_round_trip():
+    inputs = [InputPacketRecord(1, 10, NetInput.UP), InputPacketRecord(2, 12, NetInput.DOWN),
+              InputPacketRecord(3, 12, NetInput.ADVANCE)]
+    assert decode_inputs(encode_inputs(7, inputs)) == (7, inputs)
+
+def test_only_newest_inputs_are_sent():
+    inputs = [InputPacketRecord(i, i, NetInput.UP) for i in range(1, MAX_INPUTS_PER_PACKET + 11)]
+    assert decode_inputs(encode_inputs(0, inputs)) == (0, inputs[-MAX_INPUTS_PER_PACKET:])
@@ -0,0 +1,55 @@
+import pytest
+from pypong.config import GameState
+from pypong.game.controllers import RandomController, tracking_controller
+from pypong.game.recording import InputCode, MatchRecorder, MatchRecording, MatchReplay
+from pypong.game.simulation import Simulation, SimulationInputs
+
+def record_match(path, seed: int = 11, swept_collisions: bool = False) -> list:
+    """Play a short match between two controllers (as `Game` does), returning the state after every tick."""
+    sim = Simulation((800, 600), winning_score=3, seed=seed, swept_collisions=swept_collisions)
+    left, right = RandomController(0.2, seed=1), tracking_controller
+    states = []
+    with MatchRecorder(str(path), sim, flush_every=8):
+        while sim.current_state != GameState.GAME_OVER and sim.tick < 50_000:
+            if sim.current_state != GameState.PLAYING:
+                sim.apply_inputs(SimulationInputs(advance=True))
+                continue
+            state = sim.get_state()
+            states.append(sim.step(SimulationInputs(left(state, True), right(state, False))))
+    return states
+
+@pytest.mark.parametrize("swept_collisions", [False, True])
+def test_replay_reproduces_recorded_match(tmp_path, swept_collisions):
+    path = tmp_path / "match.pprc"
+    states = record_match(path, swept_collisions=swept_collisions)
+    assert states[-1].current_state == GameState.GAME_OVER
+
+    recording = MatchRecording.load(str(path))
+    assert (recording.seed, recording.screen_dims, recording.winning_score) == (11, (800, 600), 3)
+    assert recording.swept_collisions == swept_collisions
+    assert recording.records[-1].code == InputCode.END
+
+    replayed = []
+    final = MatchReplay(recording).run(replayed.append)
+    assert replayed == states
+    assert final == states[-1]
+
+def test_partial_trailing_record_is_ignored(tmp_path):
+    path = tmp_path / "match.pprc"
+    record_match(path)
+    complete = MatchRecording.load(str(path)).records
+    with open(path, "ab") as f:
+        f.write(b"\x01\x02")
+    assert MatchRecording.load(str(path)).records == complete
+
+def test_recording_must_start_before_stepping(tmp_path):
+    sim = Simulation((800, 600), seed=1)
+    sim.step()
+    with pytest.raises(ValueError):
+        MatchRecorder(str(tmp_path / "late.pprc"), sim)
+
+def test_load_rejects_other_files(tmp_path):
+    path = tmp_path / "not_a_recording.pprc"
+    path.write_bytes(b"x" * 64)
+    with pytest.raises(ValueError):
+        MatchRecording.load(str(path))
@@ -0,0 +1,70 @@
+import pytest
+from pypong.game.results import INITIAL_RATING, K_FACTOR, GameResult, ResultsStore, expected_score
+
+def result(left: str, right: str, winner, score_left: int, score_right: int, hits: int = 4) -> GameResult:
+    return GameResult(left, right, winner, score_left, score_right, ticks=1000, hits=hits, longest_rally=2,
+                      finished_at=1.0)
+
+@pytest.fixture
+def store(tmp_path):
+    with ResultsStore(str(tmp_path / "results.db"), batch_size=100, flush_interval=60.0) as store:
+        yield store
+
+def test_results_are_buffered_until_flush(store):
+    store.add(result("a", "b", "a", 11, 5))
+    assert store.results_written == 0
+    store.flush()
+    assert (store.results_written, store.batches_written) == (1, 1)
+
+def test_totals_and_ratings_after_flush(store):
+    store.add_many([result("a", "b", "a", 11, 5), result("b", "a", "b", 11, 9), result("a", "c", "a", 11, 0),
+                    result("b", "c", None, 4, 4)])
+    store.flush()
+
+    # Ratings are updated match by match, in the order results were added
+    ratings = {"a": INITIAL_RATING, "b": INITIAL_RATING, "c": INITIAL_RATING}
+    for winner, loser in (("a", "b"), ("b", "a"), ("a", "c")):
+        change = K_FACTOR * (1.0 - expected_score(ratings[winner], ratings[loser]))
+        ratings[winner] += change
+        ratings[loser] -= change
+
+    a, b, c = (store.player(name) for name in "abc")
+    assert (a["played"], a["wins"], a["losses"], a["unfinished"]) == (3, 2, 1, 0)
+    assert (a["points_for"], a["points_against"], a["hits"]) == (31, 16, 12)
+    assert (b["played"], b["wins"], b["losses"], b["unfinished"]) == (3, 1, 1, 1)
+    assert (c["played"], c["wins"], c["losses"], c["unfinished"]) == (2, 0, 1, 1)
+    for player in (a, b, c):
+        assert player["rating"] == pytest.approx(ratings[player["name"]])
+    assert [player["name"] for player in store.leaderboard()] == ["a", "b", "c"]
+    assert store.player("d") is None
+
+def test_totals_accumulate_across_batches_and_reopening(tmp_path):
+    path = str(tmp_path / "results.db")
+    with ResultsStore(path, batch_size=2) as store:
+        store.add_many([result("a", "b", "a", 11, 5)] * 3)
+        assert store.batches_written == 1
+        rating = store.player("a")["rating"]
+    with ResultsStore(path) as store:
+        store.add(result("b", "a", "b", 11, 7))
+        assert store.match_count() == 4
+        a = store.player("a")
+        assert (a["played"], a["wins"]) == (4, 3)
+        assert a["rating"] < rating
+
+def test_invalid_settings_are_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        ResultsStore(str(tmp_path / "results.db"), batch_size=0)
+
+def test_failed_flush_keeps_batch(store, caplog):
+    store.add(result("a", "b", "a", 11, 5))
+    store._connection.execute("BEGIN EXCLUSIVE")
+    other = ResultsStore(store.path, flush_interval=60.0)
+    other._connection.execute("PRAGMA busy_timeout = 0")
+    other.add(result("c", "d", "c", 11, 3))
+    assert other.flush() is False
+    assert "Could not store 1 results" in caplog.text
+    store._connection.rollback()
+
+    assert other.flush() is True
+    assert other.player("c")["wins"] == 1
+    other.close()
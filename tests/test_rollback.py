@@ -0,0 +1,57 @@
+from array import array
+from pypong.config import GameState
+from pypong.game.rollback import RollbackSimulation, SnapshotRing
+from pypong.game.simulation import SNAPSHOT_SIZE, PaddleAction, Simulation, SimulationInputs
+
+def rally_stats(sim: Simulation) -> tuple:
+    return sim.game_start_tick, sim.hits, sim.rally_hits, sim.longest_rally
+
+def playing_simulation(seed: int = 7) -> Simulation:
+    sim = Simulation((800, 600), seed=seed)
+    sim.step(SimulationInputs(advance=True))
+    return sim
+
+def test_snapshot_round_trip_includes_rally_statistics():
+    sim = playing_simulation()
+    sim.hits, sim.rally_hits, sim.longest_rally, sim.game_start_tick = 4, 3, 2, 1
+    buffer = array("q", bytes(8 * SNAPSHOT_SIZE))
+    rng_state = sim.snapshot_into(buffer)
+    expected = (sim.get_state(), rally_stats(sim))
+
+    for _ in range(50):
+        sim.step()
+    sim.hits = sim.rally_hits = 99
+    sim.restore_from(buffer, 0, rng_state)
+    assert (sim.get_state(), rally_stats(sim)) == expected
+
+def test_rewind_restores_hit_counts():
+    sim = playing_simulation()
+    ring = SnapshotRing(1000)
+    # Keep the ball in play between two tall walls of paddle hits
+    sim.ball.rect.topleft, sim.ball.h_speed, sim.ball.v_speed = (400, 300), 6, 0
+    saved_hits = None
+    for tick in range(600):
+        ring.save(sim)
+        if tick == 8:
+            saved_hits = rally_stats(sim)
+        sim.l_paddle.rect.centery = sim.r_paddle.rect.centery = sim.ball.rect.centery
+        sim.step()
+    assert sim.hits > 0
+    ring.load(sim, 8)
+    assert rally_stats(sim) == saved_hits
+
+def test_late_input_resimulation_matches_on_time_input():
+    on_time, late = playing_simulation(), RollbackSimulation(playing_simulation(), max_rollback=8)
+    for _ in range(600):
+        tick = on_time.tick
+        press = SimulationInputs(left=PaddleAction.UP, right=PaddleAction.DOWN) if tick % 37 == 0 else None
+        on_time.step(press)
+        late.step()
+        if press is not None:
+            # Arrives after its tick was already simulated
+            late.add_input(tick, press)
+    on_time.step()
+    late.step()
+    assert late.rollbacks > 0
+    assert late.simulation.get_state() == on_time.get_state()
+    assert rally_stats(late.simulation) == rally_stats(on_time)
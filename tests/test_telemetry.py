@@ -0,0 +1,76 @@
+import json
+import os
+from pypong.config import GameState
+from pypong.game.multiball import MultiballSimulation
+from pypong.game.rollback import SnapshotRing
+from pypong.game.simulation import Simulation, SimulationInputs
+from pypong.game.telemetry import MatchTelemetry, TelemetryWriter
+
+def read_events(path) -> list:
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+def play_point(sim: Simulation, telemetry: MatchTelemetry):
+    """Play until a point ends, keeping both paddles level with the ball for a few hits."""
+    previous = sim.current_state
+    sim.apply_inputs(SimulationInputs(advance=True))
+    telemetry.state_changed(previous)
+    while sim.current_state == GameState.PLAYING:
+        if sim.hits < 3:
+            sim.l_paddle.rect.centery = sim.r_paddle.rect.centery = sim.ball.rect.centery
+        sim.step()
+
+def test_rotation_failure_keeps_writing(tmp_path, monkeypatch):
+    path = str(tmp_path / "telemetry.jsonl")
+    writer = TelemetryWriter(path, max_bytes=30, batch_size=1)
+    writer._write([{"event": "first"}])
+
+    def fail(*args):
+        raise OSError("disk full")
+    monkeypatch.setattr(os, "replace", fail)
+    writer._write([{"event": "dropped"}])
+    monkeypatch.undo()
+    # The file is still open after the failed rotation, so the next rotation succeeds
+    writer._write([{"event": "after"}])
+    writer.close()
+    assert [event["event"] for event in read_events(writer._rotated_path(1))] == ["first"]
+    assert [event["event"] for event in read_events(path)] == ["after"]
+    assert writer.rotations == 1
+
+def test_rewind_event_drops_undone_hits(tmp_path):
+    path = str(tmp_path / "telemetry.jsonl")
+    sim = Simulation((800, 600), seed=2)
+    telemetry = MatchTelemetry(TelemetryWriter(path), sim)
+    ring = SnapshotRing(10_000)
+    previous = sim.current_state
+    sim.apply_inputs(SimulationInputs(advance=True))
+    telemetry.state_changed(previous)
+    while sim.hits < 2:
+        ring.save(sim)
+        sim.l_paddle.rect.centery = sim.r_paddle.rect.centery = sim.ball.rect.centery
+        sim.step()
+    # Rewind to before the second hit
+    ticks = ring.rewind(sim, sim.tick - telemetry._hit_ticks[1])
+    telemetry.rewound(ticks)
+    assert len(telemetry._hit_speeds) == sim.rally_hits == 1
+
+    # Play the rest of the point without the second hit
+    for paddle in (sim.l_paddle, sim.r_paddle):
+        paddle.rect.top = 0 if sim.ball.rect.centery > 300 else 540
+    while sim.current_state == GameState.PLAYING:
+        sim.step()
+    telemetry.close()
+    events = {event["event"]: event for event in read_events(path)}
+    assert events["rewind"]["ticks"] == ticks
+    assert events["point"]["rally_length"] == 1
+
+def test_multiball_points_have_no_rally_statistics(tmp_path):
+    path = str(tmp_path / "telemetry.jsonl")
+    sim = MultiballSimulation(4, (800, 600), winning_score=3, seed=1)
+    telemetry = MatchTelemetry(TelemetryWriter(path), sim)
+    play_point(sim, telemetry)
+    telemetry.close()
+    events = read_events(path)
+    assert events[0]["balls"] == 4
+    points = [event for event in events if event["event"] == "point"]
+    assert points and all(set(point) == {"event", "time", "tick", "scorer", "score"} for point in points)
@@ -0,0 +1,43 @@
+import pygame
+import pytest
+from pypong.game.screens.text_cache import TextCache
+
+class FakeFont:
+    def __init__(self):
+        self.rendered = []
+
+    def render(self, text, antialias, color):
+        self.rendered.append(text)
+        return pygame.Surface((len(text), 1))
+
+def test_hits_return_the_cached_surface():
+    cache, font = TextCache(4), FakeFont()
+    surface = cache.render(font, "11", True, "white")
+    assert cache.render(font, "11", True, "white") is surface
+    # Equal colours given as a pygame.Color share an entry
+    assert cache.render(font, "11", True, pygame.Color(1, 2, 3)) is cache.render(font, "11", True, (1, 2, 3, 255))
+    cache.render(font, "11", False, "white")
+    assert font.rendered == ["11", "11", "11"]
+    assert (cache.hits, cache.misses, len(cache)) == (2, 3, 3)
+
+    cache.clear()
+    assert (cache.hits, cache.misses, len(cache)) == (0, 0, 0)
+
+def test_least_recently_used_surface_is_evicted():
+    cache, font = TextCache(3), FakeFont()
+    for text in "abc":
+        cache.render(font, text, True, "white")
+    cache.render(font, "a", True, "white")  # "b" is now the least recently used
+    cache.render(font, "d", True, "white")
+    assert len(cache) == 3
+
+    for text in "acd":
+        cache.render(font, text, True, "white")
+    assert font.rendered == ["a", "b", "c", "d"]
+    cache.render(font, "b", True, "white")
+    assert font.rendered[-1] == "b"
+    assert (cache.hits, cache.misses) == (4, 5)
+
+def test_max_size_must_be_positive():
+    with pytest.raises(ValueError):
+        TextCache(0)
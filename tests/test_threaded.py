@@ -0,0 +1,38 @@
+import threading
+import time
+import pytest
+from pypong.config import GameState
+from pypong.game.simulation import PaddleAction, Simulation, SimulationInputs
+from pypong.game.threaded import SimulationThread
+
+def test_simulation_thread_publishes_ticks_and_runs_commands():
+    sim = Simulation((800, 600), seed=1)
+    sim_thread = SimulationThread(sim, 500, sim.step)
+    assert sim_thread.snapshots.latest().sequence == 0
+    sim_thread.start()
+    try:
+        sim_thread.submit(lambda: sim.apply_inputs(SimulationInputs(advance=True))).result(timeout=1)
+        press = SimulationInputs(left=PaddleAction.UP)
+        assert sim_thread.submit(lambda: (sim.apply_inputs(press), sim.l_paddle.v_speed)[1]).result(timeout=1) == 2
+
+        sequences = []
+        deadline = time.perf_counter() + 1
+        while len(set(sequences)) < 20 and time.perf_counter() < deadline:
+            snapshot = sim_thread.snapshots.latest()
+            # A snapshot's state is the one after its last tick
+            assert snapshot.current.tick == snapshot.sequence
+            sequences.append(snapshot.sequence)
+            time.sleep(0.001)
+        assert len(set(sequences)) >= 20
+        assert sequences == sorted(sequences)
+        assert snapshot.current.current_state == GameState.PLAYING
+    finally:
+        sim_thread.stop()
+
+    # Once stopped, commands run straight away on the calling thread
+    ticks = sim_thread.ticks
+    assert sim_thread.submit(lambda: (sim.tick, threading.current_thread())).result(timeout=0) == (
+        ticks, threading.current_thread())
+    with pytest.raises(ZeroDivisionError):
+        sim_thread.submit(lambda: 1 / 0).result(timeout=0)
+    assert sim_thread.snapshots.latest().sequence == ticks
@@ -0,0 +1,50 @@
+import pytest
+from pypong.game.timestep import FixedTimestep
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+def test_advance_counts_whole_ticks_and_keeps_the_remainder():
+    clock = FakeClock()
+    timestep = FixedTimestep(64, time_source=clock)
+    assert timestep.advance() == 0  # First call only starts timing
+
+    # Times are multiples of 1/256 s, so the arithmetic is exact
+    clock.now += 2.5 / 64
+    assert timestep.advance() == 2
+    assert timestep.alpha == 0.5
+    clock.now += 0.75 / 64
+    assert timestep.advance() == 1
+    assert timestep.alpha == 0.25
+    assert timestep.advance() == 0
+    assert timestep.alpha == 0.25
+
+def test_long_frames_are_clamped_to_max_frame_time():
+    clock = FakeClock()
+    timestep = FixedTimestep(64, max_frame_time=0.25, time_source=clock)
+    timestep.advance()
+    clock.now += 10.0
+    assert timestep.advance() == 16
+    assert timestep.alpha == 0
+    # Timing carries on from the end of the long frame
+    clock.now += 1 / 64
+    assert timestep.advance() == 1
+
+def test_reset_discards_accumulated_time():
+    clock = FakeClock()
+    timestep = FixedTimestep(64, time_source=clock)
+    timestep.advance()
+    clock.now += 0.5 / 64
+    timestep.advance()
+    timestep.reset()
+    assert timestep.alpha == 0
+    clock.now += 5.0
+    assert timestep.advance() == 0
+
+def test_tick_rate_must_be_positive():
+    with pytest.raises(ValueError):
+        FixedTimestep(0)
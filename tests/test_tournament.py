@@ -0,0 +1,31 @@
+from pypong.game.controllers import RandomController, TrajectoryController, tracking_controller
+from pypong.game.simulation import Simulation
+from pypong.game.tournament import Tournament, _match_controller, standings
+
+def controllers() -> dict:
+    return {"random": RandomController(0.3), "tracker": tracking_controller,
+            "computer": TrajectoryController("easy")}
+
+def play(**options) -> list:
+    tournament = Tournament(controllers(), matches_per_pairing=2, seed=9, max_ticks=20_000, winning_score=3,
+                            **options)
+    return sorted(tournament.run())
+
+def test_results_do_not_depend_on_how_matches_are_spread_across_workers():
+    assert play(max_workers=1, chunk_size=12) == play(max_workers=2, chunk_size=1)
+
+def test_match_controllers_are_fresh_reseeded_copies():
+    state = Simulation((800, 600), seed=1).get_state()
+    original = RandomController(0.5, seed=1)
+    first = _match_controller(original, 42)
+    presses = [first(state, True) for _ in range(50)]
+    # Earlier matches (or a differently seeded original) don't change a match's presses
+    original.rng.random()
+    second = _match_controller(original, 42)
+    assert [second(state, True) for _ in range(50)] == presses
+    assert second is not original and original.rng.getstate() != second.rng.getstate()
+
+def test_standings_count_every_match():
+    results = play(max_workers=1, chunk_size=12)
+    table = standings(results)
+    assert sum(row["played"] for row in table.values()) == 2 * len(results)